@@ -321,6 +321,16 @@ WEB_REQUEST_CONFIG = {
 CACHE_CONFIG = {
     "tool_result_ttl_minutes": 60,
     "session_cache_file": "session_cache.json",
+    "session_flush_delay_seconds": 1.0,
+    "max_cached_tool_results": 128,
+    "max_cache_entry_bytes": 64 * 1024,
+    "dns_cache_ttl_seconds": 300,
+    "interface_cache_ttl_seconds": 5,
+    "gateway_cache_ttl_seconds": 30,
+    "arp_cache_ttl_seconds": 10,
+    "ixp_result_ttl_seconds": 30,
+    "ixp_result_max_stale_seconds": 5,
+    "external_ip_ttl_seconds": 300,
     "temp_file_suffix": ".tmp",
     "max_cache_size_mb": 50,
     "cleanup_interval_hours": 24
@@ -559,6 +569,16 @@ NTP_DEFAULT_VERSION = 3
 NTP_SYNC_THRESHOLD_MS = 100
 NTP_MAX_PARALLEL_CHECKS = 10
 
+# IXP Monitoring Configuration
+IXP_MAX_PARALLEL_CHECKS = 16
+# Set INSTABILITY_IXP_PREWARM=1 to open IXP connections in the background
+# as soon as the IXP module is imported. Off by default so that importing
+# the tool registry never sends traffic on its own.
+IXP_PREWARM_ON_IMPORT = os.getenv("INSTABILITY_IXP_PREWARM", "") == "1"
+
+# Local Network Scan Configuration
+SCAN_MAX_PARALLEL_PINGS = 64
+
 # Well-known NTP servers organized by category
 NTP_SERVERS = {
     "global_pool": [
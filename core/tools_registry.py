@@ -79,6 +79,83 @@ class ToolMetadata:
     examples: List[str] = field(default_factory=list)
     function_ref: Optional[Callable] = None
     risk_level: RiskLevel = field(default_factory=lambda: RiskLevel.MEDIUM)
+    # Derived from parameters once at construction and reused by every MCP tools/list call
+    required_params: List[str] = field(init=False, repr=False)
+    json_schema_params: Dict[str, Dict[str, Any]] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.required_params = [name for name, info in self.parameters.items() if info.required]
+        self.json_schema_params = {
+            name: _build_param_json_schema(name, info) for name, info in self.parameters.items()
+        }
+
+
+# Map Python type names to JSON Schema type names
+_JSON_SCHEMA_TYPES = {
+    "str": "string",
+    "int": "integer",
+    "float": "number",
+    "bool": "boolean",
+    "list": "array",
+    "dict": "object"
+}
+
+
+def _build_param_json_schema(param_name: str, param_info: ParameterInfo) -> Dict[str, Any]:
+    """
+    Build the JSON Schema fragment describing a single tool parameter.
+
+    Args:
+        param_name: Parameter name (used to infer array item types)
+        param_info: Parameter metadata
+
+    Returns:
+        JSON Schema dict for the parameter
+    """
+    json_schema_type = _JSON_SCHEMA_TYPES.get(param_info.param_type.value, "string")
+
+    param_schema = {
+        "type": json_schema_type,
+        "description": param_info.description
+    }
+
+    # Add items property for array types (required by JSON Schema spec)
+    if json_schema_type == "array":
+        lowered = param_name.lower()
+        # Determine item type based on parameter name and context
+        if param_name in ["servers", "dns_servers"] or "server" in lowered:
+            # DNS server IP addresses
+            param_schema["items"] = {"type": "string"}
+        elif param_name in ["urls", "endpoints"] or "url" in lowered:
+            # URLs
+            param_schema["items"] = {"type": "string"}
+        elif param_name in ["targets", "hosts"] or "target" in lowered:
+            # Target objects
+            param_schema["items"] = {"type": "object"}
+        elif param_name in ["tools", "commands"] or "tool" in lowered:
+            # Tool names
+            param_schema["items"] = {"type": "string"}
+        elif param_name in ["ports", "port_list"] or "port" in lowered:
+            # Port numbers
+            param_schema["items"] = {"type": "integer"}
+        else:
+            # Default to string items for unknown array types
+            param_schema["items"] = {"type": "string"}
+
+    # Add default value if provided
+    if param_info.default is not None:
+        param_schema["default"] = param_info.default
+
+    # Add constraints if provided
+    if param_info.choices:
+        param_schema["enum"] = param_info.choices
+    if param_info.min_value is not None:
+        param_schema["minimum"] = param_info.min_value
+    if param_info.max_value is not None:
+        param_schema["maximum"] = param_info.max_value
+
+    return param_schema
+
 
 class ToolRegistry:
     """
@@ -207,9 +284,13 @@ class ToolRegistry:
                 'is_valid_ip', 'get_timeout',
                 # Cache/memory utilities
                 'cache_tool_result', 'get_cached_result', 'load_session_cache', 'save_session_cache',
+                'flush_session_cache', 'invalidate_interface_cache',
                 'load_tool_inventory_cache', 'save_tool_inventory_cache',
                 # Formatting utilities
                 'format_tool_inventory_summary', 'format_targets_section', 'update_markdown_sections',
+                # Async variants of sync tools (the registry calls tools synchronously)
+                'async_check_interface_status', 'async_get_local_ip', 'async_get_system_info',
+                'async_get_gateway_info', 'run_all_layer2',
                 # Test functions
                 'test_layer2_diagnostics', 'test_layer3_diagnostics', 'test_tool_detector', 'test_memory_manager',
                 # Standard library functions
@@ -221,7 +302,7 @@ class ToolRegistry:
                 # Memory management functions that are too low-level for direct use
                 'create_default_network_state', 'create_default_target_scope', 'create_empty_session_cache',
                 'get_memory_dir', 'initialize_memory_files', 'read_network_state', 'read_target_scope',
-                'update_network_state', 'update_target_scope',
+                'update_network_state', 'update_target_scope', 'batch_updates',
                 # Low-level utilities that should be wrapped by higher-level tools
                 'get_hostname_for_ip', 'detect_local_network',
                 # Internal memory/historical query functions (exposed via chat tool)
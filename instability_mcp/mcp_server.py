@@ -6,13 +6,18 @@ the existing v3 architecture and tool registry.
 """
 
 import asyncio
+import contextvars
+import io
+import json
 import logging
 import sys
+import threading
 import time
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 
 try:
     from mcp import server, types
@@ -20,6 +25,13 @@ try:
 except ImportError:
     raise ImportError("MCP package not installed. Install with: pip install mcp")
 
+# Optional faster JSON encoder for tool result payloads
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from instability_mcp.session_manager import SessionManager
 from instability_mcp.auth import setup_mcp_auth, create_auth_error_response, MCPAuthError
 from core.tools_registry import get_tool_registry
@@ -27,6 +39,52 @@ from core.startup_checks import run_startup_sequence
 from config import MCP_RATE_LIMIT_REQUESTS, MCP_RATE_LIMIT_WINDOW, MCP_AUDIT_LOG_FILE
 
 
+# ---------------------------------------------------------------------------
+# Static MCP tools (schemas never change, so build them once at import)
+# ---------------------------------------------------------------------------
+
+_CHAT_TOOL = types.Tool(
+    name="chat",
+    description="Send a message to the Instability pentesting assistant",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "prompt": {
+                "type": "string",
+                "description": "User message to process"
+            },
+            "session_id": {
+                "type": "string",
+                "description": "Optional session ID for conversation continuity"
+            },
+            "include_thinking": {
+                "type": "boolean",
+                "description": "Include LLM reasoning in response",
+                "default": True
+            }
+        },
+        "required": ["prompt"]
+    }
+)
+
+_START_SESSION_TOOL = types.Tool(
+    name="start_session",
+    description="Initialize a new chatbot session",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "run_startup": {
+                "type": "boolean",
+                "description": "Run startup sequence",
+                "default": True
+            }
+        }
+    }
+)
+
+_STATIC_TOOLS = (_CHAT_TOOL, _START_SESSION_TOOL)
+
+
 # ---------------------------------------------------------------------------
 # Rate limiting (T5 hardening)
 # ---------------------------------------------------------------------------
@@ -103,6 +161,79 @@ def _audit_log(session_id: str, tool_name: str, result_status: str) -> None:
     )
 
 
+def _dumps_json(data: Any) -> str:
+    """
+    Serialize tool result data as indented, ASCII-only JSON.
+
+    Uses orjson when installed and falls back to the stdlib encoder when it is
+    missing or when the output contains non-ASCII characters (orjson has no
+    ensure_ascii equivalent).
+
+    Raises:
+        TypeError: If the data is not JSON serializable
+        ValueError: If the data contains circular references
+    """
+    if ORJSON_AVAILABLE:
+        data_str = orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode()
+        if data_str.isascii():
+            return data_str
+    return json.dumps(data, ensure_ascii=True, indent=2)
+
+
+# ---------------------------------------------------------------------------
+# Per-call output capture for tools running in the worker pool
+# ---------------------------------------------------------------------------
+
+_capture_buffers: contextvars.ContextVar[Optional[Tuple[io.StringIO, io.StringIO]]] = (
+    contextvars.ContextVar("_capture_buffers", default=None)
+)
+_capture_install_lock = threading.Lock()
+
+
+class _ContextRoutedStream:
+    """
+    Stand-in for sys.stdout/sys.stderr that sends writes to the capture
+    buffers of the running tool call.
+
+    contextlib.redirect_stdout swaps a process-wide attribute, so two tools
+    running concurrently in worker threads would restore each other's
+    buffers. The buffers live in a context variable instead, so each tool's
+    output stays isolated. Writes made outside any tool call, including from
+    helper threads a tool starts without copying its context, go to the
+    real stderr: the real stdout carries the MCP JSON protocol.
+    """
+
+    def __init__(self, name: str, default):
+        self._name = name
+        self._default = default
+
+    def _target(self):
+        buffers = _capture_buffers.get()
+        if buffers is not None:
+            return buffers[0] if self._name == "stdout" else buffers[1]
+        return sys.__stderr__ if self._name == "stdout" else self._default
+
+    def write(self, text: str) -> int:
+        return self._target().write(text)
+
+    def flush(self) -> None:
+        self._target().flush()
+
+    def __getattr__(self, attr: str):
+        return getattr(self._default, attr)
+
+
+def _install_context_routed_streams() -> None:
+    """Wrap sys.stdout and sys.stderr once so tool calls can capture output."""
+    with _capture_install_lock:
+        if not isinstance(sys.stdout, _ContextRoutedStream):
+            sys.stdout = _ContextRoutedStream("stdout", sys.stdout)
+        if not isinstance(sys.stderr, _ContextRoutedStream):
+            sys.stderr = _ContextRoutedStream("stderr", sys.stderr)
+
+
 class InstabilityChatbotMCPServer(Server):
     """MCP server exposing Instability chatbot functionality"""
     
@@ -112,6 +243,11 @@ class InstabilityChatbotMCPServer(Server):
         self.tool_registry = get_tool_registry()
         self.startup_context = None
         self._logger = logging.getLogger(__name__)
+
+        # Tools block on subprocesses (nmap etc.) - run them off the event loop
+        self._tool_executor = ThreadPoolExecutor(
+            max_workers=max_sessions, thread_name_prefix="mcp-tool"
+        )
         
         # Initialize authentication
         self.authenticator = setup_mcp_auth()
@@ -120,21 +256,18 @@ class InstabilityChatbotMCPServer(Server):
         self._register_handlers()
     
     def _register_handlers(self):
-        """Register MCP request handlers"""
-        
-        # Register tools/list handler
-        async def handle_list_tools(request: types.ListToolsRequest) -> types.ListToolsResult:
-            return await self.list_tools()
-        
-        # Register tools/call handler  
-        async def handle_call_tool(request: types.CallToolRequest) -> types.CallToolResult:
-            content = await self.call_tool(request.params.name, request.params.arguments or {})
-            return types.CallToolResult(content=content)
-        
-        # Add handlers to the registry
-        self.request_handlers[types.ListToolsRequest] = handle_list_tools
-        self.request_handlers[types.CallToolRequest] = handle_call_tool
-    
+        """Register MCP request handlers as bound methods"""
+        self.request_handlers[types.ListToolsRequest] = self._handle_list_tools
+        self.request_handlers[types.CallToolRequest] = self._handle_call_tool
+
+    async def _handle_list_tools(self, request: types.ListToolsRequest) -> types.ListToolsResult:
+        """Handle tools/list requests"""
+        return await self.list_tools()
+
+    async def _handle_call_tool(self, request: types.CallToolRequest) -> types.CallToolResult:
+        """Handle tools/call requests"""
+        content = await self.call_tool(request.params.name, request.params.arguments or {})
+        return types.CallToolResult(content=content)
         
     async def list_tools(self) -> types.ListToolsResult:
         """List available tools"""
@@ -144,115 +277,20 @@ class InstabilityChatbotMCPServer(Server):
             # Convert to MCP tool format
             mcp_tools = []
             for name, metadata in tools.items():
-                # Convert parameters to MCP format with proper JSON Schema types
-                parameters = {}
-                for param_name, param_info in metadata.parameters.items():
-                    # Map Python type names to JSON Schema type names
-                    type_mapping = {
-                        "str": "string",
-                        "int": "integer", 
-                        "float": "number",
-                        "bool": "boolean",
-                        "list": "array",
-                        "dict": "object"
-                    }
-                    
-                    json_schema_type = type_mapping.get(param_info.param_type.value, "string")
-                    
-                    param_schema = {
-                        "type": json_schema_type,
-                        "description": param_info.description
-                    }
-                    
-                    # Add items property for array types (required by JSON Schema spec)
-                    if json_schema_type == "array":
-                        # Determine item type based on parameter name and context
-                        if param_name in ["servers", "dns_servers"] or "server" in param_name.lower():
-                            # DNS server IP addresses
-                            param_schema["items"] = {"type": "string"}
-                        elif param_name in ["urls", "endpoints"] or "url" in param_name.lower():
-                            # URLs
-                            param_schema["items"] = {"type": "string"}
-                        elif param_name in ["targets", "hosts"] or "target" in param_name.lower():
-                            # Target objects
-                            param_schema["items"] = {"type": "object"}
-                        elif param_name in ["tools", "commands"] or "tool" in param_name.lower():
-                            # Tool names
-                            param_schema["items"] = {"type": "string"}
-                        elif param_name in ["ports", "port_list"] or "port" in param_name.lower():
-                            # Port numbers
-                            param_schema["items"] = {"type": "integer"}
-                        else:
-                            # Default to string items for unknown array types
-                            param_schema["items"] = {"type": "string"}
-                    
-                    # Add default value if provided
-                    if param_info.default is not None:
-                        param_schema["default"] = param_info.default
-                    
-                    # Add constraints if provided  
-                    if param_info.choices:
-                        param_schema["enum"] = param_info.choices
-                    if param_info.min_value is not None:
-                        param_schema["minimum"] = param_info.min_value
-                    if param_info.max_value is not None:
-                        param_schema["maximum"] = param_info.max_value
-                    
-                    parameters[param_name] = param_schema
-                
+                # Parameter schemas are prebuilt on ToolMetadata at registration
                 mcp_tool = types.Tool(
                     name=name,
                     description=metadata.description,
                     inputSchema={
                         "type": "object",
-                        "properties": parameters,
-                        "required": [p for p, info in metadata.parameters.items() if info.required]
+                        "properties": metadata.json_schema_params,
+                        "required": metadata.required_params
                     }
                 )
                 mcp_tools.append(mcp_tool)
             
-            # Add chat tool
-            chat_tool = types.Tool(
-                name="chat",
-                description="Send a message to the Instability pentesting assistant",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "prompt": {
-                            "type": "string",
-                            "description": "User message to process"
-                        },
-                        "session_id": {
-                            "type": "string",
-                            "description": "Optional session ID for conversation continuity"
-                        },
-                        "include_thinking": {
-                            "type": "boolean",
-                            "description": "Include LLM reasoning in response",
-                            "default": True
-                        }
-                    },
-                    "required": ["prompt"]
-                }
-            )
-            mcp_tools.append(chat_tool)
-            
-            # Add session management tools
-            start_session_tool = types.Tool(
-                name="start_session",
-                description="Initialize a new chatbot session",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "run_startup": {
-                            "type": "boolean",
-                            "description": "Run startup sequence",
-                            "default": True
-                        }
-                    }
-                }
-            )
-            mcp_tools.append(start_session_tool)
+            # Add chat and session management tools
+            mcp_tools.extend(_STATIC_TOOLS)
             
             return types.ListToolsResult(tools=mcp_tools)
             
@@ -350,26 +388,15 @@ class InstabilityChatbotMCPServer(Server):
     async def _handle_tool_execution(self, tool_name: str, arguments: Dict[str, Any]) -> List[types.TextContent]:
         """Handle direct tool execution"""
         try:
-            # Suppress stdout during tool execution to prevent MCP JSON protocol interference
-            import contextlib
-            import io
-            
-            # Capture stdout during tool execution to prevent MCP JSON protocol interference
-            stdout_capture = io.StringIO()
-            stderr_capture = io.StringIO()
-            
-            with contextlib.redirect_stdout(stdout_capture), \
-                 contextlib.redirect_stderr(stderr_capture):
-                # Force silent=True for MCP executions to prevent stdout interference
-                arguments = arguments.copy()
-                arguments["silent"] = True
-                
-                # Execute tool using registry
-                result = self.tool_registry.execute_tool(tool_name, arguments, mode="chatbot")
-                
-            # Capture any stdout/stderr that might contain useful debug info
-            captured_stdout = stdout_capture.getvalue()
-            captured_stderr = stderr_capture.getvalue()
+            _install_context_routed_streams()
+
+            # Execute in the worker pool so a slow tool does not stall other sessions.
+            # A fresh context copy keeps the capture buffers scoped to this call
+            loop = asyncio.get_running_loop()
+            context = contextvars.copy_context()
+            result, captured_stdout, captured_stderr = await loop.run_in_executor(
+                self._tool_executor, context.run, self._execute_tool_captured, tool_name, arguments
+            )
             
             # If the result indicates failure but has no error details, include captured output
             if isinstance(result, dict) and not result.get("success"):
@@ -391,11 +418,10 @@ class InstabilityChatbotMCPServer(Server):
                         sanitized_output = self._sanitize_text_content(result['raw_output'])
                         result_text += f"**Output-**\n```\n{sanitized_output}\n```"
                     elif "parsed_data" in result:
-                        import json
                         try:
                             # Sanitize parsed_data to prevent Claude desktop UI crashes
                             sanitized_data = self._sanitize_response_data(result['parsed_data'])
-                            data_str = json.dumps(sanitized_data, ensure_ascii=True, indent=2)
+                            data_str = _dumps_json(sanitized_data)
                             result_text += f"**Data-**\n```json\n{data_str}\n```"
                         except (TypeError, ValueError):
                             # Fallback to string representation if JSON serialization fails
@@ -445,6 +471,31 @@ class InstabilityChatbotMCPServer(Server):
         except Exception as e:
             return [types.TextContent(type="text", text=f"Tool execution error - {str(e)}")]
     
+    def _execute_tool_captured(self, tool_name: str, arguments: Dict[str, Any]) -> Tuple[Any, str, str]:
+        """
+        Run a registry tool in a worker thread with its stdout/stderr captured.
+
+        Captured output must never reach the real stdout, since that stream
+        carries the MCP JSON protocol.
+
+        Returns:
+            Tuple of (tool result, captured stdout, captured stderr)
+        """
+        stdout_capture = io.StringIO()
+        stderr_capture = io.StringIO()
+        token = _capture_buffers.set((stdout_capture, stderr_capture))
+        try:
+            # Force silent=True for MCP executions to prevent stdout interference.
+            # Build a new dict only when needed so the caller's arguments stay untouched.
+            if arguments.get("silent") is not True:
+                arguments = {**arguments, "silent": True}
+
+            result = self.tool_registry.execute_tool(tool_name, arguments, mode="chatbot")
+        finally:
+            _capture_buffers.reset(token)
+
+        return result, stdout_capture.getvalue(), stderr_capture.getvalue()
+
     def _sanitize_response_data(self, data: Any) -> Any:
         """Sanitize response data to prevent Claude desktop UI crashes"""
         if isinstance(data, dict):
@@ -5,7 +5,7 @@ Handles multiple concurrent chatbot sessions with proper isolation
 and leverages existing chatbot functionality.
 """
 
-import uuid
+import secrets
 import asyncio
 from datetime import datetime
 from typing import Dict, Optional, Any
@@ -44,15 +44,14 @@ class ChatbotSession:
     async def process_message(self, prompt: str, include_thinking: bool = True, timeout: float = 30.0) -> ChatbotResponse:
         """Process a message through the chatbot"""
         self.last_activity = datetime.now()
-        
-        # Add to conversation history
-        self.conversation_history.append({
+        user_message = {
             "role": "user",
             "content": prompt,
-            "timestamp": datetime.now().isoformat()
-        })
+            "timestamp": self.last_activity.isoformat()
+        }
         
-        # Process through existing chatbot
+        # Process through existing chatbot. The adapter appends the current
+        # prompt itself, so history is only extended once the turn succeeds.
         try:
             response_data = await self.chatbot_adapter.process_message_async(
                 prompt, 
@@ -67,17 +66,20 @@ class ChatbotSession:
                 tools_used=response_data.get("tools_executed", [])
             )
             
-            # Add response to conversation history
-            self.conversation_history.append({
-                "role": "assistant",
-                "content": response.content,
-                "timestamp": response.timestamp
-            })
+            if "error" not in response_data:
+                self.conversation_history.extend((
+                    user_message,
+                    {
+                        "role": "assistant",
+                        "content": response.content,
+                        "timestamp": response.timestamp
+                    }
+                ))
             
-            # Trim conversation history if too long
-            max_history = 20
-            if len(self.conversation_history) > max_history:
-                self.conversation_history = self.conversation_history[-max_history:]
+                # Trim conversation history in place if too long
+                max_history = 20
+                if len(self.conversation_history) > max_history:
+                    del self.conversation_history[:-max_history]
             
             return response
             
@@ -147,7 +149,7 @@ class SessionManager:
             )
             del self.sessions[oldest_session_id]
             
-        session_id = str(uuid.uuid4())
+        session_id = secrets.token_hex(16)
         session = ChatbotSession(session_id)
         self.sessions[session_id] = session
         return session
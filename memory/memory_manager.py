@@ -6,43 +6,279 @@ Provides functions for reading, writing, and updating network_state.md
 and target_scope.md files.
 """
 
+import atexit
+import contextlib
+import copy
 import os
 import re
 import json
-from datetime import datetime
-from typing import Dict, Any, List, Optional
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional, Tuple, Callable, Iterator
 from pathlib import Path
 
-# Import colorama for terminal colors
-from colorama import Fore, Style
+# Optional faster JSON encoder/decoder for the session cache
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Import configuration
 from config import (
     MEMORY_DIR, NETWORK_STATE_FILE, TARGET_SCOPE_FILE, SESSION_CACHE_FILE,
-    DEFAULT_TARGET_SCOPE, get_memory_dir
+    DEFAULT_TARGET_SCOPE, CACHE_CONFIG, get_memory_dir
 )
 
+# Line prefixes recognised when parsing the memory markdown files
+_OS_PREFIX = "**Operating System:** "
+_HOSTNAME_PREFIX = "**Hostname:** "
+_EXTERNAL_IP_PREFIX = "**External IP:** "
+_SCOPE_TYPE_PREFIX = "*Scope type: "
+_ENGAGEMENT_NAME_PREFIX = "**Engagement Name:** "
+
+# Precompiled patterns for updating the memory markdown files
+_RE_LAST_UPDATED = re.compile(r'\*Last updated:.*?\*')
+_RE_SUB_OS = re.compile(r'(\*\*Operating System:\*\*) .+')
+_RE_SUB_HOSTNAME = re.compile(r'(\*\*Hostname:\*\*) .+')
+_RE_SUB_EXTERNAL_IP = re.compile(r'(\*\*External IP:\*\*) .+')
+_RE_SUB_SCOPE_TYPE = re.compile(r'^\*Scope type: .*\*$', re.MULTILINE)
+_RE_SUB_ENGAGEMENT_NAME = re.compile(r'^\*\*Engagement Name:\*\* .*$', re.MULTILINE)
+_RE_SUB_TARGETS = re.compile(r'(^#### Specific Targets\n)(.*?)(?=^#|\Z)', re.MULTILINE | re.DOTALL)
+
+# Layout of a fresh session cache
+_EMPTY_SESSION_CACHE: Dict[str, Any] = {
+    "session_id": None,
+    "start_time": None,
+    "last_activity": None,
+    "conversation_turns": 0,
+    "current_targets": [],
+    "recent_tool_results": {},
+    "user_preferences": {},
+    "pending_actions": []
+}
+
+# In-memory session cache, loaded once and written back to disk lazily
+_session_cache: Optional[Dict[str, Any]] = None
+_session_cache_dirty = False
+_session_flush_timer: Optional[threading.Timer] = None
+_session_cache_lock = threading.RLock()
+
+# Expired tool results noticed on read, removed on the next real cache write
+_pending_evictions: set = set()
+
+# Updates collected inside a batch_updates() block, None when not batching
+_pending_network_updates: Optional[Dict[str, Any]] = None
+_pending_scope_updates: Optional[Dict[str, Any]] = None
+
+# Parsed memory files keyed by path: {path: (st_mtime_ns, st_size, parsed_data)}
+_parse_cache: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+
+
+def _now_stamp(now: Optional[datetime] = None) -> str:
+    """
+    Format a timestamp as "YYYY-MM-DD HH:MM:SS" for the memory files.
+    
+    isoformat() produces this layout without parsing a strftime format string.
+    
+    Args:
+        now: Time to format (defaults to the current local time)
+    """
+    return (now or datetime.now()).isoformat(sep=' ', timespec='seconds')
+
+
+def _color_err(message: Any) -> str:
+    """
+    Wrap a message in red for terminal output.
+    
+    colorama is only imported when a warning is actually printed, so the
+    common no-error path does not pay for it at import time.
+    """
+    from colorama import Fore, Style
+    return f"{Fore.RED}{message}{Style.RESET_ALL}"
+
+
+def _state_sidecar_path(path: Path) -> Path:
+    """Return the JSON sidecar path holding the parsed form of a markdown memory file."""
+    return Path(path).with_suffix(".json")
+
+
+def _load_state_sidecar(path: Path, st: os.stat_result) -> Optional[Dict[str, Any]]:
+    """
+    Load parsed state from a markdown file's JSON sidecar.
+    
+    Args:
+        path: Markdown memory file
+        st: Current stat result for the markdown file
+    
+    Returns:
+        Parsed data if the sidecar was written for this exact version of the
+        markdown file (same mtime and size), None otherwise
+    """
+    try:
+        with open(_state_sidecar_path(path), 'r') as f:
+            sidecar = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    if (sidecar.get("source_mtime_ns") == st.st_mtime_ns
+            and sidecar.get("source_size") == st.st_size):
+        return sidecar.get("data")
+    return None
+
+
+def _store_parsed_state(path: Path, parsed_data: Dict[str, Any]) -> None:
+    """
+    Record the parsed form of a markdown memory file in memory and in its
+    JSON sidecar, tagged with the markdown file's current mtime and size.
+    
+    The markdown stays authoritative (users edit it by hand); the sidecar only
+    lets a new process skip re-parsing an unchanged file.
+    
+    Args:
+        path: Markdown memory file that parsed_data was produced from
+        parsed_data: Parsed representation of the file
+    """
+    st = os.stat(path)
+    _parse_cache[str(path)] = (st.st_mtime_ns, st.st_size, parsed_data)
+    
+    sidecar = {
+        "source_mtime_ns": st.st_mtime_ns,
+        "source_size": st.st_size,
+        "data": parsed_data
+    }
+    try:
+        _atomic_write(_state_sidecar_path(path), json.dumps(sidecar, indent=2).encode())
+    except OSError:
+        pass  # Sidecar is only an optimisation - the markdown file is authoritative
+
+
+def _read_parsed_markdown(path: Path, parser: Callable[[str], Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Read and parse a markdown memory file, reusing an earlier parse when the
+    file's mtime and size are unchanged.
+    
+    The in-process cache is checked first, then the JSON sidecar left by a
+    previous process; the markdown is only parsed when both are stale.
+
+    Args:
+        path: Memory file to read
+        parser: Function that parses the markdown content into a dict
+
+    Returns:
+        Copy of the parsed data (callers may mutate it freely)
+
+    Raises:
+        OSError: If the file cannot be stat'ed or read
+    """
+    key = str(path)
+    st = os.stat(path)
+    cached = _parse_cache.get(key)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return copy.deepcopy(cached[2])
+
+    parsed_data = _load_state_sidecar(path, st)
+    if parsed_data is not None:
+        _parse_cache[key] = (st.st_mtime_ns, st.st_size, parsed_data)
+        return copy.deepcopy(parsed_data)
+
+    with open(path, 'r') as f:
+        content = f.read()
+
+    parsed_data = parser(content)
+    _store_parsed_state(path, parsed_data)
+    return copy.deepcopy(parsed_data)
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """
+    Durably replace a file's contents.
+    
+    Writes to a temp file, fsyncs it, renames it over the target and then
+    fsyncs the parent directory so the rename itself survives a crash.
+    Without the fsyncs, filesystems with delayed allocation (e.g. ext4) can
+    commit the rename before the data and leave an empty file behind.
+    
+    Args:
+        path: File to replace
+        data: Complete new file contents
+    
+    Raises:
+        OSError: If the file cannot be written or renamed
+    """
+    temp_file = f"{path}.tmp"
+    with open(temp_file, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    
+    os.replace(temp_file, path)
+    
+    # Directories cannot be opened for fsync on Windows
+    if hasattr(os, "O_DIRECTORY"):
+        dir_fd = os.open(os.path.dirname(path) or ".", os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+def _dumps_session_cache(cache: Dict[str, Any]) -> bytes:
+    """
+    Serialize session cache data to indented JSON bytes.
+
+    Uses orjson when installed, otherwise the stdlib encoder. Values that
+    are not JSON-native are converted with str() in both cases.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            cache, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        )
+    return json.dumps(cache, indent=2, default=str).encode()
+
+
+def _loads_session_cache(raw: bytes) -> Dict[str, Any]:
+    """
+    Parse session cache JSON bytes.
+
+    Raises:
+        ValueError: If the data is not valid JSON
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 def initialize_memory_files() -> None:
     """Create default memory files if they don't exist."""
     # Ensure memory directory exists
-    get_memory_dir()
+    memory_dir = get_memory_dir()
+    
+    # One directory listing instead of a stat per file
+    with os.scandir(memory_dir) as entries:
+        existing = {entry.name for entry in entries}
     
     # Create network_state.md if it doesn't exist
-    if not os.path.exists(NETWORK_STATE_FILE):
+    if os.path.basename(NETWORK_STATE_FILE) not in existing:
         create_default_network_state()
     
     # Create target_scope.md if it doesn't exist
-    if not os.path.exists(TARGET_SCOPE_FILE):
+    if os.path.basename(TARGET_SCOPE_FILE) not in existing:
         create_default_target_scope()
     
     # Initialize session cache
-    if not os.path.exists(SESSION_CACHE_FILE):
+    if os.path.basename(SESSION_CACHE_FILE) not in existing:
         create_empty_session_cache()
 
 
-def create_default_network_state() -> None:
-    """Create a default network_state.md file."""
+def create_default_network_state() -> str:
+    """
+    Create a default network_state.md file.
+    
+    Returns:
+        The default content that was written
+    """
+    now = datetime.now()
     default_content = """# Network Environment State
 
 *Last updated: {timestamp}*
@@ -93,16 +329,24 @@ def create_default_network_state() -> None:
 ### Network Changes
 *No network changes recorded yet*
 """.format(
-        timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        session_id=datetime.now().strftime("%Y-%m-%d_%H%M%S")
+        timestamp=_now_stamp(now),
+        session_id=now.strftime("%Y-%m-%d_%H%M%S")
     )
     
     with open(NETWORK_STATE_FILE, 'w') as f:
         f.write(default_content)
+    
+    return default_content
 
 
-def create_default_target_scope() -> None:
-    """Create a default target_scope.md file."""
+def create_default_target_scope() -> str:
+    """
+    Create a default target_scope.md file.
+    
+    Returns:
+        The default content that was written
+    """
+    now = datetime.now()
     default_content = """# Pentesting Target Scope
 
 *Last updated: {timestamp}*
@@ -188,30 +432,27 @@ Add any additional notes about the engagement, special considerations, or observ
 ---
 *This scope document should be reviewed and updated before each testing session.*
 """.format(
-        timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        timestamp=_now_stamp(now),
         default_scope=DEFAULT_TARGET_SCOPE,
-        date=datetime.now().strftime("%Y-%m-%d")
+        date=now.date().isoformat()
     )
     
     with open(TARGET_SCOPE_FILE, 'w') as f:
         f.write(default_content)
+    
+    return default_content
 
 
-def create_empty_session_cache() -> None:
-    """Create an empty session cache file."""
-    empty_cache = {
-        "session_id": None,
-        "start_time": None,
-        "last_activity": None,
-        "conversation_turns": 0,
-        "current_targets": [],
-        "recent_tool_results": {},
-        "user_preferences": {},
-        "pending_actions": []
-    }
+def create_empty_session_cache() -> Dict[str, Any]:
+    """
+    Create an empty session cache file.
     
-    with open(SESSION_CACHE_FILE, 'w') as f:
-        json.dump(empty_cache, f, indent=2)
+    Returns:
+        The empty cache dict that was written
+    """
+    empty_cache = copy.deepcopy(_EMPTY_SESSION_CACHE)
+    _atomic_write(SESSION_CACHE_FILE, _dumps_session_cache(empty_cache))
+    return empty_cache
 
 
 def read_network_state() -> Dict[str, Any]:
@@ -225,55 +466,124 @@ def read_network_state() -> Dict[str, Any]:
         create_default_network_state()
     
     try:
-        with open(NETWORK_STATE_FILE, 'r') as f:
-            content = f.read()
-        
-        # Parse the markdown content
-        parsed_data = parse_network_state_markdown(content)
-        return parsed_data
+        return _read_parsed_markdown(NETWORK_STATE_FILE, parse_network_state_markdown)
     
     except Exception as e:
-        print(f"Warning: Failed to read network state file: {Fore.RED}{e}{Style.RESET_ALL}")
+        print(f"Warning: Failed to read network state file: {_color_err(e)}")
         return {}
 
 
+def _update_markdown_file(
+    path: Path,
+    updates: Dict[str, Any],
+    default_factory: Callable[[], str],
+    parser: Callable[[str], Dict[str, Any]]
+) -> None:
+    """
+    Apply section updates to a markdown memory file and replace it atomically.
+    
+    The file is not rewritten when the updates leave its content unchanged.
+    
+    Args:
+        path: Markdown memory file to update
+        updates: Section updates understood by update_markdown_sections()
+        default_factory: Creates the default file and returns its content,
+            used when the file does not exist yet
+        parser: Parser for the file, used to refresh the cached parsed state
+    
+    Raises:
+        OSError: If the file cannot be read or written
+    """
+    # Read current content, falling back to the freshly written default
+    try:
+        with open(path, 'r') as f:
+            content = f.read()
+    except FileNotFoundError:
+        content = default_factory()
+    
+    # Update the content
+    updated_content = update_markdown_sections(content, updates)
+    
+    # Nothing changed (e.g. a repeated detection returned the same values) -
+    # leave the file and its Last updated stamp alone
+    if updated_content == content:
+        return
+    
+    # Update timestamp
+    timestamp_line = f"*Last updated: {_now_stamp()}*"
+    updated_content = _RE_LAST_UPDATED.sub(timestamp_line, updated_content, count=1)
+    
+    # Write updated content atomically
+    _atomic_write(path, updated_content.encode())
+    _store_parsed_state(path, parser(updated_content))
+
+
+def _merge_updates(pending: Dict[str, Any], updates: Dict[str, Any]) -> None:
+    """Merge an update dict into pending updates, combining nested dict sections."""
+    for key, value in updates.items():
+        if isinstance(value, dict) and isinstance(pending.get(key), dict):
+            pending[key].update(value)
+        else:
+            pending[key] = value.copy() if isinstance(value, dict) else value
+
+
+@contextlib.contextmanager
+def batch_updates() -> Iterator[None]:
+    """
+    Collect network state and target scope updates and write each file once.
+    
+    Inside the block, update_network_state() and update_target_scope() only
+    record their changes. When the block exits the merged changes are applied
+    in a single read-modify-write per file. Nested blocks join the outer batch.
+    
+    Example:
+        with batch_updates():
+            update_network_state({"system_info": {"os": "Linux"}})
+            update_network_state({"external_ip": "203.0.113.5"})
+    """
+    global _pending_network_updates, _pending_scope_updates
+    
+    if _pending_network_updates is not None:
+        yield
+        return
+    
+    _pending_network_updates = {}
+    _pending_scope_updates = {}
+    try:
+        yield
+    finally:
+        network_updates = _pending_network_updates
+        scope_updates = _pending_scope_updates
+        _pending_network_updates = None
+        _pending_scope_updates = None
+        
+        if network_updates:
+            update_network_state(network_updates)
+        if scope_updates:
+            update_target_scope(scope_updates)
+
+
 def update_network_state(updates: Dict[str, Any]) -> None:
     """
     Update specific sections of network_state.md file.
     
+    Inside a batch_updates() block the changes are deferred until the
+    block exits.
+    
     Args:
         updates: Dictionary containing sections to update
     """
+    if _pending_network_updates is not None:
+        _merge_updates(_pending_network_updates, updates)
+        return
+    
     try:
-        # Read current content
-        if os.path.exists(NETWORK_STATE_FILE):
-            with open(NETWORK_STATE_FILE, 'r') as f:
-                content = f.read()
-        else:
-            create_default_network_state()
-            with open(NETWORK_STATE_FILE, 'r') as f:
-                content = f.read()
-        
-        # Update the content
-        updated_content = update_markdown_sections(content, updates)
-        
-        # Update timestamp
-        timestamp_line = f"*Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*"
-        updated_content = re.sub(
-            r'\*Last updated:.*?\*',
-            timestamp_line,
-            updated_content
+        _update_markdown_file(
+            NETWORK_STATE_FILE, updates, create_default_network_state, parse_network_state_markdown
         )
-        
-        # Write updated content atomically
-        temp_file = f"{NETWORK_STATE_FILE}.tmp"
-        with open(temp_file, 'w') as f:
-            f.write(updated_content)
-        
-        os.rename(temp_file, NETWORK_STATE_FILE)
     
     except Exception as e:
-        print(f"Warning: Failed to update network state file: {Fore.RED}{e}{Style.RESET_ALL}")
+        print(f"Warning: Failed to update network state file: {_color_err(e)}")
 
 
 def read_target_scope() -> Dict[str, Any]:
@@ -287,15 +597,10 @@ def read_target_scope() -> Dict[str, Any]:
         create_default_target_scope()
     
     try:
-        with open(TARGET_SCOPE_FILE, 'r') as f:
-            content = f.read()
-        
-        # Parse the markdown content
-        parsed_data = parse_target_scope_markdown(content)
-        return parsed_data
+        return _read_parsed_markdown(TARGET_SCOPE_FILE, parse_target_scope_markdown)
     
     except Exception as e:
-        print(f"Warning: Failed to read target scope file: {Fore.RED}{e}{Style.RESET_ALL}")
+        print(f"Warning: Failed to read target scope file: {_color_err(e)}")
         return {"scope_type": DEFAULT_TARGET_SCOPE, "targets": []}
 
 
@@ -303,19 +608,17 @@ def update_target_scope(scope_data: Dict[str, Any]) -> None:
     """
     Update target_scope.md with new scope information.
     
+    Inside a batch_updates() block the changes are deferred until the
+    block exits.
+    
     Args:
         scope_data: Dictionary containing new scope information
     """
+    if _pending_scope_updates is not None:
+        _merge_updates(_pending_scope_updates, scope_data)
+        return
+    
     try:
-        # Read current content
-        if os.path.exists(TARGET_SCOPE_FILE):
-            with open(TARGET_SCOPE_FILE, 'r') as f:
-                content = f.read()
-        else:
-            create_default_target_scope()
-            with open(TARGET_SCOPE_FILE, 'r') as f:
-                content = f.read()
-        
         # Update specific sections based on scope_data
         updates = {}
         
@@ -329,68 +632,120 @@ def update_target_scope(scope_data: Dict[str, Any]) -> None:
             targets_section = format_targets_section(scope_data["targets"])
             updates["targets"] = targets_section
         
-        # Update the content
-        updated_content = update_markdown_sections(content, updates)
-        
-        # Update timestamp
-        timestamp_line = f"*Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*"
-        updated_content = re.sub(
-            r'\*Last updated:.*?\*',
-            timestamp_line,
-            updated_content,
-            count=1
+        _update_markdown_file(
+            TARGET_SCOPE_FILE, updates, create_default_target_scope, parse_target_scope_markdown
         )
-        
-        # Write updated content atomically
-        temp_file = f"{TARGET_SCOPE_FILE}.tmp"
-        with open(temp_file, 'w') as f:
-            f.write(updated_content)
-        
-        os.rename(temp_file, TARGET_SCOPE_FILE)
     
     except Exception as e:
-        print(f"Warning: Failed to update target scope file: {Fore.RED}{e}{Style.RESET_ALL}")
+        print(f"Warning: Failed to update target scope file: {_color_err(e)}")
 
 
 def load_session_cache() -> Dict[str, Any]:
     """
-    Load session cache from JSON file.
+    Load the session cache.
+    
+    The cache is read from disk on first use and then kept in memory for the
+    life of the process. The returned dict is the live cache, so callers that
+    modify it should pass it back to save_session_cache().
     
     Returns:
         Dictionary containing session cache data
     """
-    if not os.path.exists(SESSION_CACHE_FILE):
-        create_empty_session_cache()
+    global _session_cache
     
-    try:
-        with open(SESSION_CACHE_FILE, 'r') as f:
-            return json.load(f)
-    except Exception as e:
-        print(f"Warning: Failed to load session cache: {Fore.RED}{e}{Style.RESET_ALL}")
-        create_empty_session_cache()
-        return load_session_cache()
+    with _session_cache_lock:
+        if _session_cache is not None:
+            return _session_cache
+        
+        try:
+            with open(SESSION_CACHE_FILE, 'rb') as f:
+                _session_cache = _loads_session_cache(f.read())
+            return _session_cache
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Warning: Failed to load session cache: {_color_err(e)}")
+        
+        # Missing or unreadable - start from an empty cache without re-reading it
+        try:
+            _session_cache = create_empty_session_cache()
+        except OSError as e:
+            print(f"Warning: Failed to reset session cache: {_color_err(e)}")
+            _session_cache = copy.deepcopy(_EMPTY_SESSION_CACHE)
+        return _session_cache
 
 
 def save_session_cache(cache: Dict[str, Any]) -> None:
     """
-    Save session cache to JSON file.
+    Save session cache data.
+    
+    The in-memory cache is updated immediately and the disk write is deferred
+    by CACHE_CONFIG["session_flush_delay_seconds"], so a burst of tool calls
+    results in a single write. Pending data is also flushed at interpreter exit.
     
     Args:
         cache: Dictionary containing session cache data
     """
-    try:
+    global _session_cache, _session_cache_dirty, _session_flush_timer
+    
+    with _session_cache_lock:
+        # Drop expired entries found by get_cached_result since the last write
+        if _pending_evictions:
+            results = cache.get("recent_tool_results", {})
+            for tool_name in _pending_evictions:
+                results.pop(tool_name, None)
+            _pending_evictions.clear()
+        
         # Update last activity timestamp
         cache["last_activity"] = datetime.now().isoformat()
+        _session_cache = cache
+        _session_cache_dirty = True
         
-        # Write to temp file first for atomic operation
-        temp_file = f"{SESSION_CACHE_FILE}.tmp"
-        with open(temp_file, 'w') as f:
-            json.dump(cache, f, indent=2, default=str)
+        if _session_flush_timer is None:
+            _session_flush_timer = threading.Timer(
+                CACHE_CONFIG["session_flush_delay_seconds"], flush_session_cache
+            )
+            _session_flush_timer.daemon = True
+            _session_flush_timer.start()
+
+
+def flush_session_cache() -> None:
+    """Write any pending session cache changes to disk."""
+    global _session_cache_dirty, _session_flush_timer
+    
+    with _session_cache_lock:
+        if _session_flush_timer is not None:
+            _session_flush_timer.cancel()
+            _session_flush_timer = None
         
-        os.rename(temp_file, SESSION_CACHE_FILE)
-    
-    except Exception as e:
-        print(f"Warning: Failed to save session cache: {Fore.RED}{e}{Style.RESET_ALL}")
+        if not _session_cache_dirty or _session_cache is None:
+            return
+        
+        try:
+            _prune_expired_results(_session_cache)
+            _atomic_write(SESSION_CACHE_FILE, _dumps_session_cache(_session_cache))
+            _session_cache_dirty = False
+        
+        except Exception as e:
+            print(f"Warning: Failed to save session cache: {_color_err(e)}")
+
+
+atexit.register(flush_session_cache)
+
+
+def _prune_expired_results(cache: Dict[str, Any]) -> None:
+    """Remove every expired entry from the cache's recent_tool_results."""
+    results = cache.get("recent_tool_results", {})
+    now = datetime.now()
+    expired = []
+    for tool_name, entry in results.items():
+        try:
+            if datetime.fromisoformat(entry["cache_until"]) <= now:
+                expired.append(tool_name)
+        except (KeyError, TypeError, ValueError):
+            expired.append(tool_name)
+    for tool_name in expired:
+        del results[tool_name]
 
 
 def cache_tool_result(tool_name: str, result: Dict[str, Any], ttl_minutes: int = 60) -> None:
@@ -403,25 +758,45 @@ def cache_tool_result(tool_name: str, result: Dict[str, Any], ttl_minutes: int =
         ttl_minutes: Time-to-live in minutes
     """
     try:
-        cache = load_session_cache()
-        
         # Calculate expiration time
-        from datetime import timedelta
-        expire_time = datetime.now() + timedelta(minutes=ttl_minutes)
+        now = datetime.now()
+        expire_time = now + timedelta(minutes=ttl_minutes)
         
         # Store summarized result (not full output)
         cache_entry = {
             "summary": result.get("parsed_data", {}),
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "cache_until": expire_time.isoformat(),
             "success": result.get("success", False)
         }
         
-        cache["recent_tool_results"][tool_name] = cache_entry
-        save_session_cache(cache)
+        # Check the entry encodes and is small before it joins the shared cache,
+        # since every later flush re-serializes all cached entries
+        try:
+            entry_size = len(_dumps_session_cache(cache_entry))
+        except (TypeError, ValueError) as e:
+            cache_entry["summary"] = {"_truncated": True, "reason": f"not serializable: {e}"}
+        else:
+            if entry_size > CACHE_CONFIG["max_cache_entry_bytes"]:
+                cache_entry["summary"] = {"_truncated": True, "size": entry_size}
+        
+        with _session_cache_lock:
+            cache = load_session_cache()
+            # Dict insertion order doubles as LRU order (oldest first); it is
+            # a plain dict rather than OrderedDict so every JSON encoder keeps it
+            results = cache["recent_tool_results"]
+            results.pop(tool_name, None)
+            results[tool_name] = cache_entry
+            _pending_evictions.discard(tool_name)
+            
+            # Bound the cache so every write stays small
+            while len(results) > CACHE_CONFIG["max_cached_tool_results"]:
+                del results[next(iter(results))]
+            
+            save_session_cache(cache)
     
     except Exception as e:
-        print(f"Warning: Failed to cache tool result: {Fore.RED}{e}{Style.RESET_ALL}")
+        print(f"Warning: Failed to cache tool result: {_color_err(e)}")
 
 
 def get_cached_result(tool_name: str) -> Optional[Dict[str, Any]]:
@@ -435,23 +810,25 @@ def get_cached_result(tool_name: str) -> Optional[Dict[str, Any]]:
         Cached result if valid, None otherwise
     """
     try:
-        cache = load_session_cache()
-        
-        if tool_name in cache["recent_tool_results"]:
-            entry = cache["recent_tool_results"][tool_name]
-            cache_until = datetime.fromisoformat(entry["cache_until"])
+        with _session_cache_lock:
+            cache = load_session_cache()
+            
+            entry = cache["recent_tool_results"].get(tool_name)
+            if entry is None:
+                return None
             
+            cache_until = datetime.fromisoformat(entry["cache_until"])
             if datetime.now() < cache_until:
+                results = cache["recent_tool_results"]
+                results[tool_name] = results.pop(tool_name)
                 return entry
-            else:
-                # Remove expired entry
-                del cache["recent_tool_results"][tool_name]
-                save_session_cache(cache)
-        
-        return None
+            
+            # Expired - evict on the next real write rather than rewriting the cache now
+            _pending_evictions.add(tool_name)
+            return None
     
     except Exception as e:
-        print(f"Warning: Failed to get cached result: {Fore.RED}{e}{Style.RESET_ALL}")
+        print(f"Warning: Failed to get cached result: {_color_err(e)}")
         return None
 
 
@@ -468,19 +845,19 @@ def parse_network_state_markdown(content: str) -> Dict[str, Any]:
         "discovered_hosts": []
     }
     
-    # Extract system information
-    system_match = re.search(r'\*\*Operating System:\*\* (.+)', content)
-    if system_match:
-        data["system_info"]["os"] = system_match.group(1)
-    
-    hostname_match = re.search(r'\*\*Hostname:\*\* (.+)', content)
-    if hostname_match:
-        data["system_info"]["hostname"] = hostname_match.group(1)
-    
-    # Extract external IP
-    ip_match = re.search(r'\*\*External IP:\*\* (.+)', content)
-    if ip_match and ip_match.group(1) != "Not detected yet":
-        data["external_ip"] = ip_match.group(1)
+    # Single pass over the lines; the first occurrence of each field wins
+    system_info = data["system_info"]
+    external_ip_seen = False
+    for line in content.splitlines():
+        if line.startswith(_OS_PREFIX):
+            system_info.setdefault("os", line[len(_OS_PREFIX):])
+        elif line.startswith(_HOSTNAME_PREFIX):
+            system_info.setdefault("hostname", line[len(_HOSTNAME_PREFIX):])
+        elif line.startswith(_EXTERNAL_IP_PREFIX) and not external_ip_seen:
+            external_ip_seen = True
+            external_ip = line[len(_EXTERNAL_IP_PREFIX):]
+            if external_ip != "Not detected yet":
+                data["external_ip"] = external_ip
     
     return data
 
@@ -495,15 +872,16 @@ def parse_target_scope_markdown(content: str) -> Dict[str, Any]:
         "prohibited_activities": []
     }
     
-    # Extract scope type
-    scope_match = re.search(r'\*Scope type: (.+)\*', content)
-    if scope_match:
-        data["scope_type"] = scope_match.group(1)
-    
-    # Extract engagement name
-    engagement_match = re.search(r'\*\*Engagement Name:\*\* (.+)', content)
-    if engagement_match:
-        data["engagement_name"] = engagement_match.group(1)
+    # Single pass over the lines; the first occurrence of each field wins
+    scope_type_seen = False
+    engagement_name_seen = False
+    for line in content.splitlines():
+        if line.startswith(_SCOPE_TYPE_PREFIX) and line.endswith("*") and not scope_type_seen:
+            scope_type_seen = True
+            data["scope_type"] = line[len(_SCOPE_TYPE_PREFIX):-1]
+        elif line.startswith(_ENGAGEMENT_NAME_PREFIX) and not engagement_name_seen:
+            engagement_name_seen = True
+            data["engagement_name"] = line[len(_ENGAGEMENT_NAME_PREFIX):]
     
     return data
 
@@ -517,18 +895,28 @@ def update_markdown_sections(content: str, updates: Dict[str, Any]) -> str:
             # Update system information section
             for key, value in new_value.items():
                 if key == "os":
-                    pattern = r'(\*\*Operating System:\*\*) .+'
-                    replacement = f'\\1 {value}'
-                    updated_content = re.sub(pattern, replacement, updated_content)
+                    updated_content = _RE_SUB_OS.sub(f'\\1 {value}', updated_content)
                 elif key == "hostname":
-                    pattern = r'(\*\*Hostname:\*\*) .+'
-                    replacement = f'\\1 {value}'
-                    updated_content = re.sub(pattern, replacement, updated_content)
+                    updated_content = _RE_SUB_HOSTNAME.sub(f'\\1 {value}', updated_content)
         
         elif section_key == "external_ip":
-            pattern = r'(\*\*External IP:\*\*) .+'
-            replacement = f'\\1 {new_value}'
-            updated_content = re.sub(pattern, replacement, updated_content)
+            updated_content = _RE_SUB_EXTERNAL_IP.sub(f'\\1 {new_value}', updated_content)
+        
+        # Target scope sections; the values are complete replacement lines
+        # built by update_target_scope()
+        elif section_key == "scope_type_header":
+            updated_content = _RE_SUB_SCOPE_TYPE.sub(lambda m: new_value, updated_content, count=1)
+        
+        elif section_key == "engagement_name":
+            updated_content = _RE_SUB_ENGAGEMENT_NAME.sub(lambda m: new_value, updated_content, count=1)
+        
+        elif section_key == "targets":
+            updated_content = _RE_SUB_TARGETS.sub(
+                lambda m: f"{m.group(1)}{new_value}\n\n", updated_content, count=1
+            )
+        
+        else:
+            print(f"Warning: Ignoring unknown memory file section: {section_key}")
     
     return updated_content
 
@@ -538,21 +926,25 @@ def format_targets_section(targets: List[Dict[str, Any]]) -> str:
     if not targets:
         return "*No targets defined yet*"
     
-    formatted = ""
+    parts = []
     for i, target in enumerate(targets, 1):
-        formatted += f"{i}. **{target.get('ip', 'Unknown')}** - {target.get('hostname', 'Unknown')}\n"
-        if target.get('ports'):
-            formatted += f"   - Ports: {', '.join(map(str, target['ports']))}\n"
-        if target.get('notes'):
-            formatted += f"   - Notes: {target['notes']}\n"
-        formatted += "\n"
+        parts.append(f"{i}. **{target.get('ip', 'Unknown')}** - {target.get('hostname', 'Unknown')}\n")
+        ports = target.get('ports')
+        if ports:
+            parts.append(f"   - Ports: {', '.join(map(str, ports))}\n")
+        notes = target.get('notes')
+        if notes:
+            parts.append(f"   - Notes: {notes}\n")
+        parts.append("\n")
     
-    return formatted.strip()
+    return "".join(parts).strip()
 
 
 # Quick test function for development
 def test_memory_manager():
     """Test function for development purposes."""
+    from colorama import Fore, Style
+    
     print("Testing memory manager module...")
 
     # Test initialization
@@ -3,6 +3,35 @@ Network diagnostics module for Instability v3.
 
 Provides Layer 2/3 network diagnostics, DNS testing,
 and web connectivity verification tools.
+
+Submodules are loaded on first attribute access (PEP 562), so importing
+the package itself stays cheap.
 """
 
-__version__ = "3.0.0"
\ No newline at end of file
+import importlib
+
+__version__ = "3.0.0"
+
+_SUBMODULES = {
+    "dns_diagnostics",
+    "email_diagnostics",
+    "ixp_diagnostics",
+    "layer2_diagnostics",
+    "layer3_diagnostics",
+    "mac_lookup",
+    "ntp_connectivity",
+    "web_connectivity",
+}
+
+
+def __getattr__(name: str):
+    """Import a network submodule the first time it is accessed as an attribute."""
+    if name in _SUBMODULES:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _SUBMODULES)
@@ -0,0 +1,70 @@
+"""
+Small expiring cache shared by the network diagnostics modules.
+
+Interface and DNS lookups are slow to perform and usually give the same
+answer when repeated a moment later. Each module keeps its recent answers
+in a TTLCache rather than its own dict-and-lock pair.
+"""
+
+import copy
+import threading
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Thread-safe mapping whose entries expire on the monotonic clock.
+
+    Values are deep-copied on the way in and out, so callers can mutate
+    what they store or get back without corrupting the cache.
+    """
+
+    def __init__(self, default_ttl: float, max_ttl: Optional[float] = None):
+        """
+        Args:
+            default_ttl: Lifetime in seconds for put() calls without a ttl
+            max_ttl: Upper bound applied to every ttl, or None for no bound
+        """
+        self.default_ttl = default_ttl
+        self.max_ttl = max_ttl
+        self._entries: Dict[Hashable, Tuple[float, float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get_entry(self, key: Hashable) -> Optional[Tuple[Any, float]]:
+        """Return (copy of the value, age in seconds), or None if missing or expired."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, expiry, value = entry
+            if now >= expiry:
+                del self._entries[key]
+                return None
+        return copy.deepcopy(value), now - stored_at
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return a copy of the cached value, or default if missing or expired."""
+        entry = self.get_entry(key)
+        return default if entry is None else entry[0]
+
+    def put(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a copy of value for ttl seconds; a ttl of zero or less stores nothing."""
+        if ttl is None:
+            ttl = self.default_ttl
+        if self.max_ttl is not None:
+            ttl = min(ttl, self.max_ttl)
+        if ttl <= 0:
+            return
+        now = time.monotonic()
+        with self._lock:
+            self._entries[key] = (now, now + ttl, copy.deepcopy(value))
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get_entry(key) is not None
@@ -6,17 +6,138 @@ Part of the instability.py v3 network diagnostics suite.
 """
 
 import socket
+import sys
 import subprocess
 import platform
+import re
+import shutil
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from colorama import Fore
 
+try:
+    import dns.exception
+    import dns.rdatatype
+    import dns.resolver
+    DNSPYTHON_AVAILABLE = True
+except ImportError:
+    DNSPYTHON_AVAILABLE = False
+
 # Import standardized tool result functions
 from utils import create_success_result, create_error_result
+from config import CACHE_CONFIG
+from network._ttl_cache import TTLCache
+
+# Lookup results keyed by (hostname, record_type, source) or ("PTR", ip).
+# Answers expire with the record TTL and authoritative "no such record"
+# answers with the SOA negative-caching TTL (RFC 2308). Both are capped at
+# DNS_CACHE_TTL: advertised TTLs can run to days (NS/MX records, SOA
+# minimums below a TLD), and a DNS fix made while troubleshooting should
+# show up within minutes rather than after a restart
+DNS_CACHE_TTL = CACHE_CONFIG["dns_cache_ttl_seconds"]
+_DNS_CACHE = TTLCache(DNS_CACHE_TTL, max_ttl=DNS_CACHE_TTL)
+
+# Per-server result lines, formatted with (server, detail)
+_OK_LINE = Fore.GREEN + "✓ {}: {}" + Fore.RESET
+_FAIL_LINE = Fore.RED + "✗ {}: {}" + Fore.RESET
+_UNKNOWN_LINE = Fore.YELLOW + "? {}: {}" + Fore.RESET
+
+# Platform and DNS tool locations do not change for the life of the process
+_SYSTEM = platform.system().lower()
+_DIG_PATH = shutil.which("dig")
+_NSLOOKUP_PATH = shutil.which("nslookup")
+
+# Public resolvers raced by resolve_hostname(parallel=True), most preferred first
+PARALLEL_RESOLVERS = ("1.1.1.1", "8.8.8.8", "9.9.9.9", "208.67.222.222")
+
+# Dotted-quad IPv4 address in dig/nslookup output
+_IP_RE = re.compile(r'\b(?:[0-9]{1,3}\.){3}[0-9]{1,3}\b')
+
+
+def _negative_ttl(exc: Exception) -> Optional[int]:
+    """
+    Get the negative-caching TTL from an NXDOMAIN or NoAnswer response.
+    
+    Args:
+        exc: dns.resolver.NXDOMAIN or dns.resolver.NoAnswer raised by a query
+        
+    Returns:
+        min(SOA record TTL, SOA minimum) from the authority section, or None
+        if the response carried no SOA
+    """
+    if isinstance(exc, dns.resolver.NXDOMAIN):
+        responses = list(exc.responses().values())
+    else:
+        responses = [exc.kwargs.get("response")]
+    
+    for response in responses:
+        if response is None:
+            continue
+        for rrset in response.authority:
+            if rrset.rdtype == dns.rdatatype.SOA:
+                return min(rrset.ttl, rrset[0].minimum)
+    return None
+
+
+def clear_dns_cache() -> None:
+    """Discard all cached DNS lookup results, including layer 3 target lookups."""
+    _DNS_CACHE.clear()
+
+# Record-type handlers for resolve_hostname. Each takes (hostname, record_type)
+# and returns (records, ttl): ttl is the positive or negative caching time
+# when the answer carried one, else None
+
+def _resolve_a(hostname: str, record_type: str) -> Tuple[List[str], Optional[int]]:
+    """Resolve A records through the system resolver."""
+    return socket.gethostbyname_ex(hostname)[2], None
 
-def resolve_hostname(hostname: str, record_type: str = "A", silent: bool = False) -> Dict[str, Any]:
+def _resolve_aaaa(hostname: str, record_type: str) -> Tuple[List[str], Optional[int]]:
+    """Resolve AAAA records through the system resolver."""
+    try:
+        ip_addresses = socket.getaddrinfo(hostname, None, socket.AF_INET6)
+    except socket.gaierror:
+        return [], None
+    return [addr[4][0] for addr in ip_addresses], None
+
+def _resolve_with_dnspython(hostname: str, record_type: str) -> Tuple[List[str], Optional[int]]:
+    """Query any record type in-process with the system resolver configuration."""
+    try:
+        answer = dns.resolver.resolve(hostname, record_type)
+    except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer) as e:
+        return [], _negative_ttl(e)
+    except dns.exception.DNSException:
+        return [], None
+    return [rdata.to_text() for rdata in answer], answer.rrset.ttl
+
+def _resolve_with_command(hostname: str, record_type: str) -> Tuple[List[str], Optional[int]]:
+    """Query any record type by running dig or nslookup."""
+    cmd = _get_dns_lookup_command(hostname, record_type)
+    if cmd:
+        proc = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+        if proc.returncode == 0:
+            return _parse_dns_output(proc.stdout, record_type), None
+    return [], None
+
+def _resolve_parallel(hostname: str, record_type: str) -> Tuple[List[str], Optional[int]]:
+    """Race the query across public resolvers and use the first answer."""
+    try:
+        records, ttl, _ = _parallel_resolve(hostname, record_type)
+    except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer) as e:
+        return [], _negative_ttl(e)
+    except dns.exception.DNSException:
+        return [], None
+    return records, ttl
+
+_RESOLVE_HANDLERS = {
+    "A": _resolve_a,
+    "AAAA": _resolve_aaaa,
+}
+_resolve_generic = _resolve_with_dnspython if DNSPYTHON_AVAILABLE else _resolve_with_command
+
+def resolve_hostname(hostname: str, record_type: str = "A", silent: bool = False,
+                     parallel: bool = False, use_cache: bool = True) -> Dict[str, Any]:
     """
     Resolve hostname to IP addresses using specified DNS record type.
     
@@ -24,54 +145,70 @@ def resolve_hostname(hostname: str, record_type: str = "A", silent: bool = False
         hostname: Target hostname to resolve
         record_type: DNS record type (A, AAAA, MX, NS, TXT, CNAME)
         silent: Suppress console output if True
+        parallel: Query several public resolvers at once and use the first
+            answer, trading extra queries for lower tail latency
+        use_cache: If True, reuse an answer that is still within its TTL
         
     Returns:
-        Dict containing resolution results, IPs, and error information
+        Dict containing resolution results, IPs, and error information.
+        Reused answers have cached=True, cache_age_seconds, and the time
+        the cache lookup took as resolution_time_ms
     """
     if not silent:
         print(f"{Fore.CYAN}Resolving {hostname} ({record_type} record)...{Fore.RESET}")
     
+    rtype = record_type.upper()
+    raced = parallel and DNSPYTHON_AVAILABLE
+    # Public resolvers and the system resolver can disagree (split-horizon
+    # names exist only internally), so their answers are cached apart
+    cache_key = (hostname.lower(), rtype, "public" if raced else "system")
+    start_time = time.perf_counter()
+    entry = _DNS_CACHE.get_entry(cache_key) if use_cache else None
+    if entry is not None:
+        cached, age = entry
+        cached["hostname"] = hostname
+        cached["record_type"] = record_type
+        cached["resolution_time_ms"] = round((time.perf_counter() - start_time) * 1000, 2)
+        cached["cached"] = True
+        cached["cache_age_seconds"] = round(age, 1)
+        if not silent:
+            if cached["success"]:
+                print(f"{Fore.GREEN}✓ Resolved to: {', '.join(cached['resolved_ips'])}{Fore.RESET}")
+            else:
+                print(f"{Fore.RED}✗ No {record_type} records found{Fore.RESET}")
+        return cached
+    
+    if raced:
+        handler = _resolve_parallel
+    else:
+        handler = _RESOLVE_HANDLERS.get(rtype, _resolve_generic)
+    
     result = {
         "success": False,
         "hostname": hostname,
         "record_type": record_type,
         "resolved_ips": [],
         "resolution_time_ms": None,
+        "cached": False,
         "error": None
     }
     
     try:
-        import time
-        start_time = time.time()
+        start_time = time.perf_counter()
         
-        if record_type.upper() == "A":
-            ip_addresses = socket.gethostbyname_ex(hostname)[2]
-            result["resolved_ips"] = ip_addresses
-        elif record_type.upper() == "AAAA":
-            try:
-                ip_addresses = socket.getaddrinfo(hostname, None, socket.AF_INET6)
-                result["resolved_ips"] = [addr[4][0] for addr in ip_addresses]
-            except socket.gaierror:
-                result["resolved_ips"] = []
-        else:
-            # For other record types, try using nslookup/dig
-            cmd = _get_dns_lookup_command(hostname, record_type)
-            if cmd:
-                proc = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-                if proc.returncode == 0:
-                    result["resolved_ips"] = _parse_dns_output(proc.stdout, record_type)
-                else:
-                    result["error"] = f"DNS lookup failed: {proc.stderr.strip()}"
+        result["resolved_ips"], ttl = handler(hostname, rtype)
         
-        end_time = time.time()
-        result["resolution_time_ms"] = round((end_time - start_time) * 1000, 2)
+        result["resolution_time_ms"] = round((time.perf_counter() - start_time) * 1000, 2)
         
         if result["resolved_ips"]:
             result["success"] = True
+            _DNS_CACHE.put(cache_key, result, ttl)
             if not silent:
                 print(f"{Fore.GREEN}✓ Resolved to: {', '.join(result['resolved_ips'])}{Fore.RESET}")
         else:
             result["error"] = "No records found"
+            if ttl is not None:
+                _DNS_CACHE.put(cache_key, result, ttl)
             if not silent:
                 print(f"{Fore.RED}✗ No {record_type} records found{Fore.RESET}")
                 
@@ -115,60 +252,37 @@ def test_dns_servers(servers: List[str] = None, test_domain: str = "google.com",
     }
     
     fastest_time = float('inf')
+    server_results = _run_per_server(_test_one_dns_server, servers, test_domain)
     
+    output_lines = []
     for server in servers:
-        server_result = {
-            "reachable": False,
-            "resolution_time_ms": None,
-            "resolved_ip": None,
-            "error": None
-        }
+        server_result = server_results[server]
+        response_time = server_result["resolution_time_ms"]
         
-        try:
-            # Test DNS resolution using specific server
-            cmd = _get_dns_server_test_command(test_domain, server)
-            if cmd:
-                import time
-                start_time = time.time()
-                
-                proc = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
-                
-                end_time = time.time()
-                response_time = round((end_time - start_time) * 1000, 2)
-                
-                if proc.returncode == 0:
-                    server_result["reachable"] = True
-                    server_result["resolution_time_ms"] = response_time
-                    server_result["resolved_ip"] = _extract_ip_from_output(proc.stdout)
-                    result["working_servers"] += 1
-                    
-                    if response_time < fastest_time:
-                        fastest_time = response_time
-                        result["fastest_server"] = server
-                        result["fastest_time_ms"] = response_time
-                    
-                    if not silent:
-                        print(f"{Fore.GREEN}✓ {server}: {response_time}ms{Fore.RESET}")
-                else:
-                    server_result["error"] = "DNS query failed"
-                    if not silent:
-                        print(f"{Fore.RED}✗ {server}: Failed{Fore.RESET}")
-            else:
-                server_result["error"] = "No DNS tool available"
-                if not silent:
-                    print(f"{Fore.YELLOW}? {server}: No DNS tool available{Fore.RESET}")
-                    
-        except subprocess.TimeoutExpired:
-            server_result["error"] = "Timeout"
-            if not silent:
-                print(f"{Fore.RED}✗ {server}: Timeout{Fore.RESET}")
-        except Exception as e:
-            server_result["error"] = str(e)
+        if server_result["reachable"]:
+            result["working_servers"] += 1
+            
+            if response_time < fastest_time:
+                fastest_time = response_time
+                result["fastest_server"] = server
+                result["fastest_time_ms"] = response_time
+            
             if not silent:
-                print(f"{Fore.RED}✗ {server}: {e}{Fore.RESET}")
+                output_lines.append(_OK_LINE.format(server, f"{response_time}ms"))
+        elif not silent:
+            error = server_result["error"]
+            if error == "DNS query failed":
+                output_lines.append(_FAIL_LINE.format(server, "Failed"))
+            elif error == "No DNS tool available":
+                output_lines.append(_UNKNOWN_LINE.format(server, error))
+            else:
+                output_lines.append(_FAIL_LINE.format(server, error))
         
         result["server_results"][server] = server_result
     
+    if output_lines:
+        sys.stdout.write("\n".join(output_lines) + "\n")
+    
     result["success"] = result["working_servers"] > 0
     
     if not silent and result["fastest_server"]:
@@ -176,38 +290,53 @@ def test_dns_servers(servers: List[str] = None, test_domain: str = "google.com",
     
     return result
 
-def reverse_dns_lookup(ip_address: str, silent: bool = False) -> Dict[str, Any]:
+def reverse_dns_lookup(ip_address: str, silent: bool = False, use_cache: bool = True) -> Dict[str, Any]:
     """
     Perform reverse DNS lookup to get hostname from IP address.
     
     Args:
         ip_address: IP address to perform reverse lookup on
         silent: Suppress console output if True
+        use_cache: If True, reuse a name found in the last DNS_CACHE_TTL seconds
         
     Returns:
-        Dict containing reverse lookup results
+        Dict containing reverse lookup results. Reused answers have
+        cached=True, cache_age_seconds, and the time the cache lookup took
+        as lookup_time_ms
     """
     if not silent:
         print(f"{Fore.CYAN}Reverse DNS lookup for {ip_address}...{Fore.RESET}")
     
+    cache_key = ("PTR", ip_address)
+    start_time = time.perf_counter()
+    entry = _DNS_CACHE.get_entry(cache_key) if use_cache else None
+    if entry is not None:
+        cached, age = entry
+        cached["lookup_time_ms"] = round((time.perf_counter() - start_time) * 1000, 2)
+        cached["cached"] = True
+        cached["cache_age_seconds"] = round(age, 1)
+        if not silent:
+            print(f"{Fore.GREEN}✓ Resolved to: {cached['hostname']}{Fore.RESET}")
+        return cached
+    
     result = {
         "success": False,
         "ip_address": ip_address,
         "hostname": None,
         "lookup_time_ms": None,
+        "cached": False,
         "error": None
     }
     
     try:
-        import time
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         hostname = socket.gethostbyaddr(ip_address)[0]
         
-        end_time = time.time()
-        result["lookup_time_ms"] = round((end_time - start_time) * 1000, 2)
+        result["lookup_time_ms"] = round((time.perf_counter() - start_time) * 1000, 2)
         result["hostname"] = hostname
         result["success"] = True
+        _DNS_CACHE.put(cache_key, result)
         
         if not silent:
             print(f"{Fore.GREEN}✓ Resolved to: {hostname}{Fore.RESET}")
@@ -223,6 +352,52 @@ def reverse_dns_lookup(ip_address: str, silent: bool = False) -> Dict[str, Any]:
     
     return result
 
+def reverse_dns_lookup_bulk(ip_addresses: List[str], max_workers: int = 32, silent: bool = False,
+                            use_cache: bool = True) -> Dict[str, Any]:
+    """
+    Perform reverse DNS lookups for many IP addresses concurrently.
+    
+    Args:
+        ip_addresses: IP addresses to perform reverse lookups on
+        max_workers: Maximum number of lookups in flight at once
+        silent: Suppress console output if True
+        use_cache: If True, reuse names found in the last DNS_CACHE_TTL seconds
+        
+    Returns:
+        Dict containing per-IP reverse lookup results
+    """
+    if not silent:
+        print(f"{Fore.CYAN}Reverse DNS lookup for {len(ip_addresses)} addresses...{Fore.RESET}")
+    
+    result = {
+        "success": False,
+        "ips_checked": len(ip_addresses),
+        "resolved_count": 0,
+        "results": {}
+    }
+    
+    if ip_addresses:
+        unique_ips = list(dict.fromkeys(ip_addresses))
+        workers = max(1, min(max_workers, len(unique_ips)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            lookups = executor.map(lambda ip: reverse_dns_lookup(ip, silent=True, use_cache=use_cache), unique_ips)
+            result["results"] = dict(zip(unique_ips, lookups))
+    
+    output_lines = []
+    for ip_address, lookup in result["results"].items():
+        if lookup["success"]:
+            result["resolved_count"] += 1
+            if not silent:
+                output_lines.append(_OK_LINE.format(ip_address, lookup["hostname"]))
+        elif not silent:
+            output_lines.append(_FAIL_LINE.format(ip_address, lookup["error"]))
+    
+    if output_lines:
+        sys.stdout.write("\n".join(output_lines) + "\n")
+    
+    result["success"] = result["resolved_count"] > 0
+    return result
+
 def check_dns_propagation(domain: str, record_type: str = "A", servers: List[str] = None, silent: bool = False) -> Dict[str, Any]:
     """
     Check DNS propagation across multiple DNS servers.
@@ -254,37 +429,27 @@ def check_dns_propagation(domain: str, record_type: str = "A", servers: List[str
     }
     
     responses = {}
+    server_responses = _run_per_server(_check_one_dns_server, servers, domain, record_type)
     
+    output_lines = []
     for server in servers:
-        try:
-            cmd = _get_dns_server_test_command(domain, server, record_type)
-            if cmd:
-                proc = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
-                if proc.returncode == 0:
-                    response = _extract_ip_from_output(proc.stdout)
-                    if response:
-                        if response not in responses:
-                            responses[response] = []
-                        responses[response].append(server)
-                        result["server_responses"][server] = {"success": True, "response": response}
-                        if not silent:
-                            print(f"{Fore.GREEN}✓ {server}: {response}{Fore.RESET}")
-                    else:
-                        result["server_responses"][server] = {"success": False, "error": "No response"}
-                        if not silent:
-                            print(f"{Fore.RED}✗ {server}: No response{Fore.RESET}")
-                else:
-                    result["server_responses"][server] = {"success": False, "error": "Query failed"}
-                    if not silent:
-                        print(f"{Fore.RED}✗ {server}: Query failed{Fore.RESET}")
-            else:
-                result["server_responses"][server] = {"success": False, "error": "No DNS tool"}
-                if not silent:
-                    print(f"{Fore.YELLOW}? {server}: No DNS tool{Fore.RESET}")
-        except Exception as e:
-            result["server_responses"][server] = {"success": False, "error": str(e)}
+        server_response = server_responses[server]
+        result["server_responses"][server] = server_response
+        
+        if server_response["success"]:
+            response = server_response["response"]
+            if response not in responses:
+                responses[response] = []
+            responses[response].append(server)
             if not silent:
-                print(f"{Fore.RED}✗ {server}: {e}{Fore.RESET}")
+                output_lines.append(_OK_LINE.format(server, response))
+        elif not silent:
+            error = server_response["error"]
+            line = _UNKNOWN_LINE if error == "No DNS tool" else _FAIL_LINE
+            output_lines.append(line.format(server, error))
+    
+    if output_lines:
+        sys.stdout.write("\n".join(output_lines) + "\n")
     
     result["unique_responses"] = responses
     result["success"] = len(responses) > 0
@@ -301,37 +466,209 @@ def check_dns_propagation(domain: str, record_type: str = "A", servers: List[str
     
     return result
 
-def _get_dns_lookup_command(hostname: str, record_type: str) -> Optional[List[str]]:
-    """Get appropriate DNS lookup command for the platform."""
-    system = platform.system().lower()
+def _run_per_server(query_func, servers: List[str], *args) -> Dict[str, Dict[str, Any]]:
+    """
+    Run a per-server DNS query against every server concurrently.
     
-    if system == "windows":
-        return ["nslookup", "-type=" + record_type.lower(), hostname]
-    else:
-        # Try dig first, fallback to nslookup
-        try:
-            subprocess.run(["which", "dig"], capture_output=True, check=True)
-            return ["dig", "+short", hostname, record_type.upper()]
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return ["nslookup", "-type=" + record_type.lower(), hostname]
+    Queries spend nearly all their time waiting on the network, so the
+    total wall time is bounded by the slowest server rather than the sum.
+    Output is left to the caller so it stays on the main thread and in
+    the original server order.
+    
+    Args:
+        query_func: Callable taking (server, *args) and returning a result dict
+        servers: DNS server IPs to query
+        *args: Extra positional arguments passed through to query_func
+        
+    Returns:
+        Dict mapping each server to the dict returned by query_func
+    """
+    if not servers:
+        return {}
+    
+    with ThreadPoolExecutor(max_workers=len(servers)) as executor:
+        futures = {executor.submit(query_func, server, *args): server for server in servers}
+        return {futures[future]: future.result() for future in as_completed(futures)}
 
-def _get_dns_server_test_command(domain: str, server: str, record_type: str = "A") -> Optional[List[str]]:
-    """Get DNS server test command for the platform."""
-    system = platform.system().lower()
+def _query_dns_server(domain: str, server: str, record_type: str = "A",
+                      timeout: float = 5) -> Tuple[List[str], float, int]:
+    """
+    Query a specific DNS server in-process using dnspython.
     
-    if system == "windows":
-        return ["nslookup", domain, server]
-    else:
+    Args:
+        domain: Domain to query
+        server: DNS server IP to send the query to
+        record_type: DNS record type to query
+        timeout: Total time budget for the query in seconds
+        
+    Returns:
+        Tuple of (answer records as text, query time in milliseconds, record TTL)
+        
+    Raises:
+        dns.exception.DNSException: If the query fails or times out
+    """
+    resolver = dns.resolver.Resolver(configure=False)
+    resolver.nameservers = [server]
+    resolver.lifetime = timeout
+    
+    start_time = time.perf_counter()
+    answer = resolver.resolve(domain, record_type.upper())
+    response_time = round((time.perf_counter() - start_time) * 1000, 2)
+    
+    return [rdata.to_text() for rdata in answer], response_time, answer.rrset.ttl
+
+def _parallel_resolve(hostname: str, record_type: str = "A",
+                      resolvers: Tuple[str, ...] = PARALLEL_RESOLVERS,
+                      k: int = 3) -> Tuple[List[str], int, str]:
+    """
+    Send the same query to k resolvers at once and use the first answer.
+    
+    Racing redundant queries cuts tail latency when one resolver is slow
+    or drops the packet. Queries still in flight after the first answer
+    are abandoned.
+    
+    Args:
+        hostname: Hostname to resolve
+        record_type: DNS record type to query
+        resolvers: Resolver IPs in order of preference
+        k: Number of resolvers to query
+        
+    Returns:
+        Tuple of (answer records as text, record TTL, answering resolver)
+        
+    Raises:
+        dns.exception.DNSException: If every resolver fails
+    """
+    servers = resolvers[:k]
+    executor = ThreadPoolExecutor(max_workers=len(servers))
+    try:
+        futures = {executor.submit(_query_dns_server, hostname, server, record_type): server
+                   for server in servers}
+        last_error = None
+        for future in as_completed(futures):
+            try:
+                records, _, ttl = future.result()
+            except dns.exception.DNSException as e:
+                last_error = e
+                continue
+            return records, ttl, futures[future]
+        raise last_error
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+def _test_one_dns_server(server: str, test_domain: str) -> Dict[str, Any]:
+    """Query a single DNS server for test_domain and time the response."""
+    server_result = {
+        "reachable": False,
+        "resolution_time_ms": None,
+        "resolved_ip": None,
+        "error": None
+    }
+    
+    if DNSPYTHON_AVAILABLE:
         try:
-            subprocess.run(["which", "dig"], capture_output=True, check=True)
-            return ["dig", f"@{server}", "+short", domain, record_type.upper()]
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return ["nslookup", domain, server]
+            records, response_time, _ = _query_dns_server(test_domain, server)
+            server_result["reachable"] = True
+            server_result["resolution_time_ms"] = response_time
+            server_result["resolved_ip"] = records[0] if records else None
+        except dns.exception.Timeout:
+            server_result["error"] = "Timeout"
+        except dns.exception.DNSException:
+            server_result["error"] = "DNS query failed"
+        except Exception as e:
+            server_result["error"] = str(e)
+        return server_result
+    
+    try:
+        # Test DNS resolution using specific server
+        cmd = _get_dns_server_test_command(test_domain, server)
+        if cmd:
+            start_time = time.perf_counter()
+            
+            proc = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
+            
+            response_time = round((time.perf_counter() - start_time) * 1000, 2)
+            
+            if proc.returncode == 0:
+                server_result["reachable"] = True
+                server_result["resolution_time_ms"] = response_time
+                server_result["resolved_ip"] = _extract_ip_from_output(proc.stdout)
+            else:
+                server_result["error"] = "DNS query failed"
+        else:
+            server_result["error"] = "No DNS tool available"
+            
+    except subprocess.TimeoutExpired:
+        server_result["error"] = "Timeout"
+    except Exception as e:
+        server_result["error"] = str(e)
+    
+    return server_result
+
+def _check_one_dns_server(server: str, domain: str, record_type: str) -> Dict[str, Any]:
+    """Query a single DNS server for domain and return its answer."""
+    if DNSPYTHON_AVAILABLE:
+        try:
+            records, _, _ = _query_dns_server(domain, server, record_type)
+        except dns.resolver.NoAnswer:
+            return {"success": False, "error": "No response"}
+        except dns.exception.DNSException:
+            return {"success": False, "error": "Query failed"}
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+        if not records:
+            return {"success": False, "error": "No response"}
+        # Sort so servers returning the same records in a different order still agree
+        return {"success": True, "response": ", ".join(sorted(records))}
+    
+    try:
+        cmd = _get_dns_server_test_command(domain, server, record_type)
+        if not cmd:
+            return {"success": False, "error": "No DNS tool"}
+        
+        proc = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
+        if proc.returncode != 0:
+            return {"success": False, "error": "Query failed"}
+        
+        response = _extract_ip_from_output(proc.stdout)
+        if not response:
+            return {"success": False, "error": "No response"}
+        return {"success": True, "response": response}
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+# The command builders are chosen once for the tool found at import, so
+# building a command does no platform or tool checks
+if _SYSTEM != "windows" and _DIG_PATH:
+    def _get_dns_lookup_command(hostname: str, record_type: str) -> Optional[List[str]]:
+        """Get the dig command for a DNS lookup."""
+        return [_DIG_PATH, "+short", hostname, record_type.upper()]
+    
+    def _get_dns_server_test_command(domain: str, server: str, record_type: str = "A") -> Optional[List[str]]:
+        """Get the dig command for querying a specific DNS server."""
+        return [_DIG_PATH, f"@{server}", "+short", domain, record_type.upper()]
+elif _NSLOOKUP_PATH:
+    def _get_dns_lookup_command(hostname: str, record_type: str) -> Optional[List[str]]:
+        """Get the nslookup command for a DNS lookup."""
+        return [_NSLOOKUP_PATH, "-type=" + record_type.lower(), hostname]
+    
+    def _get_dns_server_test_command(domain: str, server: str, record_type: str = "A") -> Optional[List[str]]:
+        """Get the nslookup command for querying a specific DNS server."""
+        return [_NSLOOKUP_PATH, domain, server]
+else:
+    def _get_dns_lookup_command(hostname: str, record_type: str) -> Optional[List[str]]:
+        """No DNS lookup tool is installed."""
+        return None
+    
+    def _get_dns_server_test_command(domain: str, server: str, record_type: str = "A") -> Optional[List[str]]:
+        """No DNS lookup tool is installed."""
+        return None
 
 def _parse_dns_output(output: str, record_type: str) -> List[str]:
     """Parse DNS command output to extract relevant records."""
     lines = output.strip().split('\n')
     results = []
+    is_a_record = record_type.upper() == "A"
     
     for line in lines:
         line = line.strip()
@@ -339,23 +676,20 @@ def _parse_dns_output(output: str, record_type: str) -> List[str]:
             continue
             
         # Basic IP address extraction for A records
-        if record_type.upper() == "A":
-            import re
-            ip_pattern = r'\b(?:[0-9]{1,3}\.){3}[0-9]{1,3}\b'
-            matches = re.findall(ip_pattern, line)
+        if is_a_record:
+            matches = _IP_RE.findall(line)
             results.extend(matches)
         else:
             # For other record types, include the whole line
             if line and not line.startswith(';'):
                 results.append(line)
     
-    return list(set(results))  # Remove duplicates
+    # Remove duplicates, keeping the order the server returned them in
+    return list(dict.fromkeys(results))
 
 def _extract_ip_from_output(output: str) -> Optional[str]:
     """Extract first IP address from DNS command output."""
-    import re
-    ip_pattern = r'\b(?:[0-9]{1,3}\.){3}[0-9]{1,3}\b'
-    matches = re.findall(ip_pattern, output)
+    matches = _IP_RE.findall(output)
     return matches[0] if matches else None
 
 
@@ -393,6 +727,18 @@ def get_module_tools():
                     required=False,
                     default=False,
                     description="Suppress console output if True"
+                ),
+                "parallel": ParameterInfo(
+                    param_type=ParameterType.BOOLEAN,
+                    required=False,
+                    default=False,
+                    description="Query several public resolvers at once and use the first answer"
+                ),
+                "use_cache": ParameterInfo(
+                    param_type=ParameterType.BOOLEAN,
+                    required=False,
+                    default=True,
+                    description="Reuse an answer that is still within its TTL"
                 )
             },
             modes=["manual", "chatbot"],
@@ -456,6 +802,12 @@ def get_module_tools():
                     required=False,
                     default=False,
                     description="Suppress console output if True"
+                ),
+                "use_cache": ParameterInfo(
+                    param_type=ParameterType.BOOLEAN,
+                    required=False,
+                    default=True,
+                    description="Reuse names found in the last few minutes"
                 )
             },
             modes=["manual", "chatbot"],
@@ -466,6 +818,45 @@ def get_module_tools():
             ]
         ),
         
+        "reverse_dns_lookup_bulk": ToolMetadata(
+            name="reverse_dns_lookup_bulk",
+            function_name="reverse_dns_lookup_bulk",
+            module_path="network.dns_diagnostics",
+            description="Perform reverse DNS lookups for many IP addresses concurrently",
+            category=ToolCategory.DNS,
+            parameters={
+                "ip_addresses": ParameterInfo(
+                    param_type=ParameterType.LIST,
+                    required=True,
+                    description="IP addresses for reverse lookup",
+                    aliases=["ips", "addresses", "targets", "hosts"]
+                ),
+                "max_workers": ParameterInfo(
+                    param_type=ParameterType.INTEGER,
+                    required=False,
+                    default=32,
+                    description="Maximum number of concurrent lookups"
+                ),
+                "silent": ParameterInfo(
+                    param_type=ParameterType.BOOLEAN,
+                    required=False,
+                    default=False,
+                    description="Suppress console output if True"
+                ),
+                "use_cache": ParameterInfo(
+                    param_type=ParameterType.BOOLEAN,
+                    required=False,
+                    default=True,
+                    description="Reuse names found in the last few minutes"
+                )
+            },
+            modes=["manual", "chatbot"],
+            aliases=["bulk_reverse_lookup", "ptr_lookup_bulk"],
+            examples=[
+                "reverse_dns_lookup_bulk ['8.8.8.8','1.1.1.1']"
+            ]
+        ),
+        
         "check_dns_propagation": ToolMetadata(
             name="check_dns_propagation",
             function_name="check_dns_propagation", 
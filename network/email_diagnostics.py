@@ -6,124 +6,244 @@ Tests connectivity to major email providers to identify network infrastructure i
 Part of the instability.py v3 network diagnostics suite.
 """
 
+import asyncio
 import socket
-from typing import Dict, Tuple, List, Any
+import sys
+from typing import Dict, Tuple, List, Any, Optional
 from colorama import Fore, Style
 
 # Import standardized tool result functions 
 from utils import create_success_result, create_error_result
 
-# SMTP server configurations for major email providers
-SMTP_SERVERS: Dict[str, Tuple[str, int]] = {
-    "Gmail": ("smtp.gmail.com", 587),
-    "Outlook/O365": ("smtp.office365.com", 587),
-    "Yahoo": ("smtp.mail.yahoo.com", 587),
-    "iCloud Mail": ("smtp.mail.me.com", 587),
-    "AOL Mail": ("smtp.aol.com", 587),
-    "Zoho Mail": ("smtp.zoho.com", 587),
-    "Mail.com": ("smtp.mail.com", 587),
-    "GMX Mail": ("smtp.gmx.com", 587),
-    "Fastmail": ("smtp.fastmail.com", 587)
-}
+# SMTP server configurations for major email providers as (provider, hostname, port)
+SMTP_SERVERS: Tuple[Tuple[str, str, int], ...] = (
+    ("Gmail", "smtp.gmail.com", 587),
+    ("Outlook/O365", "smtp.office365.com", 587),
+    ("Yahoo", "smtp.mail.yahoo.com", 587),
+    ("iCloud Mail", "smtp.mail.me.com", 587),
+    ("AOL Mail", "smtp.aol.com", 587),
+    ("Zoho Mail", "smtp.zoho.com", 587),
+    ("Mail.com", "smtp.mail.com", 587),
+    ("GMX Mail", "smtp.gmx.com", 587),
+    ("Fastmail", "smtp.fastmail.com", 587)
+)
 
-# IMAP server configurations for major email providers
-IMAP_SERVERS: Dict[str, Tuple[str, int]] = {
-    "Gmail": ("imap.gmail.com", 993),
-    "Outlook/O365": ("outlook.office365.com", 993),
-    "Yahoo": ("imap.mail.yahoo.com", 993),
-    "iCloud Mail": ("imap.mail.me.com", 993),
-    "AOL Mail": ("imap.aol.com", 993),
-    "Zoho Mail": ("imap.zoho.com", 993),
-    "Mail.com": ("imap.mail.com", 993),
-    "GMX Mail": ("imap.gmx.com", 993),
-    "Fastmail": ("imap.fastmail.com", 993)
-}
+# IMAP server configurations for major email providers as (provider, hostname, port)
+IMAP_SERVERS: Tuple[Tuple[str, str, int], ...] = (
+    ("Gmail", "imap.gmail.com", 993),
+    ("Outlook/O365", "outlook.office365.com", 993),
+    ("Yahoo", "imap.mail.yahoo.com", 993),
+    ("iCloud Mail", "imap.mail.me.com", 993),
+    ("AOL Mail", "imap.aol.com", 993),
+    ("Zoho Mail", "imap.zoho.com", 993),
+    ("Mail.com", "imap.mail.com", 993),
+    ("GMX Mail", "imap.gmx.com", 993),
+    ("Fastmail", "imap.fastmail.com", 993)
+)
 
+# Per-provider progress and result lines
+_TESTING_LINE = Fore.YELLOW + "Testing {} ({}:{})..." + Fore.RESET
+_OK_LINE = Fore.GREEN + "[OK] {}: {}" + Fore.RESET
+_FAIL_LINE = Fore.RED + "[FAIL] {}: {}" + Fore.RESET
+_TIMEOUT_LINE = Fore.YELLOW + "[TIMEOUT] {}: {}" + Fore.RESET
 
-def _test_server_connectivity(hostname: str, port: int, timeout: int = 10) -> Tuple[bool, str]:
+async def _resolve_hosts_async(hostnames: List[str]) -> Dict[str, Any]:
     """
-    Test connectivity to a specific server and port using socket connection.
+    Resolve each distinct hostname once, concurrently.
     
     Args:
-        hostname: Server hostname to test
-        port: Port number to test
-        timeout: Connection timeout in seconds
+        hostnames: Hostnames to resolve; duplicates are looked up once
         
     Returns:
-        Tuple of (success, status_message)
+        Dict mapping hostname to its getaddrinfo() list, or to the
+        socket.gaierror raised while resolving it
     """
+    loop = asyncio.get_running_loop()
+    unique_hostnames = list(dict.fromkeys(hostnames))
+    results = await asyncio.gather(
+        *(loop.getaddrinfo(hostname, None, type=socket.SOCK_STREAM) for hostname in unique_hostnames),
+        return_exceptions=True
+    )
+    return dict(zip(unique_hostnames, results))
+
+
+async def _connect_once(address: str, port: int, timeout: float) -> Tuple[bool, str]:
+    """Open and close one TCP connection to address:port within timeout seconds."""
     try:
-        with socket.create_connection((hostname, port), timeout=timeout):
-            return True, "Connected successfully"
-    except socket.timeout:
+        _, writer = await asyncio.wait_for(asyncio.open_connection(address, port), timeout)
+    except asyncio.TimeoutError:
         return False, "Connection timeout"
-    except socket.gaierror as e:
-        return False, f"DNS resolution failed: {e}"
     except ConnectionRefusedError:
         return False, "Connection refused"
     except Exception as e:
         return False, f"Connection failed: {e}"
+    
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except OSError:
+        pass
+    return True, "Connected successfully"
 
 
-def check_smtp_connectivity(silent: bool = False) -> str:
+async def _test_server_connectivity_async(addrinfo: Any, port: int, timeout: int = 10,
+                                          attempt_timeout: float = 3) -> Tuple[bool, str]:
     """
-    Test SMTP server connectivity for major email providers.
+    Test connectivity to a specific server and port using a TCP connection.
     
-    Tests outbound email server connectivity by attempting socket connections
-    to major SMTP providers on secure port 587 (SMTP submission port).
+    Each resolved address except the last gets its own short attempt, so
+    one blackholed address fails fast instead of consuming the whole budget
+    before the next address (or the other address family) is tried. The
+    last address, which for single-address hosts is the only one, gets
+    whatever remains of the budget.
     
     Args:
+        addrinfo: getaddrinfo() result for the server hostname, or the
+            exception raised while resolving it
+        port: Port number to test
+        timeout: Overall connection budget in seconds across all addresses
+        attempt_timeout: Connection timeout in seconds for each address
+            that still has another address after it
+        
+    Returns:
+        Tuple of (success, status_message) for the first address that
+        connects, or for the last address tried
+    """
+    if isinstance(addrinfo, socket.gaierror):
+        return False, f"DNS resolution failed: {addrinfo}"
+    if isinstance(addrinfo, BaseException):
+        return False, f"Connection failed: {addrinfo}"
+    
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    success, message = False, "Connection timeout"
+    
+    addresses = list(dict.fromkeys(info[4][0] for info in addrinfo))
+    for index, address in enumerate(addresses):
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            break
+        # The last address has nothing to fall back to, so it gets the rest of the budget
+        last = index == len(addresses) - 1
+        success, message = await _connect_once(
+            address, port, remaining if last else min(attempt_timeout, remaining)
+        )
+        if success:
+            break
+    
+    return success, message
+
+
+async def _probe_servers_async(servers: Tuple[Tuple[str, str, int], ...]) -> List[Tuple[bool, str]]:
+    """Probe every server in a provider table on one event loop."""
+    addresses = await _resolve_hosts_async([hostname for _, hostname, _ in servers])
+    return await asyncio.gather(*(
+        _test_server_connectivity_async(addresses[hostname], port, timeout=10)
+        for _, hostname, port in servers
+    ))
+
+
+def _probe_servers(servers: Tuple[Tuple[str, str, int], ...]) -> List[Tuple[bool, str]]:
+    """
+    Probe every server in a provider table concurrently.
+    
+    Each probe is a TCP handshake that spends almost all of its time waiting,
+    so the probes share a single event loop and the total time is bounded by
+    the slowest provider instead of the sum of all of them.
+    
+    Args:
+        servers: Provider table of (provider, hostname, port)
+        
+    Returns:
+        List of (success, status_message), in the same order as servers
+    """
+    return asyncio.run(_probe_servers_async(servers))
+
+
+def _check_connectivity(protocol: str, servers: Tuple[Tuple[str, str, int], ...],
+                        silent: bool = False,
+                        probe_results: Optional[List[Tuple[bool, str]]] = None) -> Tuple[str, int, int]:
+    """
+    Probe a provider table and build its connectivity summary.
+    
+    Args:
+        protocol: Protocol label used in output, e.g. "SMTP"
+        servers: Provider table of (provider, hostname, port)
         silent: Suppress console output if True
+        probe_results: Results already gathered for servers, in table order;
+            the servers are probed here if None
         
     Returns:
-        Formatted summary of SMTP connectivity test results
+        Tuple of (formatted summary, reachable server count, total server count)
     """
     if not silent:
-        print(f"{Fore.CYAN}Testing SMTP connectivity to major email providers...{Fore.RESET}")
+        print(f"{Fore.CYAN}Testing {protocol} connectivity to major email providers...{Fore.RESET}")
     
     reachable = []
     unreachable = []
     
-    for provider, (hostname, port) in SMTP_SERVERS.items():
+    if probe_results is None:
+        probe_results = _probe_servers(servers)
+    
+    # Report in the configured provider order regardless of completion order
+    output_lines = []
+    for (provider, hostname, port), (success, message) in zip(servers, probe_results):
         if not silent:
-            print(f"{Fore.YELLOW}Testing {provider} ({hostname}:{port})...{Fore.RESET}")
+            output_lines.append(_TESTING_LINE.format(provider, hostname, port))
         
-        success, message = _test_server_connectivity(hostname, port, timeout=10)
         
         if success:
-            reachable.append(provider)
+            reachable.append((provider, hostname, port))
             if not silent:
-                print(f"{Fore.GREEN}[OK] {provider}: {message}{Fore.RESET}")
+                output_lines.append(_OK_LINE.format(provider, message))
         else:
-            unreachable.append((provider, message))
+            unreachable.append((provider, hostname, port, message))
             if not silent:
-                status_color = Fore.RED if "timeout" not in message.lower() else Fore.YELLOW
-                status_text = "[FAIL]" if "timeout" not in message.lower() else "[TIMEOUT]"
-                print(f"{status_color}{status_text} {provider}: {message}{Fore.RESET}")
+                line = _TIMEOUT_LINE if "timeout" in message.lower() else _FAIL_LINE
+                output_lines.append(line.format(provider, message))
+    
+    if output_lines:
+        sys.stdout.write("\n".join(output_lines) + "\n")
     
     # Generate summary
-    total_servers = len(SMTP_SERVERS)
+    total_servers = len(servers)
     reachable_count = len(reachable)
     
-    summary = f"\nSMTP Connectivity Summary:\n"
-    summary += f"Reachable servers: {reachable_count}/{total_servers}\n"
+    parts = [f"\n{protocol} Connectivity Summary:\n"]
+    parts.append(f"Reachable servers: {reachable_count}/{total_servers}\n")
     
     if reachable:
-        summary += f"\n{Fore.GREEN}Reachable SMTP servers:{Fore.RESET}\n"
-        for provider in reachable:
-            hostname, port = SMTP_SERVERS[provider]
-            summary += f"  [OK] {provider} ({hostname}:{port})\n"
+        parts.append(f"\n{Fore.GREEN}Reachable {protocol} servers:{Fore.RESET}\n")
+        for provider, hostname, port in reachable:
+            parts.append(f"  [OK] {provider} ({hostname}:{port})\n")
     
     if unreachable:
-        summary += f"\n{Fore.RED}Unreachable SMTP servers:{Fore.RESET}\n"
-        for provider, error in unreachable:
-            hostname, port = SMTP_SERVERS[provider]
+        parts.append(f"\n{Fore.RED}Unreachable {protocol} servers:{Fore.RESET}\n")
+        for provider, hostname, port, error in unreachable:
             status = "[TIMEOUT]" if "timeout" in error.lower() else "[FAIL]"
-            summary += f"  {status} {provider} ({hostname}:{port}) - {error}\n"
+            parts.append(f"  {status} {provider} ({hostname}:{port}) - {error}\n")
     
+    summary = "".join(parts)
     if not silent:
         print(summary)
     
+    return summary, reachable_count, total_servers
+
+
+def check_smtp_connectivity(silent: bool = False) -> str:
+    """
+    Test SMTP server connectivity for major email providers.
+    
+    Tests outbound email server connectivity by attempting socket connections
+    to major SMTP providers on secure port 587 (SMTP submission port).
+    
+    Args:
+        silent: Suppress console output if True
+        
+    Returns:
+        Formatted summary of SMTP connectivity test results
+    """
+    summary, _, _ = _check_connectivity("SMTP", SMTP_SERVERS, silent)
     return summary
 
 
@@ -140,52 +260,7 @@ def check_imap_connectivity(silent: bool = False) -> str:
     Returns:
         Formatted summary of IMAP connectivity test results
     """
-    if not silent:
-        print(f"{Fore.CYAN}Testing IMAP connectivity to major email providers...{Fore.RESET}")
-    
-    reachable = []
-    unreachable = []
-    
-    for provider, (hostname, port) in IMAP_SERVERS.items():
-        if not silent:
-            print(f"{Fore.YELLOW}Testing {provider} ({hostname}:{port})...{Fore.RESET}")
-        
-        success, message = _test_server_connectivity(hostname, port, timeout=10)
-        
-        if success:
-            reachable.append(provider)
-            if not silent:
-                print(f"{Fore.GREEN}[OK] {provider}: {message}{Fore.RESET}")
-        else:
-            unreachable.append((provider, message))
-            if not silent:
-                status_color = Fore.RED if "timeout" not in message.lower() else Fore.YELLOW
-                status_text = "[FAIL]" if "timeout" not in message.lower() else "[TIMEOUT]"
-                print(f"{status_color}{status_text} {provider}: {message}{Fore.RESET}")
-    
-    # Generate summary
-    total_servers = len(IMAP_SERVERS)
-    reachable_count = len(reachable)
-    
-    summary = f"\nIMAP Connectivity Summary:\n"
-    summary += f"Reachable servers: {reachable_count}/{total_servers}\n"
-    
-    if reachable:
-        summary += f"\n{Fore.GREEN}Reachable IMAP servers:{Fore.RESET}\n"
-        for provider in reachable:
-            hostname, port = IMAP_SERVERS[provider]
-            summary += f"  [OK] {provider} ({hostname}:{port})\n"
-    
-    if unreachable:
-        summary += f"\n{Fore.RED}Unreachable IMAP servers:{Fore.RESET}\n"
-        for provider, error in unreachable:
-            hostname, port = IMAP_SERVERS[provider]
-            status = "[TIMEOUT]" if "timeout" in error.lower() else "[FAIL]"
-            summary += f"  {status} {provider} ({hostname}:{port}) - {error}\n"
-    
-    if not silent:
-        print(summary)
-    
+    summary, _, _ = _check_connectivity("IMAP", IMAP_SERVERS, silent)
     return summary
 
 
@@ -206,32 +281,32 @@ def check_all_email_services(silent: bool = False) -> str:
         print(f"{Fore.CYAN}Comprehensive Email Infrastructure Assessment{Fore.RESET}")
         print(f"{Fore.CYAN}Testing both SMTP and IMAP connectivity...{Fore.RESET}\n")
     
-    # Run both tests with silent mode to control output
-    smtp_summary = check_smtp_connectivity(silent=True)
+    # Probe SMTP and IMAP servers in one fan-out, then split the results
+    probe_results = _probe_servers(SMTP_SERVERS + IMAP_SERVERS)
+    smtp_results = probe_results[:len(SMTP_SERVERS)]
+    imap_results = probe_results[len(SMTP_SERVERS):]
+    
+    # Build both summaries with silent mode to control output
+    smtp_summary, smtp_reachable, total_smtp = _check_connectivity("SMTP", SMTP_SERVERS, True, smtp_results)
+    imap_summary, imap_reachable, total_imap = _check_connectivity("IMAP", IMAP_SERVERS, True, imap_results)
     if not silent:
         print()  # Add spacing between tests
-    imap_summary = check_imap_connectivity(silent=True)
     
     # Generate unified summary
-    smtp_reachable = len([line for line in smtp_summary.split('\n') if '[OK]' in line and 'SMTP' not in line])
-    imap_reachable = len([line for line in imap_summary.split('\n') if '[OK]' in line and 'IMAP' not in line])
-    
-    total_smtp = len(SMTP_SERVERS)
-    total_imap = len(IMAP_SERVERS)
     total_servers = total_smtp + total_imap
     total_reachable = smtp_reachable + imap_reachable
     
-    unified_summary = f"\n{Fore.CYAN}Email Infrastructure Assessment Summary:{Fore.RESET}\n"
-    unified_summary += f"Total email servers tested: {total_servers} (SMTP: {total_smtp}, IMAP: {total_imap})\n"
-    unified_summary += f"Total reachable servers: {total_reachable}/{total_servers}\n"
-    unified_summary += f"SMTP servers reachable: {smtp_reachable}/{total_smtp}\n"
-    unified_summary += f"IMAP servers reachable: {imap_reachable}/{total_imap}\n"
+    parts = [f"\n{Fore.CYAN}Email Infrastructure Assessment Summary:{Fore.RESET}\n"]
+    parts.append(f"Total email servers tested: {total_servers} (SMTP: {total_smtp}, IMAP: {total_imap})\n")
+    parts.append(f"Total reachable servers: {total_reachable}/{total_servers}\n")
+    parts.append(f"SMTP servers reachable: {smtp_reachable}/{total_smtp}\n")
+    parts.append(f"IMAP servers reachable: {imap_reachable}/{total_imap}\n")
     
     # Add detailed results from individual tests
-    unified_summary += f"\n{'-' * 50}\n"
-    unified_summary += smtp_summary
-    unified_summary += f"\n{'-' * 50}\n"
-    unified_summary += imap_summary
+    parts.append(f"\n{'-' * 50}\n")
+    parts.append(smtp_summary)
+    parts.append(f"\n{'-' * 50}\n")
+    parts.append(imap_summary)
     
     # Overall status assessment
     if total_reachable == total_servers:
@@ -243,9 +318,10 @@ def check_all_email_services(silent: bool = False) -> str:
     else:
         status_msg = f"{Fore.RED}[POOR] Significant email connectivity problems{Fore.RESET}"
     
-    unified_summary += f"\n{'-' * 50}\n"
-    unified_summary += f"Overall Email Infrastructure Status: {status_msg}\n"
+    parts.append(f"\n{'-' * 50}\n")
+    parts.append(f"Overall Email Infrastructure Status: {status_msg}\n")
     
+    unified_summary = "".join(parts)
     if not silent:
         print(unified_summary)
     
@@ -6,25 +6,407 @@ Tests HTTP/HTTPS connectivity to assess network infrastructure and routing chara
 Part of the instability.py v3 network diagnostics suite.
 """
 
+import copy
 import requests
+import socket
+import ssl
+import sys
+import threading
 import time
 import urllib3
+from urllib.parse import urlsplit
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, Final, List, Any, Literal, Optional, Tuple
 from colorama import Fore
 
 # Import standardized tool result functions
 from utils import create_success_result, create_error_result
+from config import CACHE_CONFIG, DISPLAY_CONFIG, IXP_MAX_PARALLEL_CHECKS, IXP_PREWARM_ON_IMPORT
 
 # Major internet exchange points to monitor
-IXP_ENDPOINTS: Dict[str, str] = {
-    "DE-CIX Frankfurt": "https://www.de-cix.net/",
-    "LINX London": "https://www.linx.net/", 
-    "AMS-IX Amsterdam": "https://www.ams-ix.net/",
-    "NYIIX New York": "https://www.nyiix.net/",
-    "HKIX Hong Kong": "https://www.hkix.net/",
-    "Equinix Global": "https://status.equinix.com/"
+IXP_ENDPOINTS: Final[Tuple[Tuple[str, str], ...]] = (
+    ("DE-CIX Frankfurt", "https://www.de-cix.net/"),
+    ("LINX London", "https://www.linx.net/"),
+    ("AMS-IX Amsterdam", "https://www.ams-ix.net/"),
+    ("NYIIX New York", "https://www.nyiix.net/"),
+    ("HKIX Hong Kong", "https://www.hkix.net/"),
+    ("Equinix Global", "https://status.equinix.com/")
+)
+
+# Name to URL lookup for callers that need one
+IXP_ENDPOINT_MAP: Final[Dict[str, str]] = dict(IXP_ENDPOINTS)
+
+DEFAULT_USER_AGENT = "InstabilityIXP/1.0"
+
+# Any of these proves the TCP, TLS and HTTP round trip completed; some
+# sites answer HEAD with 403 even though they are up
+REACHABLE_STATUS_CODES = frozenset({200, 301, 302, 403})
+
+# Seconds to wait before each retry; retries past the end reuse the last value
+_BACKOFF_SCHEDULE = (1, 2, 4, 8, 16)
+
+# Server errors worth retrying; any other status is reported as-is
+RETRY_STATUS_CODES = (500, 502, 503, 504)
+
+# Anycast addresses that answer on 443 from almost any network; if none of
+# them accepts a TCP connection there is no point probing the IXPs
+UPSTREAM_CHECK_ADDRESSES = (("1.1.1.1", 443), ("8.8.8.8", 443))
+UPSTREAM_CHECK_TIMEOUT = 2
+NO_UPSTREAM_ERROR = "No upstream connectivity"
+
+# Console colors, resolved once. Left empty when color output is disabled
+# or stdout is not a terminal, so piped and captured output stays plain
+_USE_COLOR = DISPLAY_CONFIG["color_output"] and bool(getattr(sys.stdout, "isatty", lambda: False)())
+_CYAN, _GREEN, _YELLOW, _RED, _RESET = (
+    (Fore.CYAN, Fore.GREEN, Fore.YELLOW, Fore.RED, Fore.RESET) if _USE_COLOR else ("",) * 5
+)
+_OK_TAG = f"{_GREEN}[OK]"
+_FAIL_TAG = f"{_RED}[FAIL]"
+_TIMEOUT_TAG = f"{_YELLOW}[TIMEOUT]"
+
+# Percentage of reachable IXPs needed for a "good" and a "partial" grade
+GOOD_REACHABILITY_PERCENT = 80
+PARTIAL_REACHABILITY_PERCENT = 50
+
+# (status, console message) for each grade
+_GRADE_EXCELLENT = ("success", f"{_GREEN}[EXCELLENT] All IXPs are reachable{_RESET}")
+_GRADE_GOOD = ("success", f"{_GREEN}[GOOD] Most IXPs are reachable{_RESET}")
+_GRADE_PARTIAL = ("partial", f"{_YELLOW}[PARTIAL] Some IXP connectivity issues detected{_RESET}")
+_GRADE_POOR = ("error", f"{_RED}[POOR] Significant IXP connectivity problems{_RESET}")
+
+BURP_PROXY_ADDRESS = ("localhost", 8080)
+BURP_PROXIES = {
+    "http": "http://localhost:8080",
+    "https": "http://localhost:8080"
 }
+BURP_CHECK_TIMEOUT = 0.5
+BURP_UNREACHABLE_ERROR = "Burp proxy not listening on localhost:8080"
+
+# Address lookups for IXP hostnames, keyed by (host, port) and stored as
+# (expiry on the monotonic clock, addresses in resolver order). Only the IXP
+# sessions' own connections read it (see _CachedAddressMixin); the rest of the
+# process keeps using the system resolver. Failed lookups are not cached.
+_IXP_HOSTS = frozenset(urlsplit(url).hostname for _, url in IXP_ENDPOINTS)
+_ADDRINFO_CACHE: Dict[Tuple[str, int], Tuple[float, List[str]]] = {}
+_ADDRINFO_CACHE_LOCK = threading.Lock()
+ADDRINFO_CACHE_TTL = CACHE_CONFIG["dns_cache_ttl_seconds"]
+
+
+def _ixp_addresses(host: str, port: int) -> Optional[List[str]]:
+    """
+    Get the addresses to try for an IXP host, resolving at most once per TTL.
+    
+    Returns:
+        Addresses in resolver order, or None if host is not an IXP host or
+        does not resolve (the caller then connects as usual and reports it)
+    """
+    if host not in _IXP_HOSTS:
+        return None
+    
+    key = (host, port)
+    now = time.monotonic()
+    with _ADDRINFO_CACHE_LOCK:
+        entry = _ADDRINFO_CACHE.get(key)
+    if entry is not None and now < entry[0]:
+        return list(entry[1])
+    
+    try:
+        addrinfo = socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)
+    except OSError:
+        return None
+    addresses = list(dict.fromkeys(sockaddr[0] for *_, sockaddr in addrinfo))
+    with _ADDRINFO_CACHE_LOCK:
+        _ADDRINFO_CACHE[key] = (now + ADDRINFO_CACHE_TTL, addresses)
+    return list(addresses)
+
+
+def clear_ixp_dns_cache() -> None:
+    """Drop every cached IXP address lookup."""
+    with _ADDRINFO_CACHE_LOCK:
+        _ADDRINFO_CACHE.clear()
+
+
+class _CachedAddressMixin:
+    """urllib3 connection that reaches IXP hosts through the IXP address cache.
+    
+    Each cached address is tried in turn, as urllib3 does with a fresh
+    lookup. The hostname is restored before TLS, so SNI and certificate
+    checks still use the name.
+    """
+    
+    def _new_conn(self):
+        hostname = self._dns_host
+        addresses = _ixp_addresses(hostname, self.port)
+        if not addresses:
+            return super()._new_conn()
+        
+        last_error = None
+        try:
+            for address in addresses:
+                self._dns_host = address
+                try:
+                    return super()._new_conn()
+                except urllib3.exceptions.ConnectTimeoutError as connect_error:
+                    # Also covers NewConnectionError (refused, unreachable)
+                    last_error = connect_error
+        finally:
+            self._dns_host = hostname
+        raise last_error
+
+
+class _CachedHTTPConnection(_CachedAddressMixin, urllib3.connection.HTTPConnection):
+    pass
+
+
+class _CachedHTTPSConnection(_CachedAddressMixin, urllib3.connection.HTTPSConnection):
+    pass
+
+
+class _CachedHTTPConnectionPool(urllib3.HTTPConnectionPool):
+    ConnectionCls = _CachedHTTPConnection
+
+
+class _CachedHTTPSConnectionPool(urllib3.HTTPSConnectionPool):
+    ConnectionCls = _CachedHTTPSConnection
+
+
+_CACHED_POOL_CLASSES = {"http": _CachedHTTPConnectionPool, "https": _CachedHTTPSConnectionPool}
+
+# Most recent resumable TLS session per server hostname. A new connection
+# to a host that has been seen before (e.g. a retry after the server closed
+# the socket) offers this session and completes an abbreviated handshake.
+_TLS_SESSIONS: Dict[str, ssl.SSLSession] = {}
+
+
+def _remember_tls_session(sock: ssl.SSLSocket) -> None:
+    """Save the socket's TLS session if the server issued a resumption ticket."""
+    try:
+        session = sock.session
+    except (OSError, ValueError):
+        return
+    if session is not None and session.has_ticket and sock.server_hostname:
+        _TLS_SESSIONS[sock.server_hostname] = session
+
+
+class _ResumableSSLSocket(ssl.SSLSocket):
+    """SSLSocket that saves its session before closing.
+    
+    TLS 1.3 servers send tickets after the handshake, so the session is
+    only worth keeping once the connection has been used.
+    """
+    
+    def close(self) -> None:
+        _remember_tls_session(self)
+        super().close()
+
+
+class _ResumableSSLContext(ssl.SSLContext):
+    """SSLContext that offers the saved session for the server being connected to."""
+    
+    sslsocket_class = _ResumableSSLSocket
+    
+    def wrap_socket(self, sock, server_side=False, do_handshake_on_connect=True,
+                    suppress_ragged_eofs=True, server_hostname=None, session=None):
+        if session is None and server_hostname:
+            session = _TLS_SESSIONS.get(server_hostname)
+        ssl_sock = super().wrap_socket(
+            sock,
+            server_side=server_side,
+            do_handshake_on_connect=do_handshake_on_connect,
+            suppress_ragged_eofs=suppress_ragged_eofs,
+            server_hostname=server_hostname,
+            session=session
+        )
+        _remember_tls_session(ssl_sock)
+        return ssl_sock
+
+
+def _create_tls_context() -> ssl.SSLContext:
+    """Create the verifying TLS context shared by IXP probes, with tickets enabled."""
+    context = _ResumableSSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    context.load_verify_locations(requests.certs.where())
+    context.options &= ~ssl.OP_NO_TICKET
+    return context
+
+
+class _TLSResumptionAdapter(HTTPAdapter):
+    """HTTPAdapter that uses the shared resumable TLS context for verified requests.
+    
+    Requests with verify=False or a custom CA bundle (e.g. REQUESTS_CA_BUNDLE)
+    keep urllib3's per-pool context, because urllib3 sets verify_mode and CA
+    locations on whichever context it is given and the shared one must stay
+    verifying against the default bundle.
+    
+    Direct connections also go through the IXP address cache.
+    """
+    
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = _CACHED_POOL_CLASSES
+    
+    def build_connection_pool_key_attributes(self, request, verify, cert=None):
+        host_params, pool_kwargs = super().build_connection_pool_key_attributes(request, verify, cert)
+        if verify is True:
+            pool_kwargs["ssl_context"] = _TLS_CONTEXT
+        return host_params, pool_kwargs
+
+
+_TLS_CONTEXT = _create_tls_context()
+
+class _ScheduledRetry(Retry):
+    """urllib3 Retry that waits according to _BACKOFF_SCHEDULE between attempts.
+    
+    A server's Retry-After is honoured only up to the longest scheduled wait,
+    so one 429 or 503 cannot hold a probe thread indefinitely.
+    """
+    
+    def get_backoff_time(self) -> float:
+        attempt = len(self.history)
+        if attempt == 0:
+            return 0.0
+        return float(_BACKOFF_SCHEDULE[min(attempt, len(_BACKOFF_SCHEDULE)) - 1])
+    
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, float(_BACKOFF_SCHEDULE[-1]))
+
+
+def _create_session(retries: int) -> requests.Session:
+    """
+    Create an HTTP session whose adapters retry failed requests in urllib3.
+    
+    Args:
+        retries: Number of retries after the first attempt
+        
+    Returns:
+        Session with pooled, TLS-resuming adapters mounted for http and https
+    """
+    retry = _ScheduledRetry(
+        total=retries,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset(["GET", "HEAD"]),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    session = requests.Session()
+    session.headers.update({"User-Agent": DEFAULT_USER_AGENT})
+    for prefix in ("http://", "https://"):
+        session.mount(prefix, _TLSResumptionAdapter(
+            pool_connections=len(IXP_ENDPOINTS),
+            pool_maxsize=len(IXP_ENDPOINTS) * 2,
+            max_retries=retry
+        ))
+    return session
+
+
+# One session per retry count, shared by every probe using it, so keep-alive
+# connections (and their completed TLS handshakes) are reused across retries
+# and repeated runs. Per-call options are passed to the request rather than
+# set on the session.
+_SESSIONS: Dict[int, requests.Session] = {}
+_SESSIONS_LOCK = threading.Lock()
+
+# monitor_ixp_connectivity() results keyed by the probe options, stored as
+# (monotonic time of the run, result dict)
+_IXP_RESULT_CACHE: Dict[Tuple[Any, ...], Tuple[float, Dict[str, Any]]] = {}
+_IXP_RESULT_CACHE_LOCK = threading.Lock()
+_IXP_REFRESHING = set()
+IXP_RESULT_TTL = CACHE_CONFIG["ixp_result_ttl_seconds"]
+IXP_RESULT_MAX_STALE = CACHE_CONFIG["ixp_result_max_stale_seconds"]
+
+
+def _get_session(retries: int) -> requests.Session:
+    """Return the shared session for a retry count, creating it on first use."""
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.get(retries)
+        if session is None:
+            session = _SESSIONS[retries] = _create_session(retries)
+    return session
+
+
+def _retries_used(response: requests.Response) -> int:
+    """Count the retries urllib3 made before returning a response."""
+    retry = getattr(response.raw, "retries", None)
+    return len(retry.history) if retry is not None else 0
+
+
+def _upstream_reachable() -> bool:
+    """
+    Return True if any UPSTREAM_CHECK_ADDRESSES accepts a TCP connection.
+    
+    The addresses are tried in parallel and the first success wins, so the
+    check costs at most one UPSTREAM_CHECK_TIMEOUT. When the environment
+    configures a proxy for the IXP URLs, direct connections say nothing
+    about whether the probes will work, so the check is skipped.
+    """
+    if any(requests.utils.get_environ_proxies(url) for _, url in IXP_ENDPOINTS):
+        return True
+    
+    executor = ThreadPoolExecutor(max_workers=len(UPSTREAM_CHECK_ADDRESSES))
+    
+    def connect(address: Tuple[str, int]) -> bool:
+        try:
+            socket.create_connection(address, timeout=UPSTREAM_CHECK_TIMEOUT).close()
+            return True
+        except OSError:
+            return False
+    
+    try:
+        futures = [executor.submit(connect, address) for address in UPSTREAM_CHECK_ADDRESSES]
+        return any(future.result() for future in as_completed(futures))
+    finally:
+        executor.shutdown(wait=False)
+
+
+def _burp_listening() -> bool:
+    """Return True if something accepts TCP connections on BURP_PROXY_ADDRESS."""
+    try:
+        socket.create_connection(BURP_PROXY_ADDRESS, timeout=BURP_CHECK_TIMEOUT).close()
+        return True
+    except OSError:
+        return False
+
+
+def prewarm_ixp_connections(timeout: int = 5) -> None:
+    """
+    Open connections to every IXP ahead of the first probe.
+    
+    Fills the default session's connection pool, the IXP address cache and
+    the TLS session cache, so the first monitor_ixp_connectivity() run does
+    not pay for DNS lookups and full handshakes. Failures are ignored; the
+    real probe reports them.
+    
+    Args:
+        timeout: Per-request timeout in seconds
+    """
+    session = _get_session(3)
+    for _, url in IXP_ENDPOINTS:
+        try:
+            session.head(url, timeout=timeout).close()
+        except requests.exceptions.RequestException:
+            pass
+
+
+# Why a probe failed, decided when the failure is caught
+ErrorKind = Literal["timeout", "conn", "ssl", "proxy", "http", "other"]
+
+
+@dataclass(slots=True)
+class IXPResult:
+    """Outcome of probing one IXP endpoint"""
+    name: str
+    url: str
+    response_time: Optional[float] = None
+    status_code: Optional[int] = None
+    error: Optional[str] = None
+    error_kind: Optional[ErrorKind] = None
+    retry_attempts: int = 0
 
 
 def _test_ixp_connectivity(
@@ -35,8 +417,9 @@ def _test_ixp_connectivity(
     user_agent: Optional[str] = None,
     insecure: bool = False,
     burp: bool = False,
-    silent: bool = False
-) -> Tuple[bool, Dict[str, Any]]:
+    silent: bool = False,
+    output_lines: Optional[List[str]] = None
+) -> Tuple[bool, IXPResult]:
     """
     Test HTTP connectivity to a specific IXP endpoint with retry logic.
     
@@ -49,135 +432,186 @@ def _test_ixp_connectivity(
         insecure: Disable SSL certificate verification
         burp: Route through Burp Suite proxy
         silent: Suppress console output
+        output_lines: Collect progress lines here instead of printing them,
+            so concurrent probes do not interleave their output
         
     Returns:
-        Tuple of (success, result_dict)
+        Tuple of (success, IXPResult)
     """
-    result = {
-        "name": name,
-        "url": url,
-        "response_time": None,
-        "status_code": None,
-        "error": None,
-        "retry_attempts": 0
-    }
+    emit = print if output_lines is None else output_lines.append
     
-    # Configure session
-    session = requests.Session()
+    result = IXPResult(name=name, url=url)
+    
+    # Per-call request options; the shared session itself is never modified
+    request_kwargs = {"timeout": timeout}
     
-    # Set User-Agent
     if user_agent:
-        session.headers.update({"User-Agent": user_agent})
-    else:
-        session.headers.update({"User-Agent": "InstabilityIXP/1.0"})
+        request_kwargs["headers"] = {"User-Agent": user_agent}
     
-    # Configure SSL verification
     if insecure:
-        session.verify = False
+        request_kwargs["verify"] = False
         urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
     
-    # Configure Burp proxy
     if burp:
-        session.proxies = {
-            "http": "http://localhost:8080",
-            "https": "http://localhost:8080"
-        }
+        request_kwargs["proxies"] = BURP_PROXIES
     
-    # Retry logic with exponential backoff
-    for attempt in range(retries + 1):
-        result["retry_attempts"] = attempt
+    # urllib3 retries connection failures and 5xx answers inside one call
+    session = _get_session(retries)
+    response = None
+    try:
+        start_time = time.monotonic()
+        # Only the status code matters, so skip the page body. Servers
+        # that reject HEAD get a streamed GET, which returns as soon as
+        # the headers arrive and is closed before the body is read
+        response = session.head(url, allow_redirects=True, **request_kwargs)
+        if response.status_code == 405:
+            result.retry_attempts = _retries_used(response)
+            response.close()
+            response = session.get(url, stream=True, **request_kwargs)
+        elapsed_ms = (time.monotonic() - start_time) * 1000.0
         
-        if not silent and attempt > 0:
-            backoff = 2 ** (attempt - 1)
-            print(f"{Fore.YELLOW}  Retry {attempt}/{retries} for {name} (backoff: {backoff}s){Fore.RESET}")
-            time.sleep(backoff)
+        result.response_time = round(elapsed_ms, 2)
+        result.status_code = response.status_code
+        result.retry_attempts += _retries_used(response)
         
-        try:
-            start_time = time.time()
-            response = session.get(url, timeout=timeout)
-            end_time = time.time()
-            
-            result["response_time"] = round((end_time - start_time) * 1000, 2)
-            result["status_code"] = response.status_code
-            
-            if response.status_code == 200:
-                return True, result
-            else:
-                result["error"] = f"HTTP {response.status_code}"
-                if not silent:
-                    print(f"{Fore.RED}  HTTP {response.status_code} for {name}{Fore.RESET}")
-        
-        except requests.exceptions.Timeout:
-            result["error"] = "Connection timeout"
-            if not silent:
-                print(f"{Fore.YELLOW}  Timeout for {name} (attempt {attempt + 1}){Fore.RESET}")
-        
-        except requests.exceptions.ConnectionError as e:
-            result["error"] = f"Connection failed: {str(e)}"
-            if not silent:
-                print(f"{Fore.RED}  Connection failed for {name}: {str(e)}{Fore.RESET}")
+        if not silent and result.retry_attempts:
+            emit(f"{_YELLOW}  {name} answered after {result.retry_attempts}/{retries} retries{_RESET}")
         
-        except requests.exceptions.SSLError as e:
-            result["error"] = f"SSL certificate error: {str(e)}"
-            if not silent:
-                print(f"{Fore.RED}  SSL error for {name}: {str(e)}{Fore.RESET}")
+        if response.status_code in REACHABLE_STATUS_CODES:
+            return True, result
         
-        except requests.exceptions.ProxyError as e:
-            result["error"] = f"Proxy connection failed: {str(e)}"
-            if not silent:
-                print(f"{Fore.RED}  Proxy error for {name}: {str(e)}{Fore.RESET}")
-        
-        except Exception as e:
-            result["error"] = f"Unexpected error: {str(e)}"
-            if not silent:
-                print(f"{Fore.RED}  Error for {name}: {str(e)}{Fore.RESET}")
+        result.error = f"HTTP {response.status_code}"
+        result.error_kind = "http"
+        if not silent:
+            emit(f"{_RED}  HTTP {response.status_code} for {name}{_RESET}")
+    
+    except requests.exceptions.Timeout:
+        result.error = "Connection timeout"
+        result.error_kind = "timeout"
+        result.retry_attempts = retries
+        if not silent:
+            emit(f"{_YELLOW}  Timeout for {name} after {retries} retries{_RESET}")
+    
+    except requests.exceptions.SSLError as e:
+        result.error = f"SSL certificate error: {str(e)}"
+        result.error_kind = "ssl"
+        result.retry_attempts = retries
+        if not silent:
+            emit(f"{_RED}  SSL error for {name}: {str(e)}{_RESET}")
+    
+    except requests.exceptions.ProxyError as e:
+        result.error = f"Proxy connection failed: {str(e)}"
+        result.error_kind = "proxy"
+        result.retry_attempts = retries
+        if not silent:
+            emit(f"{_RED}  Proxy error for {name}: {str(e)}{_RESET}")
+    
+    except requests.exceptions.ConnectionError as e:
+        result.error = f"Connection failed: {str(e)}"
+        # Read timeouts that exhaust the retries surface as a ConnectionError
+        # wrapping urllib3's MaxRetryError. NewConnectionError subclasses
+        # urllib3's ConnectTimeoutError but means the connect was refused
+        reason = getattr(e.args[0], "reason", None) if e.args else None
+        timed_out = (isinstance(reason, urllib3.exceptions.TimeoutError)
+                     and not isinstance(reason, urllib3.exceptions.NewConnectionError))
+        result.error_kind = "timeout" if timed_out else "conn"
+        result.retry_attempts = retries
+        if not silent:
+            emit(f"{_RED}  Connection failed for {name}: {str(e)}{_RESET}")
+    
+    except Exception as e:
+        result.error = f"Unexpected error: {str(e)}"
+        result.error_kind = "other"
+        if not silent:
+            emit(f"{_RED}  Error for {name}: {str(e)}{_RESET}")
+    
+    finally:
+        if response is not None:
+            response.close()
     
     return False, result
 
 
-def monitor_ixp_connectivity(
-    silent: bool = False,
-    timeout: int = 15,
-    retries: int = 3,
-    user_agent: Optional[str] = None,
-    insecure: bool = False,
-    burp: bool = False
-) -> Dict[str, Any]:
+def _overall_status(successful: int, total_tested: int) -> Tuple[str, str]:
     """
-    Monitor connectivity to major internet exchange points worldwide.
-    
-    Tests HTTP/HTTPS connectivity to major global IXPs to assess network
-    infrastructure health and routing characteristics for penetration testing
-    and network reconnaissance activities.
+    Grade IXP reachability.
     
     Args:
-        silent: Suppress verbose console output
-        timeout: Connection timeout in seconds
-        retries: Number of retry attempts for failed connections  
-        user_agent: Custom User-Agent header for HTTP requests
-        insecure: Disable SSL certificate verification
-        burp: Route traffic through Burp Suite proxy
+        successful: Number of reachable IXPs
+        total_tested: Number of IXPs probed
         
     Returns:
-        Dictionary containing connectivity results and summary statistics
+        Tuple of (status, colored status message)
     """
+    # Compare in whole percentages so the grade never depends on float rounding
+    successful_percent = successful * 100
+    
+    if successful == total_tested:
+        return _GRADE_EXCELLENT
+    elif successful_percent >= total_tested * GOOD_REACHABILITY_PERCENT:
+        return _GRADE_GOOD
+    elif successful_percent >= total_tested * PARTIAL_REACHABILITY_PERCENT:
+        return _GRADE_PARTIAL
+    else:
+        return _GRADE_POOR
+
+
+def _format_ixp_summary(result: Dict[str, Any]) -> List[str]:
+    """Build the summary section lines for a monitor_ixp_connectivity() result."""
+    summary = result["summary"]
+    total_tested = summary["total_tested"]
+    _, status_msg = _overall_status(summary["successful"], total_tested)
+    
+    lines = [
+        f"\n{_CYAN}IXP Connectivity Summary:{_RESET}",
+        f"Total IXPs tested: {total_tested}",
+        f"Successful connections: {summary['successful']}/{total_tested}",
+        f"Failed connections: {summary['failed']}/{total_tested}",
+        f"Success rate: {summary['success_rate']}%",
+        f"\nOverall status: {status_msg}"
+    ]
+    
+    if result["reachable_ixps"]:
+        lines.append(f"\n{_GREEN}Reachable IXPs:{_RESET}")
+        for ixp in result["reachable_ixps"]:
+            lines.append(f"  [OK] {ixp['name']} - {ixp['response_time']}ms")
+    
+    if result["unreachable_ixps"]:
+        lines.append(f"\n{_RED}Unreachable IXPs:{_RESET}")
+        for ixp in result["unreachable_ixps"]:
+            status_text = "[TIMEOUT]" if ixp["error_kind"] == "timeout" else "[FAIL]"
+            lines.append(f"  {status_text} {ixp['name']} - {ixp['error']} (after {ixp['retry_attempts']} retries)")
+    
+    return lines
+
+
+def _run_ixp_checks(
+    silent: bool,
+    timeout: int,
+    retries: int,
+    user_agent: Optional[str],
+    insecure: bool,
+    burp: bool
+) -> Dict[str, Any]:
+    """Probe every IXP and build a monitor_ixp_connectivity() result."""
+    # Console output is assembled into lists and written in one call per
+    # section, which also keeps the report in one piece
     if not silent:
-        print(f"{Fore.CYAN}Internet Exchange Point Connectivity Assessment{Fore.RESET}")
-        print(f"{Fore.CYAN}Testing connectivity to {len(IXP_ENDPOINTS)} major IXPs worldwide...{Fore.RESET}\n")
-        
+        header = [
+            f"{_CYAN}Internet Exchange Point Connectivity Assessment{_RESET}",
+            f"{_CYAN}Testing connectivity to {len(IXP_ENDPOINTS)} major IXPs worldwide...{_RESET}\n"
+        ]
         if insecure:
-            print(f"{Fore.YELLOW}Warning: SSL certificate verification disabled{Fore.RESET}")
+            header.append(f"{_YELLOW}Warning: SSL certificate verification disabled{_RESET}")
         if burp:
-            print(f"{Fore.YELLOW}Info: Routing traffic through Burp Suite proxy (localhost:8080){Fore.RESET}")
-    
-    reachable_ixps = []
-    unreachable_ixps = []
+            header.append(f"{_YELLOW}Info: Routing traffic through Burp Suite proxy (localhost:8080){_RESET}")
+        sys.stdout.write("\n".join(header) + "\n")
+        sys.stdout.flush()
     
-    # Test each IXP
-    for name, url in IXP_ENDPOINTS.items():
-        if not silent:
-            print(f"{Fore.YELLOW}Testing {name} ({url})...{Fore.RESET}")
-        
+    # Probe the IXPs concurrently; each probe is an independent network wait.
+    # The worker cap keeps thread count bounded if the endpoint list grows
+    def probe(name: str, url: str) -> Tuple[bool, IXPResult, List[str]]:
+        lines = []
         success, result = _test_ixp_connectivity(
             name=name,
             url=url,
@@ -186,46 +620,65 @@ def monitor_ixp_connectivity(
             user_agent=user_agent,
             insecure=insecure,
             burp=burp,
-            silent=silent
+            silent=silent,
+            output_lines=lines
         )
-        
-        if success:
-            reachable_ixps.append(result)
-            if not silent:
-                print(f"{Fore.GREEN}[OK] {name}: {result['response_time']}ms (HTTP {result['status_code']}){Fore.RESET}")
-        else:
-            unreachable_ixps.append(result)
-            if not silent:
-                status = "[TIMEOUT]" if "timeout" in result["error"].lower() else "[FAIL]"
-                color = Fore.YELLOW if "timeout" in result["error"].lower() else Fore.RED
-                print(f"{color}{status} {name}: {result['error']}{Fore.RESET}")
+        return success, result, lines
     
-    # Calculate summary statistics
-    total_tested = len(IXP_ENDPOINTS)
-    successful = len(reachable_ixps)
-    failed = len(unreachable_ixps)
-    success_rate = round((successful / total_tested) * 100, 1) if total_tested > 0 else 0.0
+    # Without a route out (or a listening proxy), every probe would run
+    # through all its retries and timeouts; report them all unreachable at
+    # once instead. Proxied runs only need the proxy to be up. A dead proxy
+    # is reported rather than bypassed, since the caller asked for the
+    # traffic to go through it
+    failure = None
+    if burp:
+        if not _burp_listening():
+            failure = (BURP_UNREACHABLE_ERROR, "proxy")
+    elif not _upstream_reachable():
+        failure = (NO_UPSTREAM_ERROR, "conn")
     
-    # Determine overall status
-    if successful == total_tested:
-        status = "success"
-        status_msg = f"{Fore.GREEN}[EXCELLENT] All IXPs are reachable{Fore.RESET}"
-    elif successful >= total_tested * 0.8:
-        status = "success"
-        status_msg = f"{Fore.GREEN}[GOOD] Most IXPs are reachable{Fore.RESET}"
-    elif successful >= total_tested * 0.5:
-        status = "partial"
-        status_msg = f"{Fore.YELLOW}[PARTIAL] Some IXP connectivity issues detected{Fore.RESET}"
+    if failure is not None:
+        error, error_kind = failure
+        probe_results = [
+            (False, IXPResult(name=name, url=url, error=error, error_kind=error_kind), [])
+            for name, url in IXP_ENDPOINTS
+        ]
     else:
-        status = "error"
-        status_msg = f"{Fore.RED}[POOR] Significant IXP connectivity problems{Fore.RESET}"
+        with ThreadPoolExecutor(max_workers=min(IXP_MAX_PARALLEL_CHECKS, len(IXP_ENDPOINTS))) as executor:
+            futures = [executor.submit(probe, name, url) for name, url in IXP_ENDPOINTS]
+            probe_results = [future.result() for future in futures]
+    
+    successes = [success for success, _, _ in probe_results]
+    results = [result for _, result, _ in probe_results]
+    
+    # Report in endpoint order once every probe has finished
+    report = []
+    if not silent:
+        for success, result, lines in probe_results:
+            report.append(f"{_YELLOW}Testing {result.name} ({result.url})...{_RESET}")
+            report.extend(lines)
+            
+            if success:
+                report.append(f"{_OK_TAG} {result.name}: {result.response_time}ms (HTTP {result.status_code}){_RESET}")
+            else:
+                tag = _TIMEOUT_TAG if result.error_kind == "timeout" else _FAIL_TAG
+                report.append(f"{tag} {result.name}: {result.error}{_RESET}")
+    
+    # Calculate summary statistics
+    total_tested = len(results)
+    successful = sum(successes)
+    failed = total_tested - successful
+    # Percentage to one decimal place, rounded half up in integer arithmetic
+    success_rate = ((successful * 2000 // total_tested + 1) // 2) / 10 if total_tested > 0 else 0.0
+    
+    status, _ = _overall_status(successful, total_tested)
     
     # Build result dictionary
     result = {
         "status": status,
         "timestamp": datetime.now().isoformat(),
-        "reachable_ixps": reachable_ixps,
-        "unreachable_ixps": unreachable_ixps,
+        "reachable_ixps": [asdict(r) for r, ok in zip(results, successes) if ok],
+        "unreachable_ixps": [asdict(r) for r, ok in zip(results, successes) if not ok],
         "summary": {
             "total_tested": total_tested,
             "successful": successful,
@@ -234,26 +687,98 @@ def monitor_ixp_connectivity(
         }
     }
     
-    # Display summary
     if not silent:
-        print(f"\n{Fore.CYAN}IXP Connectivity Summary:{Fore.RESET}")
-        print(f"Total IXPs tested: {total_tested}")
-        print(f"Successful connections: {successful}/{total_tested}")
-        print(f"Failed connections: {failed}/{total_tested}")
-        print(f"Success rate: {success_rate}%")
-        print(f"\nOverall status: {status_msg}")
+        report.extend(_format_ixp_summary(result))
+        sys.stdout.write("\n".join(report) + "\n")
+        sys.stdout.flush()
+    
+    return result
+
+
+def _refresh_ixp_result(key: Tuple[Any, ...]) -> None:
+    """Re-probe the IXPs for a cache key in the background and store the result."""
+    try:
+        result = _run_ixp_checks(True, *key)
+        with _IXP_RESULT_CACHE_LOCK:
+            _IXP_RESULT_CACHE[key] = (time.monotonic(), copy.deepcopy(result))
+    finally:
+        with _IXP_RESULT_CACHE_LOCK:
+            _IXP_REFRESHING.discard(key)
+
+
+def clear_ixp_result_cache() -> None:
+    """Drop every cached monitor_ixp_connectivity() result."""
+    with _IXP_RESULT_CACHE_LOCK:
+        _IXP_RESULT_CACHE.clear()
+
+
+def monitor_ixp_connectivity(
+    silent: bool = False,
+    timeout: int = 15,
+    retries: int = 3,
+    user_agent: Optional[str] = None,
+    insecure: bool = False,
+    burp: bool = False,
+    cache_ttl: int = IXP_RESULT_TTL
+) -> Dict[str, Any]:
+    """
+    Monitor connectivity to major internet exchange points worldwide.
+    
+    Tests HTTP/HTTPS connectivity to major global IXPs to assess network
+    infrastructure health and routing characteristics for penetration testing
+    and network reconnaissance activities.
+    
+    Results are reused for cache_ttl seconds for the same probe options.
+    A result that has expired but is less than IXP_RESULT_MAX_STALE seconds
+    past it is returned immediately while a background probe refreshes it.
+    Reused results carry cached=True, cache_age_seconds and stale, which is
+    True once they are past cache_ttl.
+    
+    Args:
+        silent: Suppress verbose console output
+        timeout: Connection timeout in seconds
+        retries: Number of retry attempts for failed connections  
+        user_agent: Custom User-Agent header for HTTP requests
+        insecure: Disable SSL certificate verification
+        burp: Route traffic through Burp Suite proxy
+        cache_ttl: Seconds a previous result stays fresh; 0 always probes
         
-        if reachable_ixps:
-            print(f"\n{Fore.GREEN}Reachable IXPs:{Fore.RESET}")
-            for ixp in reachable_ixps:
-                print(f"  [OK] {ixp['name']} - {ixp['response_time']}ms")
+    Returns:
+        Dictionary containing connectivity results and summary statistics
+    """
+    key = (timeout, retries, user_agent, insecure, burp)
+    
+    if cache_ttl > 0:
+        now = time.monotonic()
+        with _IXP_RESULT_CACHE_LOCK:
+            entry = _IXP_RESULT_CACHE.get(key)
+            age = now - entry[0] if entry is not None else None
+            stale = age is not None and age >= cache_ttl
+            if stale and age < cache_ttl + IXP_RESULT_MAX_STALE and key not in _IXP_REFRESHING:
+                _IXP_REFRESHING.add(key)
+                threading.Thread(target=_refresh_ixp_result, args=(key,), daemon=True).start()
         
-        if unreachable_ixps:
-            print(f"\n{Fore.RED}Unreachable IXPs:{Fore.RESET}")
-            for ixp in unreachable_ixps:
-                status_text = "[TIMEOUT]" if "timeout" in ixp["error"].lower() else "[FAIL]"
-                print(f"  {status_text} {ixp['name']} - {ixp['error']} (after {ixp['retry_attempts']} retries)")
+        if entry is not None and age < cache_ttl + IXP_RESULT_MAX_STALE:
+            result = copy.deepcopy(entry[1])
+            result["cached"] = True
+            result["stale"] = stale
+            result["cache_age_seconds"] = round(age, 1)
+            if not silent:
+                note = "refreshing in background" if stale else "cached"
+                lines = [
+                    f"{_CYAN}Internet Exchange Point Connectivity Assessment{_RESET}",
+                    f"{_YELLOW}Using results from {age:.0f}s ago ({note}){_RESET}"
+                ]
+                lines.extend(_format_ixp_summary(result))
+                sys.stdout.write("\n".join(lines) + "\n")
+                sys.stdout.flush()
+            return result
     
+    result = _run_ixp_checks(silent, timeout, retries, user_agent, insecure, burp)
+    with _IXP_RESULT_CACHE_LOCK:
+        _IXP_RESULT_CACHE[key] = (time.monotonic(), copy.deepcopy(result))
+    result["cached"] = False
+    result["stale"] = False
     return result
 
 
@@ -303,6 +828,11 @@ def get_module_tools():
                     ParameterType.BOOLEAN,
                     default=False,
                     description="Route traffic through Burp Suite proxy"
+                ),
+                "cache_ttl": ParameterInfo(
+                    ParameterType.INTEGER,
+                    default=IXP_RESULT_TTL,
+                    description="Seconds to reuse a previous result; 0 always probes"
                 )
             },
             aliases=["ixp_connectivity", "ixp_check", "exchange_points"],
@@ -313,4 +843,8 @@ def get_module_tools():
                 "monitor_ixp_connectivity --burp --user_agent \"CustomTool/1.0\""
             ]
         )
-    }
\ No newline at end of file
+    }
+
+
+if IXP_PREWARM_ON_IMPORT:
+    threading.Thread(target=prewarm_ixp_connections, name="ixp-prewarm", daemon=True).start()
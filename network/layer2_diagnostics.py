@@ -5,20 +5,203 @@ Provides OS detection, interface status, local IP detection,
 and basic network configuration information.
 """
 
+import asyncio
+import ctypes
+import errno
+import functools
 import os
 import sys
 import platform
 import socket
+import struct
 import subprocess
 import re
-from typing import Dict, Any, List, Optional
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
 # Import colorama for terminal colors
 from colorama import Fore, Style
 
+# psutil reads interfaces straight from the OS (getifaddrs/GetAdaptersAddresses);
+# without it we fall back to running and parsing ifconfig/ipconfig
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
 # Import configuration
-from config import PING_TIMEOUT
+from config import PING_TIMEOUT, CACHE_CONFIG
+from utils import create_tool_result
+from network._ttl_cache import TTLCache
+
+# Interface and gateway lookups spawn ifconfig/ipconfig/route, so their
+# results are kept briefly for back-to-back callers
+_CACHE_TTL = CACHE_CONFIG["interface_cache_ttl_seconds"]
+_IFACE_CACHE = TTLCache(_CACHE_TTL)
+_ROUTE_MONITOR_STARTED = False
+_ROUTE_MONITOR_LOCK = threading.Lock()
+# The default route changes far less often than interface state
+_GATEWAY_CACHE_TTL = CACHE_CONFIG["gateway_cache_ttl_seconds"]
+
+# The OS cannot change while the process runs, so branch on constants
+_IS_WINDOWS = sys.platform == "win32"
+_IS_LINUX = sys.platform.startswith("linux")
+
+# Patterns for parsing ifconfig, ipconfig, ip route and arp output
+_RE_INET = re.compile(r'inet (\d+\.\d+\.\d+\.\d+)')
+_RE_IPV4 = re.compile(r'(\d+\.\d+\.\d+\.\d+)')
+_RE_VIA = re.compile(r'via (\d+\.\d+\.\d+\.\d+)')
+# ifconfig: an unindented interface header line, or an indented inet or
+# ether/HWaddr attribute line
+_RE_UNIX_IFCONFIG = re.compile(
+    r'^(?P<iface>[^\s:]+)[^\n]*'
+    r'|^[ \t]+inet (?P<ip>\d+\.\d+\.\d+\.\d+)'
+    r'|^[ \t]+(?:ether|HWaddr) (?P<mac>[0-9a-fA-F]{2}(?::[0-9a-fA-F]{2}){5})',
+    re.MULTILINE
+)
+_RE_MAC_ARP = re.compile(r'([0-9a-f]{2}[:-](?:[0-9a-f]{2}[:-]){4}[0-9a-f]{2})', re.IGNORECASE)
+
+# Linux routing table; the kernel writes addresses as little-endian hex
+_PROC_NET_ROUTE = "/proc/net/route"
+_RTF_GATEWAY = 0x2
+
+# rtnetlink (Linux) message types, flags and attributes used to dump links
+# and addresses; see rtnetlink(7)
+_NLMSG_HEADER = struct.Struct("=IHHII")  # len, type, flags, seq, pid
+_IFINFOMSG = struct.Struct("=BxHiII")    # family, type, index, flags, change
+_IFADDRMSG = struct.Struct("=BBBBI")     # family, prefixlen, flags, scope, index
+_RTATTR = struct.Struct("=HH")           # len, type
+_NLMSG_ERROR = 2
+_NLMSG_DONE = 3
+_RTM_NEWLINK = 16
+_RTM_GETLINK = 18
+_RTM_NEWADDR = 20
+_RTM_GETADDR = 22
+_NLM_F_REQUEST = 0x1
+_NLM_F_DUMP = 0x300
+_IFLA_ADDRESS = 1
+_IFLA_IFNAME = 3
+_IFA_ADDRESS = 1
+_IFA_LOCAL = 2
+_IFF_UP = 0x1
+# Multicast groups announcing link, IPv4 address and IPv4 route changes
+_RTMGRP_LINK = 0x1
+_RTMGRP_IPV4_IFADDR = 0x10
+_RTMGRP_IPV4_ROUTE = 0x40
+
+# Linux neighbour (ARP) table, read whole and cached as an IP -> MAC dict
+_PROC_NET_ARP = "/proc/net/arp"
+_ARP_CACHE_TTL = CACHE_CONFIG["arp_cache_ttl_seconds"]
+_INCOMPLETE_MAC = "00:00:00:00:00:00"
+_ERROR_INSUFFICIENT_BUFFER = 122
+
+# iphlpapi GetAdaptersAddresses: skip the lists we never read, and remember
+# the buffer size the last call needed so repeat calls usually succeed first time
+_ERROR_BUFFER_OVERFLOW = 111
+_GAA_FLAGS = 0x2 | 0x4 | 0x8 | 0x800  # SKIP_ANYCAST | SKIP_MULTICAST | SKIP_DNS_SERVER | SKIP_DNS_INFO
+_IF_TYPE_SOFTWARE_LOOPBACK = 24
+_IF_OPER_STATUS_UP = 1
+_GAA_BUFFER_SIZE = 15000
+
+
+class _SOCKET_ADDRESS(ctypes.Structure):
+    _fields_ = [("lpSockaddr", ctypes.c_void_p), ("iSockaddrLength", ctypes.c_int)]
+
+
+class _SOCKADDR_IN(ctypes.Structure):
+    _fields_ = [("sin_family", ctypes.c_ushort), ("sin_port", ctypes.c_ushort),
+                ("sin_addr", ctypes.c_ubyte * 4)]
+
+
+class _IP_ADAPTER_UNICAST_ADDRESS(ctypes.Structure):
+    pass
+
+
+# Only the leading fields we read are declared; the OS owns the full layout
+_IP_ADAPTER_UNICAST_ADDRESS._fields_ = [
+    ("Alignment", ctypes.c_ulonglong),
+    ("Next", ctypes.POINTER(_IP_ADAPTER_UNICAST_ADDRESS)),
+    ("Address", _SOCKET_ADDRESS),
+]
+
+
+class _IP_ADAPTER_ADDRESSES(ctypes.Structure):
+    pass
+
+
+_IP_ADAPTER_ADDRESSES._fields_ = [
+    ("Alignment", ctypes.c_ulonglong),
+    ("Next", ctypes.POINTER(_IP_ADAPTER_ADDRESSES)),
+    ("AdapterName", ctypes.c_char_p),
+    ("FirstUnicastAddress", ctypes.POINTER(_IP_ADAPTER_UNICAST_ADDRESS)),
+    ("FirstAnycastAddress", ctypes.c_void_p),
+    ("FirstMulticastAddress", ctypes.c_void_p),
+    ("FirstDnsServerAddress", ctypes.c_void_p),
+    ("DnsSuffix", ctypes.c_wchar_p),
+    ("Description", ctypes.c_wchar_p),
+    ("FriendlyName", ctypes.c_wchar_p),
+    ("PhysicalAddress", ctypes.c_ubyte * 8),
+    ("PhysicalAddressLength", ctypes.c_ulong),
+    ("Flags", ctypes.c_ulong),
+    ("Mtu", ctypes.c_ulong),
+    ("IfType", ctypes.c_ulong),
+    ("OperStatus", ctypes.c_int),
+]
+
+
+def _iface_cache_put(key: str, value: Any, ttl: Optional[float] = None) -> None:
+    """Cache an interface, gateway or ARP lookup, watching for network changes from now on."""
+    _start_route_monitor()
+    _IFACE_CACHE.put(key, value, ttl)
+
+
+def invalidate_interface_cache() -> None:
+    """Forget cached interface, gateway and ARP lookups, e.g. after changing network configuration."""
+    _IFACE_CACHE.clear()
+
+
+def _start_route_monitor() -> None:
+    """
+    On Linux, start a daemon thread that empties the cache on network changes.
+    
+    The thread listens for rtnetlink link, address and route announcements,
+    so a changed interface or default route is seen straight away rather
+    than after the TTL. The TTL still applies on other platforms and when
+    the socket cannot be opened.
+    """
+    global _ROUTE_MONITOR_STARTED
+    if _ROUTE_MONITOR_STARTED or not _IS_LINUX:
+        return
+    with _ROUTE_MONITOR_LOCK:
+        if _ROUTE_MONITOR_STARTED:
+            return
+        _ROUTE_MONITOR_STARTED = True
+        try:
+            sock = socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, socket.NETLINK_ROUTE)
+            sock.bind((0, _RTMGRP_LINK | _RTMGRP_IPV4_IFADDR | _RTMGRP_IPV4_ROUTE))
+        except OSError:
+            return
+        threading.Thread(target=_route_monitor_loop, args=(sock,),
+                         name="layer2-route-monitor", daemon=True).start()
+
+
+def _route_monitor_loop(sock: socket.socket) -> None:
+    """Invalidate the interface cache whenever the kernel announces a change."""
+    with sock:
+        while True:
+            try:
+                sock.recv(65536)
+            except OSError as monitor_error:
+                # ENOBUFS means announcements were dropped; anything could have changed
+                if monitor_error.errno != errno.ENOBUFS:
+                    invalidate_interface_cache()
+                    return
+            invalidate_interface_cache()
 
 
 def get_local_ip(interface: str = None, silent: bool = False) -> Dict[str, Any]:
@@ -32,7 +215,10 @@ def get_local_ip(interface: str = None, silent: bool = False) -> Dict[str, Any]:
     Returns:
         Standardized result dictionary
     """
-    start_time = datetime.now()
+    # Two cheap clock reads replace the datetime.now() calls: time.time()
+    # for the start timestamp, perf_counter() for a monotonic duration
+    start_time = time.time()
+    start_perf = time.perf_counter()
     ip_address = None
 
     try:
@@ -40,57 +226,48 @@ def get_local_ip(interface: str = None, silent: bool = False) -> Dict[str, Any]:
             # Get IP for specific interface
             ip_address = get_interface_ip(interface)
         else:
-            # Get primary local IP by connecting to remote address
-            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
-                s.connect(("8.8.8.8", 80))
-                ip_address = s.getsockname()[0]
+            ip_address = _get_primary_ip(silent)
         
-        execution_time = (datetime.now() - start_time).total_seconds()
+        execution_time = time.perf_counter() - start_perf
         
         if not silent:
             print(f"Local IP: {ip_address}")
         
-        return {
-            "success": True,
-            "exit_code": 0,
-            "execution_time": execution_time,
-            "timestamp": start_time.isoformat(),
-            "tool_name": "get_local_ip",
-            "command_executed": f"get_local_ip(interface={interface})",
-            "stdout": ip_address,
-            "stderr": "",
-            "parsed_data": {
+        return create_tool_result(
+            success=True,
+            tool_name="get_local_ip",
+            execution_time=execution_time,
+            command_executed=f"get_local_ip(interface={interface})",
+            target=interface,
+            stdout=ip_address,
+            parsed_data={
                 "ip_address": ip_address,
                 "interface": interface or "primary"
             },
-            "error_type": None,
-            "error_message": None,
-            "target": interface,
-            "options_used": {"interface": interface}
-        }
+            options_used={"interface": interface},
+            start_time=datetime.fromtimestamp(start_time)
+        )
     
     except Exception as e:
-        execution_time = (datetime.now() - start_time).total_seconds()
-        error_msg = f"Failed to get local IP: {Fore.RED}{e}{Style.RESET_ALL}"
+        execution_time = time.perf_counter() - start_perf
+        error_msg = f"Failed to get local IP: {e}"
         
         if not silent:
-            print(f"Error: {error_msg}")
-        
-        return {
-            "success": False,
-            "exit_code": 1,
-            "execution_time": execution_time,
-            "timestamp": start_time.isoformat(),
-            "tool_name": "get_local_ip",
-            "command_executed": f"get_local_ip(interface={interface})",
-            "stdout": "",
-            "stderr": str(e),
-            "parsed_data": {},
-            "error_type": "network",
-            "error_message": error_msg,
-            "target": interface,
-            "options_used": {"interface": interface}
-        }
+            print(f"Error: Failed to get local IP: {Fore.RED}{e}{Style.RESET_ALL}")
+        
+        return create_tool_result(
+            success=False,
+            tool_name="get_local_ip",
+            execution_time=execution_time,
+            command_executed=f"get_local_ip(interface={interface})",
+            target=interface,
+            stderr=str(e),
+            error_type="network",
+            error_message=error_msg,
+            exit_code=1,
+            options_used={"interface": interface},
+            start_time=datetime.fromtimestamp(start_time)
+        )
 
 
 def check_interface_status(interface: str = None, silent: bool = False) -> Dict[str, Any]:
@@ -104,10 +281,11 @@ def check_interface_status(interface: str = None, silent: bool = False) -> Dict[
     Returns:
         Standardized result dictionary
     """
-    start_time = datetime.now()
+    start_time = time.time()
+    start_perf = time.perf_counter()
     
     try:
-        interfaces = get_all_interfaces()
+        interfaces = get_all_interfaces(silent=silent)
         
         if interface:
             # Filter to specific interface
@@ -116,7 +294,7 @@ def check_interface_status(interface: str = None, silent: bool = False) -> Dict[
                 raise Exception(f"Interface {interface} not found")
             interfaces = filtered_interfaces
         
-        execution_time = (datetime.now() - start_time).total_seconds()
+        execution_time = time.perf_counter() - start_perf
         
         if not silent:
             print(f"Network interfaces ({len(interfaces)} found):")
@@ -124,47 +302,61 @@ def check_interface_status(interface: str = None, silent: bool = False) -> Dict[
                 status_icon = "[UP]" if iface["status"] == "up" else "[DOWN]"
                 print(f"  {status_icon} {iface['name']}: {iface['ip']} ({iface['status']})")
         
-        return {
-            "success": True,
-            "exit_code": 0,
-            "execution_time": execution_time,
-            "timestamp": start_time.isoformat(),
-            "tool_name": "check_interface_status",
-            "command_executed": f"check_interface_status(interface={interface})",
-            "stdout": f"Found {len(interfaces)} interfaces",
-            "stderr": "",
-            "parsed_data": {
+        return create_tool_result(
+            success=True,
+            tool_name="check_interface_status",
+            execution_time=execution_time,
+            command_executed=f"check_interface_status(interface={interface})",
+            target=interface,
+            stdout=f"Found {len(interfaces)} interfaces",
+            parsed_data={
                 "interfaces": interfaces,
                 "interface_count": len(interfaces)
             },
-            "error_type": None,
-            "error_message": None,
-            "target": interface,
-            "options_used": {"interface": interface}
-        }
+            options_used={"interface": interface},
+            start_time=datetime.fromtimestamp(start_time)
+        )
     
     except Exception as e:
-        execution_time = (datetime.now() - start_time).total_seconds()
-        error_msg = f"Failed to check interface status: {Fore.RED}{e}{Style.RESET_ALL}"
+        execution_time = time.perf_counter() - start_perf
+        error_msg = f"Failed to check interface status: {e}"
         
         if not silent:
-            print(f"Error: {error_msg}")
-        
-        return {
-            "success": False,
-            "exit_code": 1,
-            "execution_time": execution_time,
-            "timestamp": start_time.isoformat(),
-            "tool_name": "check_interface_status",
-            "command_executed": f"check_interface_status(interface={interface})",
-            "stdout": "",
-            "stderr": str(e),
-            "parsed_data": {},
-            "error_type": "execution",
-            "error_message": error_msg,
-            "target": interface,
-            "options_used": {"interface": interface}
-        }
+            print(f"Error: Failed to check interface status: {Fore.RED}{e}{Style.RESET_ALL}")
+        
+        return create_tool_result(
+            success=False,
+            tool_name="check_interface_status",
+            execution_time=execution_time,
+            command_executed=f"check_interface_status(interface={interface})",
+            target=interface,
+            stderr=str(e),
+            error_type="execution",
+            error_message=error_msg,
+            exit_code=1,
+            options_used={"interface": interface},
+            start_time=datetime.fromtimestamp(start_time)
+        )
+
+
+@functools.lru_cache(maxsize=1)
+def _build_system_info() -> Dict[str, str]:
+    """
+    Collect host and platform details once per process.
+    
+    None of these change while the process runs, and platform.processor()
+    may run uname. Callers must copy the returned dict before changing it.
+    """
+    return {
+        "hostname": socket.gethostname(),
+        "platform": platform.system(),
+        "platform_release": platform.release(),
+        "platform_version": platform.version(),
+        "architecture": platform.machine(),
+        "processor": platform.processor(),
+        "python_version": platform.python_version(),
+        "username": os.getenv("USER") or os.getenv("USERNAME") or "unknown"
+    }
 
 
 def get_system_info(silent: bool = False) -> Dict[str, Any]:
@@ -177,21 +369,13 @@ def get_system_info(silent: bool = False) -> Dict[str, Any]:
     Returns:
         Standardized result dictionary
     """
-    start_time = datetime.now()
+    start_time = time.time()
+    start_perf = time.perf_counter()
     
     try:
-        system_info = {
-            "hostname": socket.gethostname(),
-            "platform": platform.system(),
-            "platform_release": platform.release(),
-            "platform_version": platform.version(),
-            "architecture": platform.machine(),
-            "processor": platform.processor(),
-            "python_version": platform.python_version(),
-            "username": os.getenv("USER") or os.getenv("USERNAME") or "unknown"
-        }
+        system_info = dict(_build_system_info())
         
-        execution_time = (datetime.now() - start_time).total_seconds()
+        execution_time = time.perf_counter() - start_perf
         
         if not silent:
             print(f"System Information:")
@@ -200,44 +384,34 @@ def get_system_info(silent: bool = False) -> Dict[str, Any]:
             print(f"  Architecture: {system_info['architecture']}")
             print(f"  User: {system_info['username']}")
         
-        return {
-            "success": True,
-            "exit_code": 0,
-            "execution_time": execution_time,
-            "timestamp": start_time.isoformat(),
-            "tool_name": "get_system_info",
-            "command_executed": "get_system_info()",
-            "stdout": f"System: {system_info['platform']} {system_info['platform_release']}",
-            "stderr": "",
-            "parsed_data": system_info,
-            "error_type": None,
-            "error_message": None,
-            "target": None,
-            "options_used": {}
-        }
+        return create_tool_result(
+            success=True,
+            tool_name="get_system_info",
+            execution_time=execution_time,
+            command_executed="get_system_info()",
+            stdout=f"System: {system_info['platform']} {system_info['platform_release']}",
+            parsed_data=system_info,
+            start_time=datetime.fromtimestamp(start_time)
+        )
     
     except Exception as e:
-        execution_time = (datetime.now() - start_time).total_seconds()
-        error_msg = f"Failed to get system info: {Fore.RED}{e}{Style.RESET_ALL}"
+        execution_time = time.perf_counter() - start_perf
+        error_msg = f"Failed to get system info: {e}"
         
         if not silent:
-            print(f"Error: {error_msg}")
-        
-        return {
-            "success": False,
-            "exit_code": 1,
-            "execution_time": execution_time,
-            "timestamp": start_time.isoformat(),
-            "tool_name": "get_system_info",
-            "command_executed": "get_system_info()",
-            "stdout": "",
-            "stderr": str(e),
-            "parsed_data": {},
-            "error_type": "execution",
-            "error_message": error_msg,
-            "target": None,
-            "options_used": {}
-        }
+            print(f"Error: Failed to get system info: {Fore.RED}{e}{Style.RESET_ALL}")
+        
+        return create_tool_result(
+            success=False,
+            tool_name="get_system_info",
+            execution_time=execution_time,
+            command_executed="get_system_info()",
+            stderr=str(e),
+            error_type="execution",
+            error_message=error_msg,
+            exit_code=1,
+            start_time=datetime.fromtimestamp(start_time)
+        )
 
 
 def get_gateway_info(silent: bool = False) -> Dict[str, Any]:
@@ -250,15 +424,20 @@ def get_gateway_info(silent: bool = False) -> Dict[str, Any]:
     Returns:
         Standardized result dictionary
     """
-    start_time = datetime.now()
+    start_time = time.time()
+    start_perf = time.perf_counter()
     
     try:
-        gateway_ip = get_default_gateway()
+        # Load the ARP table while the route lookup runs; get_mac_address()
+        # then finds it cached. Load errors resurface there and are handled below
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            executor.submit(_load_arp_table)
+            gateway_ip = get_default_gateway(silent=silent)
         
         # Try to get gateway MAC address
         gateway_mac = None
         try:
-            gateway_mac = get_mac_address(gateway_ip)
+            gateway_mac = get_mac_address(gateway_ip, silent=silent)
         except (subprocess.SubprocessError, subprocess.TimeoutExpired, FileNotFoundError, OSError) as error_looking_up_gateway_mac:
             # MAC address lookup failed but we can continue without it
             if not silent:
@@ -266,7 +445,7 @@ def get_gateway_info(silent: bool = False) -> Dict[str, Any]:
                 print(f"But we can continue without the gateway MAC address.")
             pass
         
-        execution_time = (datetime.now() - start_time).total_seconds()
+        execution_time = time.perf_counter() - start_perf
         
         if not silent:
             print(f"Default Gateway:")
@@ -274,120 +453,233 @@ def get_gateway_info(silent: bool = False) -> Dict[str, Any]:
             if gateway_mac:
                 print(f"  MAC: {gateway_mac}")
         
-        return {
-            "success": True,
-            "exit_code": 0,
-            "execution_time": execution_time,
-            "timestamp": start_time.isoformat(),
-            "tool_name": "get_gateway_info",
-            "command_executed": "get_gateway_info()",
-            "stdout": f"Gateway: {gateway_ip}",
-            "stderr": "",
-            "parsed_data": {
+        return create_tool_result(
+            success=True,
+            tool_name="get_gateway_info",
+            execution_time=execution_time,
+            command_executed="get_gateway_info()",
+            target=gateway_ip,
+            stdout=f"Gateway: {gateway_ip}",
+            parsed_data={
                 "gateway_ip": gateway_ip,
                 "gateway_mac": gateway_mac
             },
-            "error_type": None,
-            "error_message": None,
-            "target": gateway_ip,
-            "options_used": {}
-        }
+            start_time=datetime.fromtimestamp(start_time)
+        )
     
     except Exception as e:
-        execution_time = (datetime.now() - start_time).total_seconds()
-        error_msg = f"Failed to get gateway info: {Fore.RED}{e}{Style.RESET_ALL}"
+        execution_time = time.perf_counter() - start_perf
+        error_msg = f"Failed to get gateway info: {e}"
         
         if not silent:
-            print(f"Error: {error_msg}")
-        
-        return {
-            "success": False,
-            "exit_code": 1,
-            "execution_time": execution_time,
-            "timestamp": start_time.isoformat(),
-            "tool_name": "get_gateway_info",
-            "command_executed": "get_gateway_info()",
-            "stdout": "",
-            "stderr": str(e),
-            "parsed_data": {},
-            "error_type": "network",
-            "error_message": error_msg,
-            "target": None,
-            "options_used": {}
-        }
+            print(f"Error: Failed to get gateway info: {Fore.RED}{e}{Style.RESET_ALL}")
+        
+        return create_tool_result(
+            success=False,
+            tool_name="get_gateway_info",
+            execution_time=execution_time,
+            command_executed="get_gateway_info()",
+            stderr=str(e),
+            error_type="network",
+            error_message=error_msg,
+            exit_code=1,
+            start_time=datetime.fromtimestamp(start_time)
+        )
+
+
+def _get_primary_ip(silent: bool = False) -> str:
+    """
+    Get the IP address of the interface carrying the default route.
+    
+    On Linux the default route names its interface, whose address is taken
+    from the (cached) interface list. Elsewhere, or if that fails, connect a
+    UDP socket towards 8.8.8.8 (no packet is sent) and read the source
+    address the OS picked. Cached for as long as the gateway.
+    """
+    cached = _IFACE_CACHE.get("local_ip")
+    if cached is not None:
+        return cached
+    
+    ip_address = None
+    if _IS_LINUX:
+        try:
+            default_route = _read_default_route_linux()
+        except (OSError, ValueError):
+            default_route = None
+        if default_route:
+            route_interface = default_route[0]
+            ip_address = next(
+                (iface["ip"] for iface in get_all_interfaces(silent) if iface["name"] == route_interface),
+                None
+            )
+    
+    if not ip_address:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.connect(("8.8.8.8", 80))
+            ip_address = s.getsockname()[0]
+    
+    _iface_cache_put("local_ip", ip_address, _GATEWAY_CACHE_TTL)
+    return ip_address
+
+
+# Async variants. Each runs the blocking tool in a worker thread so callers
+# can overlap the subprocess and socket waits of several diagnostics
+
+async def async_get_local_ip(interface: str = None, silent: bool = False) -> Dict[str, Any]:
+    """Async variant of get_local_ip()."""
+    return await asyncio.to_thread(get_local_ip, interface, silent)
+
+
+async def async_check_interface_status(interface: str = None, silent: bool = False) -> Dict[str, Any]:
+    """Async variant of check_interface_status()."""
+    return await asyncio.to_thread(check_interface_status, interface, silent)
+
+
+async def async_get_system_info(silent: bool = False) -> Dict[str, Any]:
+    """Async variant of get_system_info()."""
+    return await asyncio.to_thread(get_system_info, silent)
+
+
+async def async_get_gateway_info(silent: bool = False) -> Dict[str, Any]:
+    """Async variant of get_gateway_info()."""
+    return await asyncio.to_thread(get_gateway_info, silent)
+
+
+async def run_all_layer2(silent: bool = True) -> List[Dict[str, Any]]:
+    """
+    Run the layer 2 diagnostics concurrently.
+    
+    Args:
+        silent: If True, suppress output except errors. Output from
+            concurrent diagnostics can interleave when False
+        
+    Returns:
+        Results of get_system_info, get_local_ip, check_interface_status and
+        get_gateway_info, in that order
+    """
+    return await asyncio.gather(
+        async_get_system_info(silent),
+        async_get_local_ip(silent=silent),
+        async_check_interface_status(silent=silent),
+        async_get_gateway_info(silent=silent)
+    )
 
 
 # Helper functions
 
+@functools.lru_cache(maxsize=None)
+def _resolve_command(name: str) -> str:
+    """Resolve a command to its absolute path, or return the name unchanged if not found."""
+    return shutil.which(name) or name
+
+
+def _spawn_capture(argv: List[str], timeout: float) -> subprocess.CompletedProcess:
+    """
+    Run a command and capture its text output.
+    
+    CPython only takes its posix_spawn (vfork) fast path instead of fork+exec
+    when the executable is an absolute path and close_fds is False. Leaving
+    descriptors open is safe here because Python creates them non-inheritable.
+    
+    Args:
+        argv: Command and arguments
+        timeout: Seconds to wait before raising TimeoutExpired
+        
+    Returns:
+        The completed process with stdout and stderr as text
+    """
+    return subprocess.run(
+        [_resolve_command(argv[0]), *argv[1:]],
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+        close_fds=False
+    )
+
+
 def get_interface_ip(interface: str) -> str:
     """Get IP address for a specific interface."""
-    system = platform.system()
+    if PSUTIL_AVAILABLE:
+        addresses = psutil.net_if_addrs().get(interface)
+        if addresses is None:
+            raise Exception(f"Interface {interface} not found")
+        for address in addresses:
+            if address.family == socket.AF_INET:
+                return address.address
+        raise Exception("No IP address found")
     
-    if system == "Windows":
+    if _IS_WINDOWS:
         # Windows implementation
-        result = subprocess.run(
-            ["ipconfig"],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
+        result = _spawn_capture(["ipconfig"], timeout=10)
         # Parse Windows output (simplified)
         return parse_windows_interface_ip(result.stdout, interface)
     else:
         # Unix/Linux/macOS implementation
-        result = subprocess.run(
-            ["ifconfig", interface],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
+        result = _spawn_capture(["ifconfig", interface], timeout=10)
         if result.returncode == 0:
             return parse_unix_interface_ip(result.stdout)
         else:
             raise Exception(f"Interface {interface} not found")
 
 
-def get_all_interfaces() -> List[Dict[str, Any]]:
+def get_all_interfaces(silent: bool = False) -> List[Dict[str, Any]]:
     """Get information about all network interfaces."""
+    cached = _IFACE_CACHE.get("interfaces")
+    if cached is not None:
+        return cached
+    
+    interfaces = _get_all_interfaces_uncached(silent)
+    _iface_cache_put("interfaces", interfaces)
+    return interfaces
+
+
+def _get_all_interfaces_uncached(silent: bool = False) -> List[Dict[str, Any]]:
+    """Query the OS for all network interfaces, warning about fallbacks unless silent."""
+    if PSUTIL_AVAILABLE:
+        return _get_all_interfaces_psutil()
+    
+    if _IS_LINUX:
+        try:
+            return _get_all_interfaces_netlink()
+        except (OSError, ValueError, struct.error) as netlink_error:
+            if not silent:
+                print(f"{Fore.YELLOW}Warning:{Style.RESET_ALL} Failed to read interfaces over netlink: {Fore.YELLOW}{netlink_error}{Style.RESET_ALL}")
+    elif _IS_WINDOWS:
+        try:
+            return _get_all_interfaces_windows()
+        except (OSError, ValueError, AttributeError) as adapters_error:
+            if not silent:
+                print(f"{Fore.YELLOW}Warning:{Style.RESET_ALL} Failed to read adapters from GetAdaptersAddresses: {Fore.YELLOW}{adapters_error}{Style.RESET_ALL}")
+    
     interfaces = []
-    system = platform.system()
     
     try:
-        if system == "Windows":
+        if _IS_WINDOWS:
             # Windows implementation using ipconfig
-            result = subprocess.run(
-                ["ipconfig", "/all"],
-                capture_output=True,
-                text=True,
-                timeout=15
-            )
+            result = _spawn_capture(["ipconfig", "/all"], timeout=15)
             interfaces = parse_windows_interfaces(result.stdout)
         else:
             # Unix/Linux/macOS implementation using ifconfig
-            result = subprocess.run(
-                ["ifconfig"],
-                capture_output=True,
-                text=True,
-                timeout=15
-            )
+            result = _spawn_capture(["ifconfig"], timeout=15)
             if result.returncode == 0:
                 interfaces = parse_unix_interfaces(result.stdout)
     except (subprocess.SubprocessError, subprocess.TimeoutExpired, FileNotFoundError, OSError) as error_looking_up_interfaces:
-        print(f"{Fore.YELLOW}Warning:{Style.RESET_ALL} Failed to get network interfaces: {Fore.YELLOW}{error_looking_up_interfaces}{Style.RESET_ALL}")
-        print(f"But we can continue with minimal interface detection.")
+        if not silent:
+            print(f"{Fore.YELLOW}Warning:{Style.RESET_ALL} Failed to get network interfaces: {Fore.YELLOW}{error_looking_up_interfaces}{Style.RESET_ALL}")
+            print(f"But we can continue with minimal interface detection.")
 
         # Fallback: minimal interface detection
         try:
-            local_ip = socket.gethostbyname(socket.gethostname())
             interfaces = [{
                 "name": "default",
-                "ip": local_ip,
+                "ip": _fallback_local_ip(),
                 "status": "up",
                 "mac": None
             }]
-        except (socket.gaierror, socket.herror) as e:
-            # Handle socket hostname resolution errors
-            print(f"{Fore.YELLOW}Warning:{Style.RESET_ALL} Socket hostname resolution failed: {e}")
+        except OSError as e:
+            # Handle local address detection errors
+            if not silent:
+                print(f"{Fore.YELLOW}Warning:{Style.RESET_ALL} Local address detection failed: {e}")
 
             interfaces = [{
                 "name": "unknown",
@@ -399,47 +691,241 @@ def get_all_interfaces() -> List[Dict[str, Any]]:
     return interfaces
 
 
+def _fallback_local_ip() -> str:
+    """
+    Find a local IPv4 address without a DNS lookup.
+    
+    Resolving our own hostname can wait on DNS for seconds when /etc/hosts is
+    incomplete, so only accept a hostname that is already a numeric address
+    and otherwise ask the kernel which source address it would route from.
+    Connecting a UDP socket sends no packets.
+    """
+    try:
+        return socket.getaddrinfo(socket.gethostname(), None, socket.AF_INET,
+                                  flags=socket.AI_NUMERICHOST)[0][4][0]
+    except socket.gaierror:
+        pass
+    
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        s.connect(("8.8.8.8", 80))
+        return s.getsockname()[0]
+
+
+def _get_all_interfaces_psutil() -> List[Dict[str, Any]]:
+    """List interfaces with an IPv4 address using psutil, in the same shape as the parsers."""
+    stats = psutil.net_if_stats()
+    interfaces = []
+    
+    for name, addresses in psutil.net_if_addrs().items():
+        if name == "lo":  # Skip loopback
+            continue
+        
+        ip = None
+        mac = None
+        for address in addresses:
+            if address.family == socket.AF_INET and ip is None:
+                ip = address.address
+            elif address.family == psutil.AF_LINK and mac is None:
+                mac = address.address.replace("-", ":").lower()
+        
+        if ip:  # Only return interfaces with IPs
+            stat = stats.get(name)
+            interfaces.append({
+                "name": name,
+                "ip": ip,
+                "status": "up" if stat is not None and stat.isup else "down",
+                "mac": mac
+            })
+    
+    return interfaces
+
+
+def _parse_rtattrs(data: bytes, offset: int) -> Dict[int, bytes]:
+    """Collect the rtattr TLVs from offset to the end of a netlink message."""
+    attributes = {}
+    while offset + _RTATTR.size <= len(data):
+        length, attr_type = _RTATTR.unpack_from(data, offset)
+        if length < _RTATTR.size:
+            break
+        attributes.setdefault(attr_type, data[offset + _RTATTR.size:offset + length])
+        offset += (length + 3) & ~3
+    return attributes
+
+
+def _netlink_dump(sock: socket.socket, msg_type: int, payload: bytes, seq: int) -> List[Tuple[int, bytes]]:
+    """
+    Send an rtnetlink dump request and collect the replies.
+    
+    Args:
+        sock: NETLINK_ROUTE socket
+        msg_type: Request type, e.g. RTM_GETLINK
+        payload: Request body (ifinfomsg or ifaddrmsg)
+        seq: Sequence number identifying this request
+        
+    Returns:
+        List of (message type, message bytes without the netlink header)
+    """
+    header = _NLMSG_HEADER.pack(_NLMSG_HEADER.size + len(payload), msg_type,
+                                _NLM_F_REQUEST | _NLM_F_DUMP, seq, 0)
+    sock.send(header + payload)
+    
+    messages = []
+    while True:
+        data = sock.recv(65536)
+        offset = 0
+        while offset + _NLMSG_HEADER.size <= len(data):
+            length, reply_type, _, reply_seq, _ = _NLMSG_HEADER.unpack_from(data, offset)
+            if length < _NLMSG_HEADER.size:
+                raise ValueError("Malformed netlink message")
+            if reply_seq == seq:
+                if reply_type == _NLMSG_DONE:
+                    return messages
+                if reply_type == _NLMSG_ERROR:
+                    raise OSError("Netlink dump request was rejected")
+                messages.append((reply_type, data[offset + _NLMSG_HEADER.size:offset + length]))
+            offset += (length + 3) & ~3
+
+
+def _get_all_interfaces_netlink() -> List[Dict[str, Any]]:
+    """List interfaces with an IPv4 address from an rtnetlink link and address dump (Linux)."""
+    with socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, socket.NETLINK_ROUTE) as sock:
+        sock.settimeout(2)
+        links = _netlink_dump(sock, _RTM_GETLINK, _IFINFOMSG.pack(socket.AF_UNSPEC, 0, 0, 0, 0), 1)
+        addresses = _netlink_dump(sock, _RTM_GETADDR, _IFADDRMSG.pack(socket.AF_INET, 0, 0, 0, 0), 2)
+    
+    interfaces_by_index = {}
+    for msg_type, message in links:
+        if msg_type != _RTM_NEWLINK:
+            continue
+        _, _, index, flags, _ = _IFINFOMSG.unpack_from(message)
+        attributes = _parse_rtattrs(message, _IFINFOMSG.size)
+        name = attributes.get(_IFLA_IFNAME, b"").rstrip(b"\0").decode(errors="replace")
+        mac = attributes.get(_IFLA_ADDRESS)
+        interfaces_by_index[index] = {
+            "name": name,
+            "ip": None,
+            "status": "up" if flags & _IFF_UP else "down",
+            "mac": ":".join(f"{b:02x}" for b in mac) if mac and len(mac) == 6 else None
+        }
+    
+    for msg_type, message in addresses:
+        if msg_type != _RTM_NEWADDR:
+            continue
+        family, _, _, _, index = _IFADDRMSG.unpack_from(message)
+        interface = interfaces_by_index.get(index)
+        if family != socket.AF_INET or interface is None or interface["ip"]:
+            continue
+        attributes = _parse_rtattrs(message, _IFADDRMSG.size)
+        # IFA_LOCAL is the local address; IFA_ADDRESS is the peer on point-to-point links
+        address = attributes.get(_IFA_LOCAL) or attributes.get(_IFA_ADDRESS)
+        if address and len(address) == 4:
+            interface["ip"] = socket.inet_ntoa(address)
+    
+    return [
+        interface for _, interface in sorted(interfaces_by_index.items())
+        if interface["ip"] and interface["name"] != "lo"  # Skip loopback; only interfaces with IPs
+    ]
+
+
+# Parsed interfaces are cached per distinct command output as immutable rows
+# of (key, value) pairs; the public parsers hand out fresh dicts built from them
+_InterfaceRows = Tuple[Tuple[Tuple[str, Any], ...], ...]
+
+
+def _get_all_interfaces_windows() -> List[Dict[str, Any]]:
+    """List adapters with an IPv4 address from iphlpapi GetAdaptersAddresses (Windows)."""
+    global _GAA_BUFFER_SIZE
+    get_adapters_addresses = ctypes.WinDLL("iphlpapi.dll").GetAdaptersAddresses
+    
+    for _ in range(3):
+        size = ctypes.c_ulong(_GAA_BUFFER_SIZE)
+        buffer = ctypes.create_string_buffer(size.value)
+        status = get_adapters_addresses(socket.AF_INET, _GAA_FLAGS, None, buffer, ctypes.byref(size))
+        if status != _ERROR_BUFFER_OVERFLOW:
+            break
+        _GAA_BUFFER_SIZE = size.value
+    if status != 0:
+        raise OSError(status, "GetAdaptersAddresses failed")
+    
+    interfaces = []
+    adapter = ctypes.cast(buffer, ctypes.POINTER(_IP_ADAPTER_ADDRESSES))
+    while adapter:
+        entry = adapter.contents
+        adapter = entry.Next
+        if entry.IfType == _IF_TYPE_SOFTWARE_LOOPBACK:
+            continue
+        
+        ip_address = None
+        unicast = entry.FirstUnicastAddress
+        while unicast and ip_address is None:
+            sockaddr = ctypes.cast(unicast.contents.Address.lpSockaddr, ctypes.POINTER(_SOCKADDR_IN)).contents
+            if sockaddr.sin_family == socket.AF_INET:
+                ip_address = socket.inet_ntoa(bytes(sockaddr.sin_addr))
+            unicast = unicast.contents.Next
+        if not ip_address:
+            continue
+        
+        mac_length = entry.PhysicalAddressLength
+        interfaces.append({
+            "name": entry.FriendlyName,
+            "ip": ip_address,
+            "status": "up" if entry.OperStatus == _IF_OPER_STATUS_UP else "down",
+            "mac": ":".join(f"{b:02x}" for b in entry.PhysicalAddress[:mac_length]) if mac_length else None
+        })
+    
+    return interfaces
+
+
 def parse_unix_interfaces(ifconfig_output: str) -> List[Dict[str, Any]]:
     """Parse Unix/Linux/macOS ifconfig output."""
+    return [dict(row) for row in _parse_unix_interfaces_cached(ifconfig_output)]
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_unix_interfaces_cached(ifconfig_output: str) -> _InterfaceRows:
+    """Parse ifconfig output once per distinct text, keeping only interfaces with an IP."""
     interfaces = []
     current_interface = None
     
-    for line in ifconfig_output.split('\n'):
+    # One pass of the regex engine finds every header, inet and ether line
+    for match in _RE_UNIX_IFCONFIG.finditer(ifconfig_output):
+        interface_name = match.group("iface")
+        
         # New interface line
-        if line and not line.startswith(' ') and not line.startswith('\t'):
-            if current_interface:
-                interfaces.append(current_interface)
+        if interface_name:
+            if current_interface and current_interface["ip"]:
+                interfaces.append(tuple(current_interface.items()))
+            current_interface = None
             
-            interface_name = line.split(':')[0]
-            if interface_name and interface_name != "lo":  # Skip loopback
+            if interface_name != "lo":  # Skip loopback
                 current_interface = {
                     "name": interface_name,
                     "ip": None,
-                    "status": "up" if "UP" in line else "down",
+                    "status": "up" if "UP" in match.group(0) else "down",
                     "mac": None
                 }
         
-        # IP address line
-        elif current_interface and "inet " in line:
-            ip_match = re.search(r'inet (\d+\.\d+\.\d+\.\d+)', line)
-            if ip_match:
-                current_interface["ip"] = ip_match.group(1)
-        
-        # MAC address line
-        elif current_interface and ("ether " in line or "HWaddr " in line):
-            mac_match = re.search(r'([0-9a-f]{2}:[0-9a-f]{2}:[0-9a-f]{2}:[0-9a-f]{2}:[0-9a-f]{2}:[0-9a-f]{2})', line, re.IGNORECASE)
-            if mac_match:
-                current_interface["mac"] = mac_match.group(1)
+        elif current_interface:
+            if match.group("ip"):
+                current_interface["ip"] = match.group("ip")
+            else:
+                current_interface["mac"] = match.group("mac")
     
     # Add the last interface
-    if current_interface:
-        interfaces.append(current_interface)
+    if current_interface and current_interface["ip"]:
+        interfaces.append(tuple(current_interface.items()))
     
-    return [iface for iface in interfaces if iface["ip"]]  # Only return interfaces with IPs
+    return tuple(interfaces)
 
 
 def parse_windows_interfaces(ipconfig_output: str) -> List[Dict[str, Any]]:
     """Parse Windows ipconfig output (simplified)."""
+    return [dict(row) for row in _parse_windows_interfaces_cached(ipconfig_output)]
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_windows_interfaces_cached(ipconfig_output: str) -> _InterfaceRows:
+    """Parse ipconfig output once per distinct text."""
     interfaces = []
     
     # Simple parsing for Windows - this is a basic implementation
@@ -464,7 +950,7 @@ def parse_windows_interfaces(ipconfig_output: str) -> List[Dict[str, Any]]:
         
         # IP address line
         elif current_interface and "IPv4 Address" in line:
-            ip_match = re.search(r'(\d+\.\d+\.\d+\.\d+)', line)
+            ip_match = _RE_IPV4.search(line)
             if ip_match:
                 current_interface["ip"] = ip_match.group(1)
                 current_interface["status"] = "up"
@@ -473,12 +959,12 @@ def parse_windows_interfaces(ipconfig_output: str) -> List[Dict[str, Any]]:
     if current_interface and current_interface["ip"]:
         interfaces.append(current_interface)
     
-    return interfaces
+    return tuple(tuple(iface.items()) for iface in interfaces)
 
 
 def parse_unix_interface_ip(ifconfig_output: str) -> str:
     """Parse IP address from Unix ifconfig output for single interface."""
-    ip_match = re.search(r'inet (\d+\.\d+\.\d+\.\d+)', ifconfig_output)
+    ip_match = _RE_INET.search(ifconfig_output)
     if ip_match:
         return ip_match.group(1)
     raise Exception("No IP address found")
@@ -487,24 +973,64 @@ def parse_unix_interface_ip(ifconfig_output: str) -> str:
 def parse_windows_interface_ip(ipconfig_output: str, interface: str) -> str:
     """Parse IP address from Windows ipconfig output for specific interface."""
     # Simplified Windows parsing
-    ip_match = re.search(r'(\d+\.\d+\.\d+\.\d+)', ipconfig_output)
+    ip_match = _RE_IPV4.search(ipconfig_output)
     if ip_match:
         return ip_match.group(1)
     raise Exception("No IP address found")
 
 
-def get_default_gateway() -> str:
+def get_default_gateway(silent: bool = False) -> str:
     """Get the default gateway IP address."""
-    system = platform.system()
+    cached = _IFACE_CACHE.get("gateway")
+    if cached is not None:
+        return cached
     
+    gateway_ip = _get_default_gateway_uncached(silent)
+    _iface_cache_put("gateway", gateway_ip, _GATEWAY_CACHE_TTL)
+    return gateway_ip
+
+
+def _read_default_route_linux() -> Optional[Tuple[str, str]]:
+    """Get (interface, gateway IP) of the default route from /proc/net/route, or None."""
+    with open(_PROC_NET_ROUTE) as route_file:
+        next(route_file, None)  # Skip header
+        for line in route_file:
+            fields = line.split()
+            if len(fields) >= 4 and fields[1] == "00000000" and int(fields[3], 16) & _RTF_GATEWAY:
+                return fields[0], socket.inet_ntoa(bytes.fromhex(fields[2])[::-1])
+    return None
+
+
+def _get_best_route_windows() -> Optional[str]:
+    """Get the next hop towards 0.0.0.0 from iphlpapi GetBestRoute on Windows, or None."""
+    # MIB_IPFORWARDROW is 14 DWORDs; dwForwardNextHop is the fourth and holds
+    # the address in network byte order
+    row = (ctypes.c_uint32 * 14)()
+    if ctypes.WinDLL("iphlpapi.dll").GetBestRoute(0, 0, ctypes.byref(row)) != 0:
+        return None
+    next_hop = row[3]
+    return socket.inet_ntoa(struct.pack("<I", next_hop)) if next_hop else None
+
+
+def _get_default_gateway_uncached(silent: bool = False) -> str:
+    """Query the OS for the default gateway IP address, warning about fallbacks unless silent."""
+    # Ask the kernel directly where we can; fall back to the route/ip commands
     try:
-        if system == "Windows":
-            result = subprocess.run(
-                ["route", "print", "0.0.0.0"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+        if _IS_LINUX:
+            default_route = _read_default_route_linux()
+            if default_route:
+                return default_route[1]
+        elif _IS_WINDOWS:
+            gateway_ip = _get_best_route_windows()
+            if gateway_ip:
+                return gateway_ip
+    except (OSError, ValueError, AttributeError) as kernel_route_error:
+        if not silent:
+            print(f"{Fore.YELLOW}Warning:{Style.RESET_ALL} Failed to read the routing table directly: {Fore.YELLOW}{kernel_route_error}{Style.RESET_ALL}")
+    
+    try:
+        if _IS_WINDOWS:
+            result = _spawn_capture(["route", "print", "0.0.0.0"], timeout=10)
             # Parse Windows route output
             for line in result.stdout.split('\n'):
                 if "0.0.0.0" in line and "0.0.0.0" in line:
@@ -513,32 +1039,23 @@ def get_default_gateway() -> str:
                         return parts[2]  # Gateway IP
         else:
             # Unix/Linux/macOS
-            result = subprocess.run(
-                ["route", "-n", "get", "default"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+            result = _spawn_capture(["route", "-n", "get", "default"], timeout=10)
             for line in result.stdout.split('\n'):
                 if "gateway:" in line.lower():
                     return line.split()[-1]
             
             # Alternative method for Linux
-            result = subprocess.run(
-                ["ip", "route", "show", "default"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+            result = _spawn_capture(["ip", "route", "show", "default"], timeout=10)
             if result.returncode == 0:
-                match = re.search(r'via (\d+\.\d+\.\d+\.\d+)', result.stdout)
+                match = _RE_VIA.search(result.stdout)
                 if match:
                     return match.group(1)
     
     except (subprocess.SubprocessError, subprocess.TimeoutExpired, FileNotFoundError, OSError) as gateway_lookup_error:
         # Fallback when subprocess commands fail
-        print(f"{Fore.YELLOW}Warning:{Style.RESET_ALL} Failed to get default gateway: {Fore.YELLOW}{gateway_lookup_error}{Style.RESET_ALL}")
-        print(f"But we can continue by trying minimal gateway detection using a raw socket.")
+        if not silent:
+            print(f"{Fore.YELLOW}Warning:{Style.RESET_ALL} Failed to get default gateway: {Fore.YELLOW}{gateway_lookup_error}{Style.RESET_ALL}")
+            print(f"But we can continue by trying minimal gateway detection using a raw socket.")
         pass
     
     # Fallback: try to determine gateway by connecting
@@ -553,41 +1070,96 @@ def get_default_gateway() -> str:
     except (socket.error, socket.timeout, socket.gaierror, ConnectionRefusedError, ConnectionError, OSError
             ) as error_using_socket_to_determine_gateway_ip:
 
-        print(f"{Fore.YELLOW}Warning:{Style.RESET_ALL} Failed to determine default gateway using socket: {Fore.YELLOW}{error_using_socket_to_determine_gateway_ip}{Style.RESET_ALL}")
+        if not silent:
+            print(f"{Fore.YELLOW}Warning:{Style.RESET_ALL} Failed to determine default gateway using socket: {Fore.YELLOW}{error_using_socket_to_determine_gateway_ip}{Style.RESET_ALL}")
 
         # TODO: This chatbot should function even in total network outage scenarios, so instead of raising an exception, we should tell the user and we should save the error in the chatbot's context.
         raise Exception(f"Unable to determine default gateway: {error_using_socket_to_determine_gateway_ip}")
 
 
-def get_mac_address(ip_address: str) -> Optional[str]:
-    """Get MAC address for an IP address using ARP."""
+def _read_arp_table_linux() -> Dict[str, str]:
+    """Map IP to MAC for every complete entry in /proc/net/arp."""
+    table = {}
+    with open(_PROC_NET_ARP) as arp_file:
+        next(arp_file, None)  # Skip header
+        for line in arp_file:
+            fields = line.split()
+            if len(fields) >= 4 and fields[3] != _INCOMPLETE_MAC:
+                table[fields[0]] = fields[3]
+    return table
+
+
+def _read_arp_table_windows() -> Dict[str, str]:
+    """Map IP to MAC for every entry returned by iphlpapi GetIpNetTable."""
+    get_ip_net_table = ctypes.WinDLL("iphlpapi.dll").GetIpNetTable
+    size = ctypes.c_ulong(0)
+    if get_ip_net_table(None, ctypes.byref(size), False) != _ERROR_INSUFFICIENT_BUFFER:
+        return {}
+    buffer = ctypes.create_string_buffer(size.value)
+    if get_ip_net_table(buffer, ctypes.byref(size), False) != 0:
+        return {}
+    
+    # MIB_IPNETTABLE is a DWORD count followed by 24-byte MIB_IPNETROWs:
+    # dwIndex, dwPhysAddrLen, bPhysAddr[8], dwAddr (network order), dwType
+    table = {}
+    (count,) = struct.unpack_from("<I", buffer, 0)
+    for offset in range(4, 4 + count * 24, 24):
+        _, mac_length, mac_bytes, address = struct.unpack_from("<II8s4s", buffer, offset)
+        if mac_length and any(mac_bytes[:mac_length]):
+            table[socket.inet_ntoa(address)] = ":".join(f"{b:02x}" for b in mac_bytes[:mac_length])
+    return table
+
+
+def _load_arp_table() -> Optional[Dict[str, str]]:
+    """
+    Get the OS neighbour table as an IP -> MAC dict, cached briefly.
+    
+    Returns:
+        The table on Linux and Windows, or None where it can only be read
+        through the arp command
+    """
+    cached = _IFACE_CACHE.get("arp")
+    if cached is not None:
+        return cached
+    
+    if _IS_LINUX:
+        table = _read_arp_table_linux()
+    elif _IS_WINDOWS:
+        table = _read_arp_table_windows()
+    else:
+        return None
+    
+    _iface_cache_put("arp", table, _ARP_CACHE_TTL)
+    return table
+
+
+def get_mac_address(ip_address: str, silent: bool = False) -> Optional[str]:
+    """Get MAC address for an IP address using ARP, warning about fallbacks unless silent."""
     try:
-        system = platform.system()
-        
-        if system == "Windows":
-            result = subprocess.run(
-                ["arp", "-a", ip_address],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
+        arp_table = _load_arp_table()
+        if arp_table is not None:
+            return arp_table.get(ip_address)
+    except (OSError, ValueError, AttributeError, struct.error) as arp_table_error:
+        if not silent:
+            print(f"{Fore.YELLOW}Warning:{Style.RESET_ALL} Failed to read the ARP table directly: {Fore.YELLOW}{arp_table_error}{Style.RESET_ALL}")
+    
+    try:
+        if _IS_WINDOWS:
+            result = _spawn_capture(["arp", "-a", ip_address], timeout=5)
         else:
-            result = subprocess.run(
-                ["arp", "-n", ip_address],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
+            result = _spawn_capture(["arp", "-n", ip_address], timeout=5)
         
         if result.returncode == 0:
             # Parse MAC address from ARP output
-            mac_match = re.search(r'([0-9a-f]{2}[:-][0-9a-f]{2}[:-][0-9a-f]{2}[:-][0-9a-f]{2}[:-][0-9a-f]{2}[:-][0-9a-f]{2})', result.stdout, re.IGNORECASE)
+            mac_match = _RE_MAC_ARP.search(result.stdout)
             if mac_match:
-                return mac_match.group(1)
+                # Windows arp prints dashes; report colons like every other source
+                return mac_match.group(1).replace("-", ":").lower()
     
-    except (subprocess.SubprocessError, subprocess.TimeoutExpired, FileNotFoundError, OSError, re.error) as error_looking_up_mac_address:
-        print(f"{Fore.YELLOW}Warning:{Style.RESET_ALL} Failed to get MAC address for {ip_address}: {Fore.YELLOW}{error_looking_up_mac_address}{Style.RESET_ALL}")
-        print(f"But we can continue without the MAC address.")
+    except (subprocess.SubprocessError, subprocess.TimeoutExpired, FileNotFoundError, OSError) as error_looking_up_mac_address:
+        if not silent:
+            print(f"{Fore.YELLOW}Warning:{Style.RESET_ALL} Failed to get MAC address for {ip_address}: {Fore.YELLOW}{error_looking_up_mac_address}{Style.RESET_ALL}")
+            print(f"But we can continue without the MAC address.")
         pass
     
     return None
@@ -598,23 +1170,19 @@ def test_layer2_diagnostics():
     """Test function for development purposes."""
     print("Testing Layer 2 diagnostics...")
     
-    # Test functions
-    test_functions = [
-        ("get_system_info", lambda: get_system_info(silent=False)),
-        ("get_local_ip", lambda: get_local_ip(silent=False)),
-        ("check_interface_status", lambda: check_interface_status(silent=False)),
-        ("get_gateway_info", lambda: get_gateway_info(silent=False))
-    ]
+    try:
+        results = asyncio.run(run_all_layer2())
+    except Exception as e:
+        print(f"Error: {Fore.RED}{e}{Style.RESET_ALL}")
+        return
     
-    for func_name, func in test_functions:
-        print(f"\n--- Testing {func_name} ---")
-        try:
-            result = func()
-            print(f"Success: {result['success']}")
-            if result['parsed_data']:
-                print(f"Data: {list(result['parsed_data'].keys())}")
-        except Exception as e:
-            print(f"Error: {Fore.RED}{e}{Style.RESET_ALL}")
+    for result in results:
+        print(f"\n--- Testing {result['tool_name']} ---")
+        print(f"Success: {result['success']}")
+        if result['parsed_data']:
+            print(f"Data: {list(result['parsed_data'].keys())}")
+        if result['error_message']:
+            print(f"Error: {result['error_message']}")
 
 
 if __name__ == "__main__":
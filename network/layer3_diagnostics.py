@@ -5,12 +5,19 @@ Provides external IP detection, routing information, connectivity testing,
 and basic network performance metrics.
 """
 
+import asyncio
+import itertools
+import os
 import socket
 import subprocess
 import platform
 import time
 import re
-from typing import Dict, Any, List, Optional
+import select
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 from requests.exceptions import RequestException
 
@@ -24,87 +31,136 @@ from core.error_handling import (
 )
 
 # Import configuration
-from config import PING_TIMEOUT, TRACEROUTE_TIMEOUT
+from config import CACHE_CONFIG, PING_TIMEOUT, SCAN_MAX_PARALLEL_PINGS, TRACEROUTE_TIMEOUT
+from network.dns_diagnostics import _DNS_CACHE
 
+# aiohttp lets async callers fetch the external IP without tying up a thread;
+# without it async_get_external_ip() runs the requests version in a worker thread
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
 
-def get_external_ip(timeout: int = 10, silent: bool = False) -> Dict[str, Any]:
+# Services that reply with our external IP as plain text; several are asked
+# at once for reliability and the first valid answer wins
+EXTERNAL_IP_SERVICES: Tuple[str, ...] = (
+    "https://ipinfo.io/ip",
+    "https://api.ipify.org",
+    "https://icanhazip.com",
+    "https://ident.me",
+    "https://checkip.amazonaws.com"
+)
+
+# Patterns for parsing ping and traceroute/tracert output
+_PING_WIN_SENT = re.compile(r'Packets: Sent = (\d+)')
+_PING_WIN_RECV = re.compile(r'Received = (\d+)')
+_PING_WIN_LOSS = re.compile(r'Lost = \d+ \((\d+)% loss\)')
+_PING_WIN_TIME = re.compile(r'time[<=](\d+)ms')
+_PING_NIX_STATS = re.compile(r'(\d+) packets transmitted, (\d+) received, (\d+)% packet loss')
+_PING_NIX_TIMING = re.compile(r'min/avg/max/stddev = ([\d.]+)/([\d.]+)/([\d.]+)/([\d.]+) ms')
+_TRACE_WIN = re.compile(r'\s*(\d+)\s+(\S+)\s+(\S+)\s+(\S+)\s+(\S+)')
+_TRACE_WIN_IP = re.compile(r'\[([\d.]+)\]')
+_TRACE_NIX = re.compile(r'\s*(\d+)\s+(\S+)\s+\(([\d.]+)\)\s+([\d.]+)')
+
+# The external IP rarely changes within minutes, so the last answer is reused
+# as (fetched at on the monotonic clock, IP, service) until it is this old
+EXTERNAL_IP_TTL = CACHE_CONFIG["external_ip_ttl_seconds"]
+_EXTERNAL_IP_CACHE: Dict[str, Tuple[float, str, str]] = {}
+_EXTERNAL_IP_CACHE_LOCK = threading.Lock()
+
+
+# Forward and reverse lookups for ping, port and scan targets share the DNS
+# diagnostics cache, so clear_dns_cache() forgets them too. Reverse lookups
+# that find no name are cached as None; failed forward lookups are not cached
+_TARGET_KEY = "layer3-target"
+
+
+def _resolve_cached(host: str, family: int = socket.AF_INET) -> str:
+    """
+    Resolve a hostname to an address of the given family, reusing recent answers.
+    
+    Args:
+        host: Hostname or IPv4 address
+        family: socket.AF_INET, or socket.AF_UNSPEC for the resolver's first choice
+    
+    Raises:
+        socket.gaierror: If the name does not resolve
+    """
+    if is_valid_ip(host):
+        return host
+    
+    key = (_TARGET_KEY, "A" if family == socket.AF_INET else "ANY", host)
+    address = _DNS_CACHE.get(key)
+    if address is not None:
+        return address
+    
+    address = socket.getaddrinfo(host, None, family, socket.SOCK_STREAM)[0][4][0]
+    _DNS_CACHE.put(key, address)
+    return address
+
+
+def clear_external_ip_cache() -> None:
+    """Forget the cached external IP so the next lookup asks the services again."""
+    with _EXTERNAL_IP_CACHE_LOCK:
+        _EXTERNAL_IP_CACHE.clear()
+
+
+def _cached_external_ip(timeout: int, start_time: datetime, silent: bool) -> Optional[Dict[str, Any]]:
+    """Build a get_external_ip result from the cache, or None if nothing fresh is cached."""
+    with _EXTERNAL_IP_CACHE_LOCK:
+        entry = _EXTERNAL_IP_CACHE.get("last")
+    if entry is None:
+        return None
+    
+    age = time.monotonic() - entry[0]
+    if age >= EXTERNAL_IP_TTL:
+        return None
+    
+    result = _external_ip_found(entry[1], entry[2], timeout, start_time, silent, remember=False)
+    result["cache_age_seconds"] = round(age, 1)
+    return result
+
+
+def get_external_ip(timeout: int = 10, silent: bool = False, use_cache: bool = True) -> Dict[str, Any]:
     """
     Get the external IP address using multiple methods.
     
     Args:
         timeout: Timeout in seconds for the request
         silent: If True, suppress output except errors
+        use_cache: If True, reuse an answer from the last EXTERNAL_IP_TTL seconds
         
     Returns:
         Standardized result dictionary
     """
     start_time = datetime.now()
     
-    # Try multiple services for reliability
-    ip_services = [
-        "https://ipinfo.io/ip",
-        "https://api.ipify.org",
-        "https://icanhazip.com",
-        "https://ident.me",
-        "https://checkip.amazonaws.com"
-    ]
+    if use_cache:
+        cached = _cached_external_ip(timeout, start_time, silent)
+        if cached is not None:
+            return cached
     
     try:
         import requests
         
-        for service in ip_services:
-            try:
-                response = requests.get(service, timeout=timeout)
-                if response.status_code == 200:
-                    external_ip = response.text.strip()
-                    
-                    # Validate IP format
-                    if is_valid_ip(external_ip):
-                        execution_time = (datetime.now() - start_time).total_seconds()
-                        
-                        if not silent:
-                            print(f"External IP: {external_ip}")
-                        
-                        return {
-                            "success": True,
-                            "exit_code": 0,
-                            "execution_time": execution_time,
-                            "timestamp": start_time.isoformat(),
-                            "tool_name": "get_external_ip",
-                            "command_executed": f"get_external_ip(timeout={timeout})",
-                            "stdout": external_ip,
-                            "stderr": "",
-                            "parsed_data": {
-                                "external_ip": external_ip,
-                                "service_used": service
-                            },
-                            "error_type": None,
-                            "error_message": None,
-                            "target": None,
-                            "options_used": {"timeout": timeout}
-                        }
-            except RequestException as error_trying_to_get_external_ip:
-                # RequestException is the base class for all requests-specific exceptions
-                print(f"{Fore.RED}Error: Failed to get external IP from {service}: {error_trying_to_get_external_ip}{Style.RESET_ALL}")
-                print(f"Retrying with next service...")
-                continue
+        # Ask every service at once and take the first valid answer, so one
+        # slow or dead service no longer costs a full timeout
+        executor = ThreadPoolExecutor(max_workers=len(EXTERNAL_IP_SERVICES))
+        try:
+            futures = [executor.submit(_fetch_external_ip, service, timeout) for service in EXTERNAL_IP_SERVICES]
+            service_errors = []
+            for future in as_completed(futures):
+                service, external_ip, service_error = future.result()
+                if service_error is not None:
+                    service_errors.append((service, service_error))
+                elif external_ip is not None:
+                    return _external_ip_found(external_ip, service, timeout, start_time, silent)
+        finally:
+            # Don't wait on the slower services once we have an answer
+            executor.shutdown(wait=False, cancel_futures=True)
         
-        # If all services failed
-        print(f"{Fore.RED}Error: All external IP detection services failed.{Style.RESET_ALL}")
-        execution_time = (datetime.now() - start_time).total_seconds()
-        print(f"This might mean that our local network has no connectivity to the internet.")
-
-        return create_network_error(
-            ErrorCode.UNREACHABLE,
-            tool_name="get_external_ip",
-            execution_time=execution_time,
-            details={
-                "command": f"get_external_ip(timeout={timeout})",
-                "options": {"timeout": timeout}
-            },
-            error_type=ErrorType.NETWORK,
-            error_message="All external IP detection services failed"
-        )
+        return _external_ip_not_found(service_errors, timeout, start_time)
     
     except ImportError:
         execution_time = (datetime.now() - start_time).total_seconds()
@@ -150,6 +206,152 @@ def get_external_ip(timeout: int = 10, silent: bool = False) -> Dict[str, Any]:
         )
 
 
+def _fetch_external_ip(service: str, timeout: int) -> Tuple[str, Optional[str], Optional[RequestException]]:
+    """
+    Ask one external IP service for our address.
+    
+    Returns:
+        Tuple of (service, IP address or None if the reply was not a valid IP,
+        request error or None)
+    """
+    import requests
+    
+    try:
+        response = requests.get(service, timeout=timeout)
+    except RequestException as error_trying_to_get_external_ip:
+        return service, None, error_trying_to_get_external_ip
+    
+    if response.status_code == 200:
+        external_ip = response.text.strip()
+        
+        # Validate IP format
+        if is_valid_ip(external_ip):
+            return service, external_ip, None
+    return service, None, None
+
+
+def _external_ip_found(external_ip: str, service: str, timeout: int, start_time: datetime,
+                       silent: bool, remember: bool = True) -> Dict[str, Any]:
+    """Build the get_external_ip result for an address reported by service, caching it if remember."""
+    if remember:
+        with _EXTERNAL_IP_CACHE_LOCK:
+            _EXTERNAL_IP_CACHE["last"] = (time.monotonic(), external_ip, service)
+    
+    execution_time = (datetime.now() - start_time).total_seconds()
+    
+    if not silent:
+        print(f"External IP: {external_ip}")
+    
+    return {
+        "success": True,
+        "exit_code": 0,
+        "execution_time": execution_time,
+        "timestamp": start_time.isoformat(),
+        "tool_name": "get_external_ip",
+        "command_executed": f"get_external_ip(timeout={timeout})",
+        "stdout": external_ip,
+        "stderr": "",
+        "parsed_data": {
+            "external_ip": external_ip,
+            "service_used": service
+        },
+        "error_type": None,
+        "error_message": None,
+        "target": None,
+        "options_used": {"timeout": timeout}
+    }
+
+
+def _external_ip_not_found(service_errors: List[Tuple[str, Exception]], timeout: int,
+                           start_time: datetime) -> Dict[str, Any]:
+    """Report each service's error and build the get_external_ip result for total failure."""
+    for service, error_trying_to_get_external_ip in service_errors:
+        print(f"{Fore.RED}Error: Failed to get external IP from {service}: {error_trying_to_get_external_ip}{Style.RESET_ALL}")
+    
+    # If all services failed
+    print(f"{Fore.RED}Error: All external IP detection services failed.{Style.RESET_ALL}")
+    execution_time = (datetime.now() - start_time).total_seconds()
+    print(f"This might mean that our local network has no connectivity to the internet.")
+
+    return create_network_error(
+        ErrorCode.UNREACHABLE,
+        tool_name="get_external_ip",
+        execution_time=execution_time,
+        details={
+            "command": f"get_external_ip(timeout={timeout})",
+            "options": {"timeout": timeout}
+        },
+        message="All external IP detection services failed"
+    )
+
+
+async def async_get_external_ip(timeout: int = 10, silent: bool = False,
+                                use_cache: bool = True) -> Dict[str, Any]:
+    """
+    Async variant of get_external_ip().
+    
+    With aiohttp installed all services are raced on the caller's event loop
+    and the first valid answer wins; otherwise get_external_ip() runs in a
+    worker thread.
+    
+    Args:
+        timeout: Timeout in seconds for the request
+        silent: If True, suppress output except errors
+        use_cache: If True, reuse an answer from the last EXTERNAL_IP_TTL seconds
+        
+    Returns:
+        Standardized result dictionary
+    """
+    if not AIOHTTP_AVAILABLE:
+        return await asyncio.to_thread(get_external_ip, timeout, silent, use_cache)
+    
+    start_time = datetime.now()
+    
+    if use_cache:
+        cached = _cached_external_ip(timeout, start_time, silent)
+        if cached is not None:
+            return cached
+    
+    service_errors = []
+    
+    connector = aiohttp.TCPConnector(limit=10, ttl_dns_cache=300, family=socket.AF_INET)
+    async with aiohttp.ClientSession(connector=connector,
+                                     timeout=aiohttp.ClientTimeout(total=timeout)) as session:
+        tasks = [asyncio.create_task(_fetch_external_ip_async(session, service))
+                 for service in EXTERNAL_IP_SERVICES]
+        try:
+            for next_reply in asyncio.as_completed(tasks):
+                service, external_ip, service_error = await next_reply
+                if service_error is not None:
+                    service_errors.append((service, service_error))
+                elif external_ip is not None:
+                    return _external_ip_found(external_ip, service, timeout, start_time, silent)
+        finally:
+            # Drop the slower services before the session closes
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+    
+    return _external_ip_not_found(service_errors, timeout, start_time)
+
+
+async def _fetch_external_ip_async(session: "aiohttp.ClientSession",
+                                   service: str) -> Tuple[str, Optional[str], Optional[Exception]]:
+    """aiohttp version of _fetch_external_ip()."""
+    try:
+        async with session.get(service) as response:
+            if response.status != 200:
+                return service, None, None
+            external_ip = (await response.text()).strip()
+    except (aiohttp.ClientError, asyncio.TimeoutError) as error_trying_to_get_external_ip:
+        return service, None, error_trying_to_get_external_ip
+    
+    # Validate IP format
+    if is_valid_ip(external_ip):
+        return service, external_ip, None
+    return service, None, None
+
+
 def ping_host(target: str, count: int = 4, timeout: int = 5, silent: bool = False) -> Dict[str, Any]:
     """
     Ping a host to test connectivity and measure latency.
@@ -166,12 +368,24 @@ def ping_host(target: str, count: int = 4, timeout: int = 5, silent: bool = Fals
     start_time = datetime.now()
     
     try:
+        # Resolve through our cache so ping does no lookup of its own. Only
+        # an IPv4 first choice is substituted: ping picks the resolver's
+        # first address too, but some ping builds cannot take an IPv6
+        # literal, so for IPv6-first names ping keeps choosing for itself.
+        # Names that do not resolve are handed to ping unchanged to report
+        try:
+            address = _resolve_cached(target, socket.AF_UNSPEC)
+        except socket.gaierror:
+            address = target
+        if ":" in address:
+            address = target
+        
         # Build ping command based on platform
         system = platform.system()
         if system == "Windows":
-            cmd = ["ping", "-n", str(count), "-w", str(timeout * 1000), target]
+            cmd = ["ping", "-n", str(count), "-w", str(timeout * 1000), address]
         else:
-            cmd = ["ping", "-c", str(count), "-W", str(timeout), target]
+            cmd = ["ping", "-c", str(count), "-W", str(timeout), address]
         
         result = subprocess.run(
             cmd,
@@ -381,12 +595,14 @@ def test_port_connectivity(target: str, port: int, timeout: int = 5, silent: boo
     start_time = datetime.now()
     
     try:
+        address = _resolve_cached(target)
+        
         # Test TCP connection
         sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         sock.settimeout(timeout)
         
         connection_start = time.time()
-        result = sock.connect_ex((target, port))
+        result = sock.connect_ex((address, port))
         connection_time = (time.time() - connection_start) * 1000  # Convert to milliseconds
         
         sock.close()
@@ -499,23 +715,12 @@ def scan_local_network(network: str = None, timeout: int = 10, silent: bool = Fa
         
         base_ip = network.split("/")[0].rsplit(".", 1)[0]
         
-        active_hosts = []
-        
         # Ping common addresses (simplified scan)
         test_ips = [f"{base_ip}.{i}" for i in [1, 10, 20, 50, 100, 150, 200, 254]]
         
-        for ip in test_ips:
-            try:
-                # Quick ping test
-                ping_result = ping_host(ip, count=1, timeout=2, silent=True)
-                if ping_result["success"]:
-                    active_hosts.append({
-                        "ip": ip,
-                        "hostname": get_hostname_for_ip(ip),
-                        "response_time": ping_result["parsed_data"].get("avg_time", 0)
-                    })
-            except Exception:
-                continue
+        # Probe every address at once; map() keeps the results in address order
+        with ThreadPoolExecutor(max_workers=min(SCAN_MAX_PARALLEL_PINGS, len(test_ips))) as executor:
+            active_hosts = [host for host in executor.map(_probe_host, test_ips) if host]
         
         execution_time = (datetime.now() - start_time).total_seconds()
         
@@ -571,6 +776,110 @@ def scan_local_network(network: str = None, timeout: int = 10, silent: bool = Fa
 
 # Helper functions
 
+def _icmp_checksum(data: bytes) -> int:
+    """RFC 1071 Internet checksum."""
+    if len(data) % 2:
+        data += b"\0"
+    total = sum(struct.unpack(f"!{len(data) // 2}H", data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+
+def _open_icmp_socket() -> Tuple[socket.socket, bool]:
+    """
+    Open a socket for sending ICMP echo requests.
+    
+    Tries an unprivileged datagram ICMP socket first (Linux ping_group_range,
+    macOS), then a raw socket (root or CAP_NET_RAW).
+    
+    Returns:
+        Tuple of (socket, True if it is a raw socket)
+        
+    Raises:
+        OSError: If neither kind of socket is allowed
+    """
+    try:
+        return socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_ICMP), False
+    except OSError:
+        return socket.socket(socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_ICMP), True
+
+
+_ICMP_ECHO_REQUEST = 8
+_ICMP_ECHO_REPLY = 0
+_ICMP_SEQUENCE = itertools.count(1)
+
+
+def _icmp_ping(ip: str, timeout: float) -> Optional[float]:
+    """
+    Send one ICMP echo request to an IPv4 address without spawning ping.
+    
+    Args:
+        ip: Address to ping
+        timeout: Seconds to wait for the reply
+        
+    Returns:
+        Round-trip time in milliseconds, or None if no reply arrived in time
+        
+    Raises:
+        OSError: If ICMP sockets are not available to this process
+    """
+    sock, raw = _open_icmp_socket()
+    with sock:
+        # Datagram sockets have their identifier rewritten by the kernel, which
+        # also routes only our replies to us; raw sockets see every reply
+        identifier = os.getpid() & 0xFFFF
+        sequence = next(_ICMP_SEQUENCE) & 0xFFFF
+        header = struct.pack("!BBHHH", _ICMP_ECHO_REQUEST, 0, 0, identifier, sequence)
+        payload = b"instability"
+        packet = struct.pack("!BBHHH", _ICMP_ECHO_REQUEST, 0, _icmp_checksum(header + payload),
+                             identifier, sequence) + payload
+        
+        sent_at = time.perf_counter()
+        deadline = sent_at + timeout
+        sock.sendto(packet, (ip, 0))
+        
+        while True:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0 or not select.select([sock], [], [], remaining)[0]:
+                return None
+            data, (source, _) = sock.recvfrom(1024)
+            received_at = time.perf_counter()
+            
+            # Raw sockets (and macOS datagram sockets) include the IP header
+            if data and data[0] >> 4 == 4:
+                data = data[(data[0] & 0x0F) * 4:]
+            if len(data) < 8 or source != ip:
+                continue
+            
+            reply_type, _, _, reply_identifier, reply_sequence = struct.unpack("!BBHHH", data[:8])
+            if (reply_type == _ICMP_ECHO_REPLY and reply_sequence == sequence
+                    and (not raw or reply_identifier == identifier)):
+                return round((received_at - sent_at) * 1000, 3)
+
+
+def _probe_host(ip: str) -> Optional[Dict[str, Any]]:
+    """Ping one address for scan_local_network() and describe it if it answers."""
+    try:
+        # Send the echo ourselves where ICMP sockets are allowed; otherwise
+        # fall back to the ping command
+        try:
+            response_time = _icmp_ping(ip, timeout=2)
+        except OSError:
+            ping_result = ping_host(ip, count=1, timeout=2, silent=True)
+            response_time = ping_result["parsed_data"].get("avg_time", 0) if ping_result["success"] else None
+        
+        if response_time is not None:
+            return {
+                "ip": ip,
+                "hostname": get_hostname_for_ip(ip),
+                "response_time": response_time
+            }
+    except Exception:
+        pass
+    return None
+
+
 def is_valid_ip(ip: str) -> bool:
     """Validate IP address format."""
     try:
@@ -594,9 +903,9 @@ def parse_ping_output(output: str, system: str) -> Dict[str, Any]:
     try:
         if system == "Windows":
             # Parse Windows ping output
-            sent_match = re.search(r'Packets: Sent = (\d+)', output)
-            received_match = re.search(r'Received = (\d+)', output)
-            loss_match = re.search(r'Lost = \d+ \((\d+)% loss\)', output)
+            sent_match = _PING_WIN_SENT.search(output)
+            received_match = _PING_WIN_RECV.search(output)
+            loss_match = _PING_WIN_LOSS.search(output)
             
             if sent_match:
                 parsed["packets_sent"] = int(sent_match.group(1))
@@ -606,7 +915,7 @@ def parse_ping_output(output: str, system: str) -> Dict[str, Any]:
                 parsed["packet_loss"] = float(loss_match.group(1))
             
             # Extract timing information
-            time_matches = re.findall(r'time[<=](\d+)ms', output)
+            time_matches = _PING_WIN_TIME.findall(output)
             if time_matches:
                 times = [float(t) for t in time_matches]
                 parsed["min_time"] = min(times)
@@ -614,14 +923,14 @@ def parse_ping_output(output: str, system: str) -> Dict[str, Any]:
                 parsed["max_time"] = max(times)
         else:
             # Parse Unix/Linux/macOS ping output
-            stats_match = re.search(r'(\d+) packets transmitted, (\d+) received, (\d+)% packet loss', output)
+            stats_match = _PING_NIX_STATS.search(output)
             if stats_match:
                 parsed["packets_sent"] = int(stats_match.group(1))
                 parsed["packets_received"] = int(stats_match.group(2))
                 parsed["packet_loss"] = float(stats_match.group(3))
             
             # Extract timing information
-            timing_match = re.search(r'min/avg/max/stddev = ([\d.]+)/([\d.]+)/([\d.]+)/([\d.]+) ms', output)
+            timing_match = _PING_NIX_TIMING.search(output)
             if timing_match:
                 parsed["min_time"] = float(timing_match.group(1))
                 parsed["avg_time"] = float(timing_match.group(2))
@@ -637,6 +946,12 @@ def parse_traceroute_output(output: str, system: str) -> Dict[str, Any]:
     """Parse traceroute command output."""
     parsed = {"hops": []}
     
+    # Pick the platform's hop pattern and parser once, not per line
+    if system == "Windows":
+        hop_pattern, parse_hop = _TRACE_WIN, _parse_windows_hop
+    else:
+        hop_pattern, parse_hop = _TRACE_NIX, _parse_unix_hop
+    
     try:
         lines = output.split('\n')
         
@@ -645,47 +960,9 @@ def parse_traceroute_output(output: str, system: str) -> Dict[str, Any]:
             if not line:
                 continue
             
-            if system == "Windows":
-                # Parse Windows tracert output
-                match = re.match(r'\s*(\d+)\s+(\S+)\s+(\S+)\s+(\S+)\s+(\S+)', line)
-                if match:
-                    hop_num = int(match.group(1))
-                    times = [match.group(2), match.group(3), match.group(4)]
-                    hostname_ip = match.group(5)
-                    
-                    # Extract IP from hostname_ip
-                    ip_match = re.search(r'\[([\d.]+)\]', hostname_ip)
-                    ip = ip_match.group(1) if ip_match else hostname_ip
-                    hostname = hostname_ip.split('[')[0].strip() if '[' in hostname_ip else ip
-                    
-                    # Calculate average time
-                    try:
-                        numeric_times = [float(t.replace('ms', '')) for t in times if 'ms' in t]
-                        avg_time = sum(numeric_times) / len(numeric_times) if numeric_times else 0
-                    except Exception:
-                        avg_time = 0
-                    
-                    parsed["hops"].append({
-                        "hop_number": hop_num,
-                        "ip": ip,
-                        "hostname": hostname,
-                        "avg_time": avg_time
-                    })
-            else:
-                # Parse Unix/Linux/macOS traceroute output
-                match = re.match(r'\s*(\d+)\s+(\S+)\s+\(([\d.]+)\)\s+([\d.]+)', line)
-                if match:
-                    hop_num = int(match.group(1))
-                    hostname = match.group(2)
-                    ip = match.group(3)
-                    time_ms = float(match.group(4))
-                    
-                    parsed["hops"].append({
-                        "hop_number": hop_num,
-                        "ip": ip,
-                        "hostname": hostname if hostname != ip else None,
-                        "avg_time": time_ms
-                    })
+            match = hop_pattern.match(line)
+            if match:
+                parsed["hops"].append(parse_hop(match))
     
     except Exception:
         pass
@@ -693,6 +970,47 @@ def parse_traceroute_output(output: str, system: str) -> Dict[str, Any]:
     return parsed
 
 
+def _parse_windows_hop(match: re.Match) -> Dict[str, Any]:
+    """Build a hop entry from a tracert output line."""
+    hop_num = int(match.group(1))
+    times = [match.group(2), match.group(3), match.group(4)]
+    hostname_ip = match.group(5)
+    
+    # Extract IP from hostname_ip
+    ip_match = _TRACE_WIN_IP.search(hostname_ip)
+    ip = ip_match.group(1) if ip_match else hostname_ip
+    hostname = hostname_ip.split('[')[0].strip() if '[' in hostname_ip else ip
+    
+    # Calculate average time
+    try:
+        numeric_times = [float(t.replace('ms', '')) for t in times if 'ms' in t]
+        avg_time = sum(numeric_times) / len(numeric_times) if numeric_times else 0
+    except Exception:
+        avg_time = 0
+    
+    return {
+        "hop_number": hop_num,
+        "ip": ip,
+        "hostname": hostname,
+        "avg_time": avg_time
+    }
+
+
+def _parse_unix_hop(match: re.Match) -> Dict[str, Any]:
+    """Build a hop entry from a Unix/Linux/macOS traceroute output line."""
+    hop_num = int(match.group(1))
+    hostname = match.group(2)
+    ip = match.group(3)
+    time_ms = float(match.group(4))
+    
+    return {
+        "hop_number": hop_num,
+        "ip": ip,
+        "hostname": hostname if hostname != ip else None,
+        "avg_time": time_ms
+    }
+
+
 def detect_local_network() -> str:
     """Detect the local network range."""
     try:
@@ -711,11 +1029,19 @@ def detect_local_network() -> str:
 
 def get_hostname_for_ip(ip: str) -> Optional[str]:
     """Get hostname for an IP address."""
+    key = (_TARGET_KEY, "PTR", ip)
+    entry = _DNS_CACHE.get_entry(key)
+    if entry is not None:
+        return entry[0]
+    
     try:
         hostname = socket.gethostbyaddr(ip)[0]
-        return hostname if hostname != ip else None
+        hostname = hostname if hostname != ip else None
     except Exception:
-        return None
+        hostname = None
+    
+    _DNS_CACHE.put(key, hostname)
+    return hostname
 
 
 # Quick test function for development
@@ -756,10 +1082,11 @@ def get_module_tools():
             category=ToolCategory.NETWORK_DIAGNOSTICS,
             parameters={
                 "timeout": ParameterInfo(ParameterType.INTEGER, default=10, description="Timeout in seconds for the request"),
-                "silent": ParameterInfo(ParameterType.BOOLEAN, default=False, description="If True, suppress output except errors")
+                "silent": ParameterInfo(ParameterType.BOOLEAN, default=False, description="If True, suppress output except errors"),
+                "use_cache": ParameterInfo(ParameterType.BOOLEAN, default=True, description="If True, reuse an external IP found in the last few minutes")
             },
             modes=["manual", "chatbot"],
-            examples=["get_external_ip", "get_external_ip timeout=5"],
+            examples=["get_external_ip", "get_external_ip timeout=5", "get_external_ip use_cache=false"],
             function_ref=get_external_ip
         ),
         "ping_host": ToolMetadata(
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Tests for the pure parsing helpers and in-process caches
+
+These tests need no network access: they feed canned data to the parsers
+and drive the caches with stubbed probes.
+"""
+
+import struct
+import time
+
+import pytest
+
+from network import _ttl_cache, dns_diagnostics, ixp_diagnostics, layer2_diagnostics, layer3_diagnostics
+from memory import memory_manager
+
+
+IFCONFIG_OUTPUT = """\
+eth0: flags=4163<UP,BROADCAST,RUNNING,MULTICAST>  mtu 1500
+        inet 192.0.2.10  netmask 255.255.255.0  broadcast 192.0.2.255
+        ether 02:42:ac:11:00:02  txqueuelen 0  (Ethernet)
+lo: flags=73<UP,LOOPBACK,RUNNING>  mtu 65536
+        inet 127.0.0.1  netmask 255.0.0.0
+wlan0: flags=4098<BROADCAST,MULTICAST>  mtu 1500
+        ether 02:00:00:00:00:01  txqueuelen 1000  (Ethernet)
+"""
+
+PROC_NET_ROUTE = """\
+Iface\tDestination\tGateway \tFlags\tRefCnt\tUse\tMetric\tMask\t\tMTU\tWindow\tIRTT
+eth0\t0002000A\t00000000\t0001\t0\t0\t0\t00FFFFFF\t0\t0\t0
+eth0\t00000000\t0102000A\t0003\t0\t0\t0\t00000000\t0\t0\t0
+"""
+
+PROC_NET_ARP = """\
+IP address       HW type     Flags       HW address            Mask     Device
+10.0.2.1         0x1         0x2         52:54:00:12:35:02     *        eth0
+10.0.2.9         0x1         0x0         00:00:00:00:00:00     *        eth0
+"""
+
+DEFAULT_SCOPE = """\
+# Pentesting Target Scope
+
+*Last updated: 2026-01-01 00:00:00*
+*Scope type: local*
+
+## Current Engagement
+
+**Engagement Name:** Default Local Assessment
+
+#### Specific Targets
+*Targets will be identified during network discovery*
+
+### Secondary Network
+*No secondary networks defined*
+"""
+
+
+def _rtattr(attr_type, payload):
+    """Encode one netlink rtattr, padded to a 4-byte boundary."""
+    length = 4 + len(payload)
+    return struct.pack("=HH", length, attr_type) + payload + b"\0" * (-length % 4)
+
+
+def test_parse_rtattrs():
+    """Attributes are split on their padded lengths and the first of a type wins"""
+    data = b"HEAD" + _rtattr(3, b"eth0\0") + _rtattr(1, b"\x02\x42") + _rtattr(3, b"dup\0")
+    assert layer2_diagnostics._parse_rtattrs(data, 4) == {3: b"eth0\0", 1: b"\x02\x42"}
+
+
+def test_parse_rtattrs_stops_on_bad_length():
+    """A zero-length attribute ends parsing instead of looping forever"""
+    data = _rtattr(1, b"ab") + struct.pack("=HH", 0, 2)
+    assert layer2_diagnostics._parse_rtattrs(data, 0) == {1: b"ab"}
+
+
+def test_icmp_checksum():
+    """The checksum of an echo request matches RFC 1071 and verifies to zero"""
+    header = struct.pack("!BBHHH", 8, 0, 0, 1, 1)
+    checksum = layer3_diagnostics._icmp_checksum(header)
+    assert checksum == 0xF7FD
+    packet = struct.pack("!BBHHH", 8, 0, checksum, 1, 1)
+    assert layer3_diagnostics._icmp_checksum(packet) == 0
+    # Odd lengths are padded with a zero byte
+    assert layer3_diagnostics._icmp_checksum(b"\x01") == layer3_diagnostics._icmp_checksum(b"\x01\x00")
+
+
+def test_parse_unix_interfaces():
+    """Loopback and address-less interfaces are skipped"""
+    interfaces = layer2_diagnostics.parse_unix_interfaces(IFCONFIG_OUTPUT)
+    assert interfaces == [
+        {"name": "eth0", "ip": "192.0.2.10", "status": "up", "mac": "02:42:ac:11:00:02"}
+    ]
+
+
+def test_parse_unix_interfaces_returns_fresh_copies():
+    """Callers cannot corrupt the cached parse by mutating the result"""
+    first = layer2_diagnostics.parse_unix_interfaces(IFCONFIG_OUTPUT)
+    first[0]["ip"] = "198.51.100.1"
+    second = layer2_diagnostics.parse_unix_interfaces(IFCONFIG_OUTPUT)
+    assert second[0]["ip"] == "192.0.2.10"
+
+
+def test_read_default_route_linux(tmp_path, monkeypatch):
+    """The default route row with the gateway flag gives the interface and next hop"""
+    route_file = tmp_path / "route"
+    route_file.write_text(PROC_NET_ROUTE)
+    monkeypatch.setattr(layer2_diagnostics, "_PROC_NET_ROUTE", str(route_file))
+    assert layer2_diagnostics._read_default_route_linux() == ("eth0", "10.0.2.1")
+
+
+def test_read_arp_table_linux(tmp_path, monkeypatch):
+    """Incomplete ARP entries are left out"""
+    arp_file = tmp_path / "arp"
+    arp_file.write_text(PROC_NET_ARP)
+    monkeypatch.setattr(layer2_diagnostics, "_PROC_NET_ARP", str(arp_file))
+    assert layer2_diagnostics._read_arp_table_linux() == {"10.0.2.1": "52:54:00:12:35:02"}
+
+
+def _soa_response(name):
+    """Build a DNS response carrying an SOA with TTL 300 and minimum 60."""
+    import dns.message
+    import dns.rrset
+
+    response = dns.message.make_response(dns.message.make_query(name, "A"))
+    response.authority.append(
+        dns.rrset.from_text("example.com.", 300, "IN", "SOA", "ns1.example.com. hostmaster.example.com. 1 7200 900 1209600 60")
+    )
+    return response
+
+
+def test_negative_ttl():
+    """Negative answers are cached for min(SOA TTL, SOA minimum)"""
+    dns_resolver = pytest.importorskip("dns.resolver")
+    import dns.name
+
+    name = dns.name.from_text("missing.example.com.")
+    nxdomain = dns_resolver.NXDOMAIN(qnames=[name], responses={name: _soa_response(name)})
+    assert dns_diagnostics._negative_ttl(nxdomain) == 60
+
+    no_answer = dns_resolver.NoAnswer(response=_soa_response(name))
+    assert dns_diagnostics._negative_ttl(no_answer) == 60
+
+    assert dns_diagnostics._negative_ttl(dns_resolver.NoAnswer()) is None
+
+
+def test_dns_cache_expiry(monkeypatch):
+    """Entries are returned as copies until their TTL passes, then dropped"""
+    now = [1000.0]
+    monkeypatch.setattr(_ttl_cache.time, "monotonic", lambda: now[0])
+    cache = dns_diagnostics._DNS_CACHE
+    cache.clear()
+    key = ("example.com", "A", "system")
+
+    cache.put(key, {"addresses": ["192.0.2.1"]}, ttl=30)
+    cached = cache.get(key)
+    assert cached == {"addresses": ["192.0.2.1"]}
+    cached["addresses"].append("192.0.2.2")
+    now[0] += 10
+    assert cache.get_entry(key) == ({"addresses": ["192.0.2.1"]}, 10)
+
+    now[0] += 20
+    assert cache.get(key) is None
+    assert key not in cache
+
+    # Long advertised TTLs are capped at the configured cache TTL
+    cache.put(key, {"addresses": ["192.0.2.3"]}, ttl=86400)
+    now[0] += dns_diagnostics.DNS_CACHE_TTL
+    assert cache.get(key) is None
+
+    # A zero TTL means the answer must not be cached at all
+    cache.put(key, {"addresses": []}, ttl=0)
+    assert cache.get(key) is None
+
+
+def test_raced_and_system_answers_are_cached_apart(monkeypatch):
+    """A public resolver's NXDOMAIN does not hide a split-horizon name, and hits are marked"""
+    monkeypatch.setattr(dns_diagnostics, "DNSPYTHON_AVAILABLE", True)
+    monkeypatch.setattr(dns_diagnostics, "_resolve_parallel", lambda hostname, rtype: ([], 86400))
+    monkeypatch.setitem(dns_diagnostics._RESOLVE_HANDLERS, "A", lambda hostname, rtype: (["10.1.2.3"], None))
+    dns_diagnostics.clear_dns_cache()
+
+    raced = dns_diagnostics.resolve_hostname("intranet.corp", silent=True, parallel=True)
+    assert raced["success"] is False
+    system = dns_diagnostics.resolve_hostname("intranet.corp", silent=True)
+    assert system["resolved_ips"] == ["10.1.2.3"]
+    assert system["cached"] is False
+
+    again = dns_diagnostics.resolve_hostname("intranet.corp", silent=True)
+    assert again["cached"] is True
+    assert "cache_age_seconds" in again
+    bypass = dns_diagnostics.resolve_hostname("intranet.corp", silent=True, use_cache=False)
+    assert bypass["cached"] is False
+    dns_diagnostics.clear_dns_cache()
+
+
+def test_layer3_target_lookups_share_the_dns_cache(monkeypatch):
+    """Reverse lookup misses are cached until clear_dns_cache()"""
+    lookups = []
+
+    def fake_gethostbyaddr(ip):
+        lookups.append(ip)
+        raise OSError("no PTR record")
+
+    monkeypatch.setattr(layer3_diagnostics.socket, "gethostbyaddr", fake_gethostbyaddr)
+    dns_diagnostics.clear_dns_cache()
+
+    assert layer3_diagnostics.get_hostname_for_ip("192.0.2.55") is None
+    assert layer3_diagnostics.get_hostname_for_ip("192.0.2.55") is None
+    assert lookups == ["192.0.2.55"]
+
+    dns_diagnostics.clear_dns_cache()
+    layer3_diagnostics.get_hostname_for_ip("192.0.2.55")
+    assert lookups == ["192.0.2.55", "192.0.2.55"]
+    dns_diagnostics.clear_dns_cache()
+
+
+def test_batch_updates_write_each_file_once(monkeypatch):
+    """Updates inside a batch, including nested ones, are merged into one write"""
+    writes = []
+    monkeypatch.setattr(memory_manager, "_update_markdown_file",
+                        lambda path, updates, *args: writes.append((path, updates)))
+
+    with memory_manager.batch_updates():
+        memory_manager.update_network_state({"system_info": {"os": "Linux"}})
+        with memory_manager.batch_updates():
+            memory_manager.update_network_state({"system_info": {"hostname": "lab"}})
+        memory_manager.update_network_state({"external_ip": "203.0.113.5"})
+        assert writes == []
+
+    assert writes == [(
+        memory_manager.NETWORK_STATE_FILE,
+        {"system_info": {"os": "Linux", "hostname": "lab"}, "external_ip": "203.0.113.5"}
+    )]
+
+
+def test_update_target_scope_rewrites_scope_sections(tmp_path, monkeypatch):
+    """Scope type, engagement name and targets all reach the markdown file"""
+    scope_file = tmp_path / "target_scope.md"
+    scope_file.write_text(DEFAULT_SCOPE)
+    monkeypatch.setattr(memory_manager, "TARGET_SCOPE_FILE", scope_file)
+
+    memory_manager.update_target_scope({
+        "scope_type": "external",
+        "engagement_name": "Lab audit",
+        "targets": [{"ip": "192.0.2.7", "hostname": "printer", "ports": [80, 443]}]
+    })
+
+    content = scope_file.read_text()
+    assert "*Scope type: external*" in content
+    assert "**Engagement Name:** Lab audit" in content
+    assert "1. **192.0.2.7** - printer\n   - Ports: 80, 443\n\n### Secondary Network" in content
+    assert "*Targets will be identified during network discovery*" not in content
+    parsed = memory_manager.parse_target_scope_markdown(content)
+    assert (parsed["scope_type"], parsed["engagement_name"]) == ("external", "Lab audit")
+
+
+@pytest.fixture
+def session_cache(monkeypatch):
+    """An in-memory session cache that is never written to disk."""
+    cache = {"recent_tool_results": {}}
+    monkeypatch.setattr(memory_manager, "_session_cache", cache)
+    monkeypatch.setattr(memory_manager, "save_session_cache", lambda updated: None)
+    monkeypatch.setattr(memory_manager, "_pending_evictions", set())
+    return cache
+
+
+def test_tool_result_cache_evicts_least_recently_used(session_cache, monkeypatch):
+    """Reading an entry protects it; the oldest unread entry is evicted"""
+    monkeypatch.setitem(memory_manager.CACHE_CONFIG, "max_cached_tool_results", 2)
+
+    memory_manager.cache_tool_result("ping", {"success": True, "parsed_data": {"loss": 0}})
+    memory_manager.cache_tool_result("traceroute", {"success": True, "parsed_data": {}})
+    assert memory_manager.get_cached_result("ping") is not None
+    memory_manager.cache_tool_result("dns", {"success": True, "parsed_data": {}})
+
+    assert list(session_cache["recent_tool_results"]) == ["ping", "dns"]
+
+
+def test_tool_result_cache_truncates_large_entries(session_cache, monkeypatch):
+    """Oversized summaries are replaced by a small marker"""
+    monkeypatch.setitem(memory_manager.CACHE_CONFIG, "max_cache_entry_bytes", 256)
+
+    memory_manager.cache_tool_result("nmap", {"success": True, "parsed_data": {"out": "x" * 1024}})
+
+    summary = session_cache["recent_tool_results"]["nmap"]["summary"]
+    assert summary["_truncated"] is True
+    assert summary["size"] > 256
+
+
+def test_ixp_stale_result_is_served_and_refreshed(monkeypatch):
+    """A result just past its TTL is returned flagged stale while a refresh runs"""
+    probes = []
+
+    def fake_checks(silent, *options):
+        probes.append(options)
+        return {"success": True, "probe": len(probes)}
+
+    monkeypatch.setattr(ixp_diagnostics, "_run_ixp_checks", fake_checks)
+    monkeypatch.setattr(ixp_diagnostics, "IXP_RESULT_MAX_STALE", 5)
+    ixp_diagnostics.clear_ixp_result_cache()
+
+    fresh = ixp_diagnostics.monitor_ixp_connectivity(silent=True, cache_ttl=30)
+    assert fresh["cached"] is False and fresh["stale"] is False
+
+    key = next(iter(ixp_diagnostics._IXP_RESULT_CACHE))
+    ixp_diagnostics._IXP_RESULT_CACHE[key] = (time.monotonic() - 32, {"success": True, "probe": 1})
+
+    stale = ixp_diagnostics.monitor_ixp_connectivity(silent=True, cache_ttl=30)
+    assert stale["cached"] is True and stale["stale"] is True
+    assert stale["probe"] == 1
+    assert stale["cache_age_seconds"] >= 32
+
+    # The background refresh replaces the entry with a new probe
+    deadline = time.monotonic() + 5
+    while key in ixp_diagnostics._IXP_REFRESHING and time.monotonic() < deadline:
+        time.sleep(0.01)
+    refreshed = ixp_diagnostics.monitor_ixp_connectivity(silent=True, cache_ttl=30)
+    assert refreshed["cached"] is True and refreshed["stale"] is False
+    assert refreshed["probe"] == 2
+
+    # Past the stale window the caller waits for a new probe
+    ixp_diagnostics._IXP_RESULT_CACHE[key] = (time.monotonic() - 40, {"success": True, "probe": 2})
+    expired = ixp_diagnostics.monitor_ixp_connectivity(silent=True, cache_ttl=30)
+    assert expired["cached"] is False
+    assert expired["probe"] == 3
+    ixp_diagnostics.clear_ixp_result_cache()